@@ -0,0 +1,35 @@
+"""ETag / If-None-Match helpers for JSON endpoints that clients poll."""
+
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag (quoted) derived from the encoded response body."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def conditional_json_response(
+    request: Request,
+    body: bytes,
+    max_age: int | None,
+    etag: str | None = None,
+    public: bool = False,
+) -> Response:
+    """Return *body* as JSON with ETag/Cache-Control, or 304 if the client's copy is current.
+
+    A *max_age* of ``None`` sends ``no-cache`` so clients revalidate every time.
+    """
+    etag = etag or make_etag(body)
+    freshness = "no-cache" if max_age is None else f"max-age={max_age}"
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"{'public' if public else 'private'}, {freshness}",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,35 @@
+"""Readiness of the FOLIO embedding index built in the background at startup."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+# How long a request that needs the index waits for startup indexing before
+# continuing without it (the pipeline loads FOLIO lazily anyway).
+EMBEDDING_READY_TIMEOUT_SECONDS = 30.0
+
+
+def embeddings_ready(app: FastAPI) -> bool:
+    """True once startup indexing has finished (or was never started)."""
+    event: asyncio.Event | None = getattr(app.state, "embedding_ready", None)
+    return event is None or event.is_set()
+
+
+async def wait_for_embeddings(
+    app: FastAPI, timeout: float = EMBEDDING_READY_TIMEOUT_SECONDS,
+) -> bool:
+    """Wait for startup indexing to finish; returns False if *timeout* elapses first."""
+    event: asyncio.Event | None = getattr(app.state, "embedding_ready", None)
+    if event is None or event.is_set():
+        return True
+    try:
+        await asyncio.wait_for(event.wait(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning("FOLIO embedding index not ready after %.0fs; continuing without it", timeout)
+        return False
+    return True
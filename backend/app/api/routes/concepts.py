@@ -2,56 +2,100 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 
+import orjson
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
+from app.services.cache import LRUTTLCache
+from app.services.folio.concept_detail import build_entity_graph, lookup_concept_detail_dict
+from app.services.folio.folio_service import FolioService
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/concepts", tags=["concepts"])
 
 MAX_BATCH_SIZE = 100
+BATCH_CONCURRENCY = 16  # cap on lookups in flight per batch request
+
+CACHE_TTL_SECONDS = 3600
+
+# Response cache for the graph endpoint.  FOLIO data only changes on reload,
+# so entries are dumped dicts keyed by request parameters and the cache is
+# dropped whenever the underlying FOLIO instance is swapped.  Concept details
+# are memoized by lookup_concept_detail_dict() itself.
+_graph_cache = LRUTTLCache(max_size=512, ttl_seconds=CACHE_TTL_SECONDS)
+_cached_folio = None
 
 
 def _get_folio():
-    """Get the raw FOLIO instance."""
-    from app.services.folio.folio_service import FolioService
-    return FolioService.get_instance()._get_folio()
+    """Get the raw FOLIO instance, invalidating the graph cache on reload."""
+    global _cached_folio
+    folio = FolioService.get_instance()._get_folio()
+    if folio is not _cached_folio:
+        _graph_cache.clear()
+        _cached_folio = folio
+    return folio
 
 
 class BatchRequest(BaseModel):
     iri_hashes: list[str] = Field(..., max_length=MAX_BATCH_SIZE)
 
 
+def _json_response(data: dict) -> Response:
+    """Serialize an already-dumped payload once with orjson, bypassing FastAPI's encoder."""
+    return Response(content=orjson.dumps(data), media_type="application/json")
+
+
 @router.post("/batch")
-async def get_concepts_batch(body: BatchRequest) -> dict:
+async def get_concepts_batch(body: BatchRequest) -> StreamingResponse:
     """Look up multiple FOLIO concepts by IRI hash in one call.
 
     Returns a mapping of iri_hash → detail for each found concept.
-    Unknown hashes are silently omitted.
+    Unknown hashes are silently omitted.  Lookups are synchronous ontology
+    walks, so they run concurrently in worker threads to keep the event
+    loop free, and the JSON object is streamed entry by entry (in request
+    order) instead of being assembled in memory first.
     """
-    from app.services.folio.concept_detail import lookup_concept_detail
-
     folio = _get_folio()
-    results: dict[str, dict] = {}
-    for iri_hash in body.iri_hashes[:MAX_BATCH_SIZE]:
-        detail = lookup_concept_detail(folio, iri_hash)
-        if detail is not None:
-            results[iri_hash] = detail.model_dump()
-    return results
+    iri_hashes = list(dict.fromkeys(body.iri_hashes[:MAX_BATCH_SIZE]))
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def _lookup(iri_hash: str) -> dict | None:
+        async with semaphore:
+            return await asyncio.to_thread(lookup_concept_detail_dict, folio, iri_hash)
+
+    async def _stream() -> AsyncIterator[bytes]:
+        tasks = [asyncio.ensure_future(_lookup(h)) for h in iri_hashes]
+        try:
+            yield b"{"
+            separator = b""
+            for iri_hash, task in zip(iri_hashes, tasks):
+                detail = await task
+                if detail is None:
+                    continue
+                yield separator + orjson.dumps(iri_hash) + b":" + orjson.dumps(detail)
+                separator = b","
+            yield b"}"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(_stream(), media_type="application/json")
 
 
 @router.get("/{iri_hash}")
-async def get_concept_detail(iri_hash: str) -> dict:
+async def get_concept_detail(iri_hash: str) -> Response:
     """Look up a FOLIO concept by IRI hash with full detail."""
-    from app.services.folio.concept_detail import lookup_concept_detail
-
     folio = _get_folio()
-    detail = lookup_concept_detail(folio, iri_hash)
+    detail = lookup_concept_detail_dict(folio, iri_hash)
     if detail is None:
         raise HTTPException(status_code=404, detail=f"Concept not found: {iri_hash}")
-    return detail.model_dump()
+    return _json_response(detail)
 
 
 @router.get("/{iri_hash}/graph")
@@ -61,11 +105,13 @@ async def get_concept_graph(
     descendants_depth: int = 2,
     max_nodes: int = 200,
     include_see_also: bool = True,
-) -> dict:
+) -> Response:
     """Build an entity graph around a FOLIO concept via BFS."""
-    from app.services.folio.concept_detail import build_entity_graph
-
     folio = _get_folio()
+    cache_key = f"{iri_hash}:{ancestors_depth}:{descendants_depth}:{max_nodes}:{int(include_see_also)}"
+    cached = _graph_cache.get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
     graph = build_entity_graph(
         folio, iri_hash,
         ancestors_depth=ancestors_depth,
@@ -75,4 +121,6 @@ async def get_concept_graph(
     )
     if graph is None:
         raise HTTPException(status_code=404, detail=f"Concept not found: {iri_hash}")
-    return graph.model_dump()
+    result = graph.model_dump()
+    _graph_cache.set(cache_key, result)
+    return _json_response(result)
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import sys
+import time
+from datetime import datetime, timezone
+from typing import AsyncIterator
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
 
-from app.models.document import DocumentInput
+from app.api.http_cache import conditional_json_response, make_etag
+from app.api.readiness import wait_for_embeddings
+from app.api.routes.feedback import remove_feedback_for_annotation, upsert_feedback_for_annotation
+from app.api.routes.settings import _get_api_key_for_provider
+from app.config import settings
+from app.models.annotation import STAGE_EVENT_LIST_ADAPTER, StageEvent
+from app.models.document import DocumentFormat, DocumentInput
 from app.models.job import Job, JobStatus
-from app.pipeline.orchestrator import PipelineOrchestrator, TaskLLMs
+from app.pipeline.job_queue import JobQueue, JobQueueFull
+from app.pipeline.orchestrator import PipelineOrchestrator, TaskLLMs, get_pipeline
+from app.services.folio.folio_service import FolioService
 from app.services.ingestion.registry import detect_format
+from app.services.llm.registry import REQUIRES_API_KEY, get_shared_provider, resolve_provider_type
 from app.services.streaming.sse import job_event_stream
 from app.storage.job_store import JobStore
 
@@ -19,12 +35,16 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/enrich", tags=["enrich"])
 
-_job_store = JobStore()
+_job_store = JobStore.get_instance()
+
+BRANCHES_MAX_AGE_SECONDS = 300
+# Annotations serialized per chunk of the NDJSON annotation stream
+ANNOTATION_STREAM_BATCH_SIZE = 500
 
 
 class EnrichRequest(BaseModel):
     content: str
-    format: str | None = None
+    format: DocumentFormat | None = None
     filename: str | None = None
     # Optional per-request LLM configuration
     llm_provider: str | None = None
@@ -32,23 +52,30 @@ class EnrichRequest(BaseModel):
     api_key: str | None = None
 
 
+# (epoch second, ISO string) of the last timestamp handed out
+_clock_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO string, at second resolution.
+
+    Dismissal timestamps only need second precision, so the formatted string is
+    reused for every mutation within the same second.
+    """
+    global _clock_cache
+    sec = int(time.time())
+    if _clock_cache[0] != sec:
+        _clock_cache = (sec, datetime.fromtimestamp(sec, timezone.utc).isoformat())
+    return _clock_cache[1]
+
+
 def _get_llm_for_request(req: EnrichRequest):
     """Create an LLM provider from request params or fall back to settings."""
-    from app.config import settings
-    from app.services.llm.registry import REQUIRES_API_KEY, get_provider
-    from app.api.routes.settings import _get_api_key_for_provider
-    from app.models.llm_models import LLMProviderType
-
     provider_name = req.llm_provider or settings.llm_provider
     model = req.llm_model or settings.llm_model
 
-    # Normalize provider name to enum
-    try:
-        normalized = provider_name.replace("-", "_")
-        if normalized == "lm_studio":
-            normalized = "lmstudio"
-        provider_type = LLMProviderType(normalized)
-    except ValueError:
+    provider_type = resolve_provider_type(provider_name)
+    if provider_type is None:
         logger.warning("Unknown provider %s — LLM stages will be skipped", provider_name)
         return None
 
@@ -59,69 +86,105 @@ def _get_llm_for_request(req: EnrichRequest):
         return None
 
     try:
-        return get_provider(provider_type, api_key=api_key, model=model)
+        return get_shared_provider(provider_type, model, api_key)
     except Exception:
         logger.warning("Failed to create LLM provider %s", provider_name, exc_info=True)
         return None
 
 
-@router.post("", status_code=202)
-async def create_enrichment(req: EnrichRequest) -> dict:
-    # Check concurrent job limit
-    from app.config import settings as app_settings
-    active = await _job_store.count_active()
-    if active >= app_settings.max_concurrent_jobs:
-        raise HTTPException(
-            status_code=429,
-            detail=f"Too many concurrent jobs ({active}/{app_settings.max_concurrent_jobs}). Try again later.",
-        )
+def _build_document(req: EnrichRequest) -> DocumentInput:
+    fmt = req.format or detect_format(req.filename, req.content)
+    return DocumentInput(content=req.content, format=fmt, filename=req.filename)
 
-    fmt = req.format or detect_format(req.filename, req.content).value
-    doc = DocumentInput(content=req.content, format=fmt, filename=req.filename)
+
+@router.post("", status_code=202)
+async def create_enrichment(req: EnrichRequest, request: Request) -> dict:
+    # The pipeline matches against the FOLIO index built at startup
+    await wait_for_embeddings(request.app)
+    # Sniffing and validating multi-MB content is CPU work; keep it off the event loop
+    doc = await asyncio.to_thread(_build_document, req)
     job = Job(input=doc)
     await _job_store.save(job)
 
     # Build pipeline with per-task LLMs (task-specific overrides > request > global)
     fallback_llm = _get_llm_for_request(req)
     task_llms = TaskLLMs.from_settings(fallback=fallback_llm)
-    orchestrator = PipelineOrchestrator(_job_store, llm=fallback_llm, task_llms=task_llms)
+    config, stages = get_pipeline(fallback_llm, task_llms)
+    orchestrator = PipelineOrchestrator(
+        _job_store, stages=stages, llm=fallback_llm, task_llms=task_llms, config=config,
+    )
 
-    # Run pipeline in background
-    asyncio.create_task(orchestrator.run(job))
+    # Run pipeline in background on the bounded worker pool
+    try:
+        JobQueue.get_instance().submit(orchestrator, job)
+    except JobQueueFull as e:
+        await _job_store.delete(job.id)
+        raise HTTPException(status_code=429, detail=f"{e}. Try again later.")
     return {"job_id": str(job.id), "status": job.status.value}
 
 
+@functools.lru_cache(maxsize=1)
+def _branches_payload(folio: object) -> tuple[bytes, str]:
+    """Encoded branches body and its ETag, memoized per loaded FOLIO instance."""
+    branches = FolioService.get_instance().get_all_branches()
+    body = orjson.dumps({"branches": branches, "total": len(branches)})
+    return body, make_etag(body)
+
+
 @router.get("/branches")
-async def list_branches() -> dict:
+async def list_branches(request: Request) -> Response:
     """Return all non-excluded FOLIO branches with colors and concept counts."""
-    from app.services.folio.folio_service import FolioService
+    folio = FolioService.get_instance()._get_folio()
+    body, etag = _branches_payload(folio)
+    return conditional_json_response(
+        request, body, BRANCHES_MAX_AGE_SECONDS, etag=etag, public=True,
+    )
+
+
+@router.get("/{job_id}", response_model=Job)
+async def get_enrichment(job_id: UUID) -> Response:
+    job = await _job_store.load(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    # Serialize once via pydantic-core instead of re-validating against response_model
+    return Response(content=job.model_dump_json(), media_type="application/json")
 
-    service = FolioService.get_instance()
-    branches = service.get_all_branches()
-    return {"branches": branches, "total": len(branches)}
 
+async def _stream_annotations(annotations: list) -> AsyncIterator[str]:
+    for i in range(0, len(annotations), ANNOTATION_STREAM_BATCH_SIZE):
+        batch = annotations[i:i + ANNOTATION_STREAM_BATCH_SIZE]
+        yield "".join(a.model_dump_json() + "\n" for a in batch)
 
-@router.get("/{job_id}")
-async def get_enrichment(job_id: UUID) -> Job:
+
+@router.get("/{job_id}/annotations")
+async def stream_annotations(job_id: UUID) -> StreamingResponse:
+    """Annotations as NDJSON, one per line, serialized a batch at a time."""
     job = await _job_store.load(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job
+    # Snapshot the list so a still-running pipeline can append meanwhile
+    return StreamingResponse(
+        _stream_annotations(list(job.result.annotations)),
+        media_type="application/x-ndjson",
+    )
 
 
 @router.get("/{job_id}/annotations/{annotation_id}/lineage")
-async def get_annotation_lineage(job_id: UUID, annotation_id: str) -> dict:
+async def get_annotation_lineage(job_id: UUID, annotation_id: str) -> Response:
     job = await _job_store.load(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    for ann in job.result.annotations:
-        if ann.id == annotation_id:
-            return {
-                "annotation_id": annotation_id,
-                "lineage": [e.model_dump() for e in ann.lineage],
-                "sentence_text": ann.span.sentence_text,
-            }
-    raise HTTPException(status_code=404, detail="Annotation not found")
+    ann = job.result.get_annotation(annotation_id)
+    if ann is None:
+        raise HTTPException(status_code=404, detail="Annotation not found")
+    return Response(
+        content=orjson.dumps({
+            "annotation_id": annotation_id,
+            "lineage": STAGE_EVENT_LIST_ADAPTER.dump_python(ann.lineage),
+            "sentence_text": ann.span.sentence_text,
+        }),
+        media_type="application/json",
+    )
 
 
 class PromoteRequest(BaseModel):
@@ -137,59 +200,54 @@ class CascadePromoteRequest(BaseModel):
 @router.post("/{job_id}/annotations/{annotation_id}/promote")
 async def promote_concept(job_id: UUID, annotation_id: str, req: PromoteRequest) -> dict:
     """Promote a backup concept to primary (index 0)."""
-    job = await _job_store.load(job_id)
+    job = await _job_store.load_for_update(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    for ann in job.result.annotations:
-        if ann.id == annotation_id:
-            if req.concept_index < 0 or req.concept_index >= len(ann.concepts):
-                raise HTTPException(status_code=400, detail="Invalid concept_index")
-            if req.concept_index == 0:
-                return {"status": "already_primary"}
-
-            # Swap: move selected to position 0
-            promoted = ann.concepts.pop(req.concept_index)
-            old_primary = ann.concepts[0]
-            promoted.state = "confirmed"
-            old_primary.state = "backup"
-            ann.concepts[0] = promoted
-            ann.concepts.insert(req.concept_index, old_primary)
-
-            # Record lineage event
-            from app.models.annotation import StageEvent
-            ann.lineage.append(StageEvent(
-                stage="user",
-                action="user_promotion",
-                detail=f"Promoted '{promoted.folio_label}' over '{old_primary.folio_label}'",
-            ))
-
-            await _job_store.save(job)
-            return {
-                "status": "promoted",
-                "annotation_id": annotation_id,
-                "promoted_iri": promoted.folio_iri,
-                "demoted_iri": old_primary.folio_iri,
-            }
-
-    raise HTTPException(status_code=404, detail="Annotation not found")
+    ann = job.result.annotation_for_update(annotation_id)
+    if ann is None:
+        raise HTTPException(status_code=404, detail="Annotation not found")
+
+    if req.concept_index < 0 or req.concept_index >= len(ann.concepts):
+        raise HTTPException(status_code=400, detail="Invalid concept_index")
+    if req.concept_index == 0:
+        return {"status": "already_primary"}
+
+    # Swap: move selected to position 0
+    idx = req.concept_index
+    ann.concepts[0], ann.concepts[idx] = ann.concepts[idx], ann.concepts[0]
+    promoted, old_primary = ann.concepts[0], ann.concepts[idx]
+    promoted.state = "confirmed"
+    old_primary.state = "backup"
+    job.result.update_primary_iri(ann, old_primary.folio_iri)
+
+    # Record lineage event
+    ann.lineage.append(StageEvent(
+        stage="user",
+        action="user_promotion",
+        detail=f"Promoted '{promoted.folio_label}' over '{old_primary.folio_label}'",
+    ))
+
+    _job_store.save_deferred(job)
+    return {
+        "status": "promoted",
+        "annotation_id": annotation_id,
+        "promoted_iri": promoted.folio_iri,
+        "demoted_iri": old_primary.folio_iri,
+    }
 
 
 @router.post("/{job_id}/cascade-promote")
 async def cascade_promote(job_id: UUID, req: CascadePromoteRequest) -> dict:
     """Promote a backup concept across all annotations sharing the old primary IRI."""
-    job = await _job_store.load(job_id)
+    job = await _job_store.load_for_update(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    from app.models.annotation import StageEvent
-
-    id_filter = set(req.annotation_ids) if req.annotation_ids is not None else None
+    id_filter = {sys.intern(i) for i in req.annotation_ids} if req.annotation_ids is not None else None
 
     updated = 0
-    for ann in job.result.annotations:
-        if not ann.concepts or ann.concepts[0].folio_iri != req.old_iri:
-            continue
+    for ann in job.result.annotations_by_primary_iri(req.old_iri):
         if id_filter is not None and ann.id not in id_filter:
             continue
         # Find backup with new_iri
@@ -201,12 +259,12 @@ async def cascade_promote(job_id: UUID, req: CascadePromoteRequest) -> dict:
         if backup_idx is None:
             continue
 
-        promoted = ann.concepts.pop(backup_idx)
-        old_primary = ann.concepts[0]
+        ann = job.result.annotation_for_update(ann.id)
+        ann.concepts[0], ann.concepts[backup_idx] = ann.concepts[backup_idx], ann.concepts[0]
+        promoted, old_primary = ann.concepts[0], ann.concepts[backup_idx]
         promoted.state = "confirmed"
         old_primary.state = "backup"
-        ann.concepts[0] = promoted
-        ann.concepts.insert(backup_idx, old_primary)
+        job.result.update_primary_iri(ann, req.old_iri)
 
         ann.lineage.append(StageEvent(
             stage="user",
@@ -216,7 +274,7 @@ async def cascade_promote(job_id: UUID, req: CascadePromoteRequest) -> dict:
         updated += 1
 
     if updated > 0:
-        await _job_store.save(job)
+        _job_store.save_deferred(job)
 
     return {"status": "cascade_complete", "updated_count": updated}
 
@@ -229,110 +287,95 @@ class BulkRejectRequest(BaseModel):
 @router.post("/{job_id}/annotations/{annotation_id}/reject")
 async def reject_annotation(job_id: UUID, annotation_id: str) -> dict:
     """Dismiss an annotation as a false positive (set state to rejected)."""
-    from datetime import datetime, timezone
-    from app.models.annotation import StageEvent
-    from app.api.routes.feedback import upsert_feedback_for_annotation
-
-    job = await _job_store.load(job_id)
+    job = await _job_store.load_for_update(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    for ann in job.result.annotations:
-        if ann.id == annotation_id:
-            if ann.state == "rejected":
-                return {"status": "already_rejected"}
-            prev_state = ann.state
-            ann.state = "rejected"
-            ann.dismissed_at = datetime.now(timezone.utc).isoformat()
-            ann.lineage.append(StageEvent(
-                stage="user",
-                action="user_rejected",
-                detail=f"Dismissed as false positive (was '{prev_state}')",
-            ))
-
-            # Record in feedback/insights system
-            await upsert_feedback_for_annotation(
-                job_id=str(job_id),
-                annotation=ann,
-                rating="dismissed",
-                comment="Removed as false positive",
-            )
-
-            await _job_store.save(job)
-
-            # Count how many other annotations share the same primary IRI
-            primary_iri = ann.concepts[0].folio_iri if ann.concepts else None
-            same_iri_count = 0
-            if primary_iri:
-                same_iri_count = sum(
-                    1 for a in job.result.annotations
-                    if a.id != annotation_id
-                    and a.state != "rejected"
-                    and a.concepts
-                    and a.concepts[0].folio_iri == primary_iri
-                )
-
-            return {
-                "status": "rejected",
-                "annotation_id": annotation_id,
-                "same_concept_count": same_iri_count,
-                "folio_iri": primary_iri,
-            }
-
-    raise HTTPException(status_code=404, detail="Annotation not found")
+    ann = job.result.annotation_for_update(annotation_id)
+    if ann is None:
+        raise HTTPException(status_code=404, detail="Annotation not found")
+
+    if ann.state == "rejected":
+        return {"status": "already_rejected"}
+    prev_state = ann.state
+    ann.state = "rejected"
+    ann.dismissed_at = _utc_now_iso()
+    ann.lineage.append(StageEvent(
+        stage="user",
+        action="user_rejected",
+        detail=f"Dismissed as false positive (was '{prev_state}')",
+    ))
+
+    # Record in feedback/insights system
+    await upsert_feedback_for_annotation(
+        job_id=str(job_id),
+        annotation=ann,
+        rating="dismissed",
+        comment="Removed as false positive",
+    )
+
+    _job_store.save_deferred(job)
+
+    # Count how many other annotations share the same primary IRI
+    primary_iri = ann.concepts[0].folio_iri if ann.concepts else None
+    same_iri_count = 0
+    if primary_iri:
+        same_iri_count = sum(
+            1 for a in job.result.annotations_by_primary_iri(primary_iri)
+            if a.id != annotation_id and a.state != "rejected"
+        )
+
+    return {
+        "status": "rejected",
+        "annotation_id": annotation_id,
+        "same_concept_count": same_iri_count,
+        "folio_iri": primary_iri,
+    }
 
 
 @router.post("/{job_id}/annotations/{annotation_id}/restore")
 async def restore_annotation(job_id: UUID, annotation_id: str) -> dict:
     """Restore a dismissed annotation (set state back to confirmed)."""
-    from app.models.annotation import StageEvent
-    from app.api.routes.feedback import remove_feedback_for_annotation
-
-    job = await _job_store.load(job_id)
+    job = await _job_store.load_for_update(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    for ann in job.result.annotations:
-        if ann.id == annotation_id:
-            if ann.state != "rejected":
-                return {"status": "not_rejected", "current_state": ann.state}
-            ann.state = "confirmed"
-            ann.dismissed_at = None
-            ann.feedback = []  # Clear dismiss feedback
-            ann.lineage.append(StageEvent(
-                stage="user",
-                action="user_restored",
-                detail="Restored from dismissed state",
-            ))
+    ann = job.result.annotation_for_update(annotation_id)
+    if ann is None:
+        raise HTTPException(status_code=404, detail="Annotation not found")
 
-            # Remove from feedback/insights system
-            await remove_feedback_for_annotation(str(job_id), annotation_id)
+    if ann.state != "rejected":
+        return {"status": "not_rejected", "current_state": ann.state}
+    ann.state = "confirmed"
+    ann.dismissed_at = None
+    ann.feedback = []  # Clear dismiss feedback
+    ann.lineage.append(StageEvent(
+        stage="user",
+        action="user_restored",
+        detail="Restored from dismissed state",
+    ))
 
-            await _job_store.save(job)
-            return {"status": "restored", "annotation_id": annotation_id}
+    # Remove from feedback/insights system
+    await remove_feedback_for_annotation(str(job_id), annotation_id)
 
-    raise HTTPException(status_code=404, detail="Annotation not found")
+    _job_store.save_deferred(job)
+    return {"status": "restored", "annotation_id": annotation_id}
 
 
 @router.post("/{job_id}/annotations/bulk-reject")
 async def bulk_reject_annotations(job_id: UUID, req: BulkRejectRequest) -> dict:
     """Dismiss all annotations sharing the same primary FOLIO IRI."""
-    from datetime import datetime, timezone
-    from app.models.annotation import StageEvent
-    from app.api.routes.feedback import upsert_feedback_for_annotation
-
-    job = await _job_store.load(job_id)
+    job = await _job_store.load_for_update(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    now = datetime.now(timezone.utc).isoformat()
+    now = _utc_now_iso()  # one timestamp for the whole batch
     updated = 0
     rejected_ids = []
-    for ann in job.result.annotations:
+    for ann in job.result.annotations_by_primary_iri(req.folio_iri):
         if ann.state == "rejected":
             continue
-        if not ann.concepts or ann.concepts[0].folio_iri != req.folio_iri:
-            continue
+        ann = job.result.annotation_for_update(ann.id)
         ann.state = "rejected"
         ann.dismissed_at = now
         ann.lineage.append(StageEvent(
@@ -353,7 +396,7 @@ async def bulk_reject_annotations(job_id: UUID, req: BulkRejectRequest) -> dict:
         updated += 1
 
     if updated > 0:
-        await _job_store.save(job)
+        _job_store.save_deferred(job)
 
     return {
         "status": "bulk_rejected",
@@ -364,7 +407,6 @@ async def bulk_reject_annotations(job_id: UUID, req: BulkRejectRequest) -> dict:
 
 @router.get("/{job_id}/stream")
 async def stream_enrichment(job_id: UUID):
-    job = await _job_store.load(job_id)
-    if job is None:
+    if not await _job_store.exists(job_id):
         raise HTTPException(status_code=404, detail="Job not found")
     return EventSourceResponse(job_event_stream(job_id, _job_store))
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-import copy
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import Response
 
+from app.services.export.base import ExporterBase
 from app.services.export.registry import get_exporter, list_formats
 from app.storage.job_store import JobStore
 
 router = APIRouter(prefix="/enrich", tags=["export"])
 
-_job_store = JobStore()
+_job_store = JobStore.get_instance()
+
+# Exporters are stateless, and the registry is fixed once imported
+_EXPORTERS: dict[str, ExporterBase] = {fmt: get_exporter(fmt) for fmt in list_formats()}
+_FORMATS = list(_EXPORTERS)
 
 
 @router.get("/{job_id}/export")
@@ -20,27 +24,29 @@ async def export_job(
     format: str = "json",
     include_dismissed: bool = Query(False, description="Include rejected/dismissed annotations"),
 ) -> Response:
+    exporter = _EXPORTERS.get(format)
+    if exporter is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported format: {format}. Available: {_FORMATS}",
+        )
+
     job = await _job_store.load(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # Filter out dismissed annotations unless explicitly requested
+    # Filter out dismissed annotations unless explicitly requested.  Exporters
+    # only read the job, so a shallow copy with a filtered list is enough and
+    # leaves the stored job untouched.
     if not include_dismissed:
-        job = copy.deepcopy(job)
-        job.result.annotations = [
-            a for a in job.result.annotations if a.state != "rejected"
-        ]
-
-    try:
-        exporter = get_exporter(format)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported format: {format}. Available: {list_formats()}",
-        )
+        job = job.model_copy(update={
+            "result": job.result.model_copy(update={
+                "annotations": [a for a in job.result.annotations if a.state != "rejected"],
+            }),
+        })
 
     content = exporter.export(job)
     return Response(
-        content=content if isinstance(content, bytes) else content.encode(),
+        content=content if isinstance(content, (bytes, bytearray)) else content.encode(),
         media_type=exporter.content_type,
     )
@@ -2,16 +2,18 @@ from __future__ import annotations
 
 import csv
 import io
-import json
 import logging
 from datetime import datetime, timezone
-from uuid import UUID, uuid4
+from typing import AsyncIterator, Literal
+from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import Response
+import orjson
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
-from app.models.annotation import FeedbackItem
+from app.models._idgen import next_id
+from app.models.annotation import STAGE_EVENT_LIST_ADAPTER, FeedbackItem, FeedbackRating
 from app.models.feedback import FeedbackEntry, InsightsSummary
 from app.storage.feedback_store import FeedbackStore
 from app.storage.job_store import JobStore
@@ -20,25 +22,22 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/feedback", tags=["feedback"])
 
-_feedback_store = FeedbackStore()
-_job_store = JobStore()
+_feedback_store = FeedbackStore.get_instance()
+_job_store = JobStore.get_instance()
 
 
 class FeedbackRequest(BaseModel):
-    job_id: str
+    job_id: UUID  # parsed by pydantic-core; malformed ids are rejected with 422
     annotation_id: str
-    rating: str  # "up" or "down"
+    rating: FeedbackRating
     stage: str | None = None
     comment: str = ""
 
 
-VALID_RATINGS = ("up", "down", "dismissed")
-
-
 async def upsert_feedback_for_annotation(
     job_id: str,
     annotation,
-    rating: str,
+    rating: FeedbackRating,
     stage: str | None = None,
     comment: str = "",
 ) -> str:
@@ -62,7 +61,7 @@ async def upsert_feedback_for_annotation(
         return existing.id
 
     entry = FeedbackEntry(
-        id=str(uuid4()),
+        id=next_id(),
         job_id=job_id,
         annotation_id=annotation.id,
         rating=rating,
@@ -72,7 +71,7 @@ async def upsert_feedback_for_annotation(
         sentence_text=annotation.span.sentence_text,
         folio_iri=concept.folio_iri if concept else None,
         folio_label=concept.folio_label if concept else None,
-        lineage=[e.model_dump() for e in annotation.lineage],
+        lineage=STAGE_EVENT_LIST_ADAPTER.dump_python(annotation.lineage),
         created_at=now,
     )
     await _feedback_store.save(entry)
@@ -98,79 +97,99 @@ async def remove_feedback_for_annotation(job_id: str, annotation_id: str) -> Non
 
 @router.post("", status_code=201)
 async def submit_feedback(req: FeedbackRequest) -> dict:
-    if req.rating not in VALID_RATINGS:
-        raise HTTPException(status_code=422, detail=f"rating must be one of {VALID_RATINGS}")
-
     # Load job and find annotation
-    try:
-        job_uuid = UUID(req.job_id)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid job_id format")
-
-    job = await _job_store.load(job_uuid)
+    job = await _job_store.load_for_update(req.job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    annotation = None
-    for ann in job.result.annotations:
-        if ann.id == req.annotation_id:
-            annotation = ann
-            break
+    annotation = job.result.annotation_for_update(req.annotation_id)
     if annotation is None:
         raise HTTPException(status_code=404, detail="Annotation not found")
 
     entry_id = await upsert_feedback_for_annotation(
-        job_id=req.job_id,
+        job_id=str(req.job_id),
         annotation=annotation,
         rating=req.rating,
         stage=req.stage,
         comment=req.comment,
     )
-    await _job_store.save(job)
+    # Inline feedback on the annotation rides along with the next debounced job write
+    _job_store.save_deferred(job)
 
     return {"id": entry_id, "status": "saved"}
 
 
+def _insights_response(summary: InsightsSummary) -> Response:
+    # Encode in pydantic-core rather than re-validating against response_model
+    return Response(content=summary.model_dump_json(), media_type="application/json")
+
+
 @router.get("/insights", response_model=InsightsSummary)
-async def get_insights() -> InsightsSummary:
-    return await _feedback_store.get_insights()
+async def get_insights() -> Response:
+    return _insights_response(await _feedback_store.get_insights())
 
 
 @router.get("/insights/{job_id}", response_model=InsightsSummary)
-async def get_job_insights(job_id: str) -> InsightsSummary:
-    return await _feedback_store.get_insights(job_id=job_id)
+async def get_job_insights(job_id: str) -> Response:
+    return _insights_response(await _feedback_store.get_insights(job_id=job_id))
+
+
+_CSV_HEADER = (
+    "id", "job_id", "annotation_id", "rating", "stage", "comment",
+    "annotation_text", "folio_iri", "folio_label", "lineage", "created_at",
+)
+# Header names need no quoting, so the line csv.writer would emit is fixed
+_CSV_HEADER_LINE = ",".join(_CSV_HEADER) + "\r\n"
+# Rows handed to writer.writerows() per yielded chunk
+CSV_EXPORT_BATCH_SIZE = 500
+
+
+async def _stream_csv() -> AsyncIterator[str]:
+    yield _CSV_HEADER_LINE
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    rows: list[tuple] = []
+    async for e in _feedback_store.iter_all():
+        # Serialize lineage as compact JSON string within the CSV cell
+        lineage_json = orjson.dumps(e.lineage).decode() if e.lineage else ""
+        rows.append((
+            e.id, e.job_id, e.annotation_id, e.rating, e.stage or "",
+            e.comment, e.annotation_text, e.folio_iri or "", e.folio_label or "",
+            lineage_json, e.created_at,
+        ))
+        if len(rows) >= CSV_EXPORT_BATCH_SIZE:
+            writer.writerows(rows)
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate(0)
+            rows.clear()
+    if rows:
+        writer.writerows(rows)
+        yield buf.getvalue()
+
+
+async def _stream_json() -> AsyncIterator[str]:
+    yield "["
+    sep = ""
+    async for e in _feedback_store.iter_all():
+        yield sep + e.model_dump_json()
+        sep = ","
+    yield "]"
 
 
 @router.get("/export")
-async def export_feedback(format: str = Query("json", pattern="^(json|csv)$")) -> Response:
-    """Export all feedback + lineage snapshots as JSON or CSV."""
-    entries = await _feedback_store.list_all()
-
+async def export_feedback(format: Literal["json", "csv"] = "json") -> StreamingResponse:
+    """Export all feedback + lineage snapshots as JSON or CSV, streamed entry by entry."""
     if format == "csv":
-        buf = io.StringIO()
-        writer = csv.writer(buf)
-        writer.writerow([
-            "id", "job_id", "annotation_id", "rating", "stage", "comment",
-            "annotation_text", "folio_iri", "folio_label", "lineage", "created_at",
-        ])
-        for e in entries:
-            # Serialize lineage as compact JSON string within the CSV cell
-            lineage_json = json.dumps(e.lineage) if e.lineage else ""
-            writer.writerow([
-                e.id, e.job_id, e.annotation_id, e.rating, e.stage or "",
-                e.comment, e.annotation_text, e.folio_iri or "", e.folio_label or "",
-                lineage_json, e.created_at,
-            ])
-        return Response(
-            content=buf.getvalue(),
+        return StreamingResponse(
+            _stream_csv(),
             media_type="text/csv",
             headers={"Content-Disposition": "attachment; filename=feedback.csv"},
         )
 
     # JSON (default)
-    data = [e.model_dump() for e in entries]
-    return Response(
-        content=json.dumps(data, indent=2),
+    return StreamingResponse(
+        _stream_json(),
         media_type="application/json",
         headers={"Content-Disposition": "attachment; filename=feedback.json"},
     )
@@ -1,34 +1,78 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Mapping
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
 
+from app.api.http_cache import conditional_json_response, make_etag
+from app.api.readiness import embeddings_ready
 from app.config import settings
+from app.services.cache import LRUTTLCache
 
 router = APIRouter(tags=["health"])
 logger = logging.getLogger(__name__)
 
 
+# One precomputed body (and ETag) per embedding-index readiness state
+_HEALTH_BODIES = {
+    ready: orjson.dumps({"status": "ok", "embedding_ready": ready}) for ready in (False, True)
+}
+_HEALTH_ETAGS = {ready: make_etag(body) for ready, body in _HEALTH_BODIES.items()}
+
+
 @router.get("/health")
-async def health() -> dict:
-    return {"status": "ok"}
+async def health(request: Request) -> Response:
+    ready = embeddings_ready(request.app)
+    return conditional_json_response(
+        request, _HEALTH_BODIES[ready], 5, etag=_HEALTH_ETAGS[ready],
+    )
 
 
 @router.get("/health/detail")
 async def health_detail() -> dict:
     """Detailed health check for all subsystems."""
+    # The folio/embedding/spaCy checks touch disk and heavy imports; run them
+    # side by side on worker threads so the endpoint costs max(), not sum().
+    folio, embedding, spacy = await asyncio.gather(
+        asyncio.to_thread(_check_folio),
+        asyncio.to_thread(_check_embedding),
+        asyncio.to_thread(_check_spacy),
+    )
     result = {
         "backend": {"status": "ok"},
-        "folio_ontology": _check_folio(),
-        "embedding": _check_embedding(),
+        "folio_ontology": folio,
+        "embedding": embedding,
         "llm": _check_llm(),
-        "spacy": _check_spacy(),
+        "spacy": spacy,
     }
     return result
 
 
+# Detailed health is polled by the UI and by sidecars; the FOLIO check reads
+# the OWL cache status from disk, so share its result for a second.
+_folio_status_cache = LRUTTLCache(max_size=1, ttl_seconds=1)
+_folio_status_lock = threading.Lock()  # _check_folio runs in worker threads
+
+
 def _check_folio() -> dict:
+    with _folio_status_lock:
+        cached = _folio_status_cache.get("folio")
+    if cached is not None:
+        return cached
+    result = _check_folio_uncached()
+    with _folio_status_lock:
+        _folio_status_cache.set("folio", result)
+    return result
+
+
+def _check_folio_uncached() -> dict:
     try:
         from app.services.folio.folio_service import FolioService
         from app.services.folio.owl_cache import get_owl_status
@@ -68,30 +112,32 @@ def _check_embedding() -> dict:
         return {"status": "error", "message": str(e)}
 
 
+# Map provider name → settings attribute for API key
+_KEY_ATTRS: Mapping[str, str] = MappingProxyType({
+    "openai": "openai_api_key",
+    "anthropic": "anthropic_api_key",
+    "google": "google_api_key",
+    "mistral": "mistral_api_key",
+    "cohere": "cohere_api_key",
+    "meta_llama": "meta_llama_api_key",
+    "groq": "groq_api_key",
+    "xai": "xai_api_key",
+    "github_models": "github_models_api_key",
+})
+_KEY_GETTERS = MappingProxyType({p: attrgetter(attr) for p, attr in _KEY_ATTRS.items()})
+# Local providers never need an API key
+_LOCAL_PROVIDERS = frozenset({"ollama", "lmstudio", "lm_studio", "custom", "llamafile"})
+
+
 def _check_llm() -> dict:
     provider = settings.llm_provider
     model = settings.llm_model
 
-    # Map provider name → settings attribute for API key
-    _KEY_ATTRS = {
-        "openai": "openai_api_key",
-        "anthropic": "anthropic_api_key",
-        "google": "google_api_key",
-        "mistral": "mistral_api_key",
-        "cohere": "cohere_api_key",
-        "meta_llama": "meta_llama_api_key",
-        "groq": "groq_api_key",
-        "xai": "xai_api_key",
-        "github_models": "github_models_api_key",
-    }
-    # Local providers never need an API key
-    _LOCAL_PROVIDERS = {"ollama", "lmstudio", "lm_studio", "custom", "llamafile"}
-
     if provider in _LOCAL_PROVIDERS:
         has_key = True
     else:
-        attr = _KEY_ATTRS.get(provider)
-        has_key = bool(getattr(settings, attr, "")) if attr else False
+        getter = _KEY_GETTERS.get(provider)
+        has_key = bool(getter(settings)) if getter else False
 
     result: dict
     if has_key:
@@ -112,7 +158,6 @@ def _check_llm() -> dict:
     if provider == "ollama":
         try:
             from app.services.ollama.manager import OllamaManager
-            import asyncio
             manager = OllamaManager.get_instance()
             # Sync context — use cached info from manager
             required = manager.get_required_models()
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+from operator import attrgetter
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
 from pydantic import BaseModel
 
+from app.api.http_cache import conditional_json_response
 from app.config import settings
 from app.models.llm_models import (
+    ConnectionTestBatchRequest,
     ConnectionTestRequest,
     ConnectionTestResponse,
     LLMProviderType,
     ModelInfo,
+    ModelListBatchRequest,
     ModelListRequest,
 )
 from app.services.llm.registry import (
@@ -37,6 +45,7 @@ _API_KEY_ATTRS: dict[LLMProviderType, str] = {
     LLMProviderType.xai: "xai_api_key",
     LLMProviderType.github_models: "github_models_api_key",
 }
+_API_KEY_GETTERS = {pt: attrgetter(attr) for pt, attr in _API_KEY_ATTRS.items()}
 
 
 def _get_api_key_for_provider(
@@ -46,10 +55,8 @@ def _get_api_key_for_provider(
     """Resolve the API key: explicit > stored in settings > None."""
     if explicit_key:
         return explicit_key
-    attr = _API_KEY_ATTRS.get(provider_type)
-    if attr:
-        return getattr(settings, attr, None) or None
-    return None
+    getter = _API_KEY_GETTERS.get(provider_type)
+    return (getter(settings) or None) if getter else None
 
 
 class SettingsUpdate(BaseModel):
@@ -93,24 +100,43 @@ _TASK_LLM_FIELDS = (
     "classifier", "extractor", "concept", "branch_judge", "area_of_law", "synthetic",
 )
 
+# KNOWN_MODELS is static, so its response body is serialized once at import
+_KNOWN_MODELS_DUMPED = {
+    pt.value: [m.model_dump() for m in models] for pt, models in KNOWN_MODELS.items()
+}
+_KNOWN_MODELS_BODY = orjson.dumps({"models": _KNOWN_MODELS_DUMPED})
+
+# Cap on provider calls in flight per batched /models or /test-connection request
+SETTINGS_BATCH_CONCURRENCY = 8
+
+# Bumped by PUT /settings so derived responses are rebuilt
+_settings_version = 0
+
+# Settings echoed back verbatim by GET /settings
+_STATIC_SETTINGS_FIELDS = (
+    "llm_provider",
+    "llm_model",
+    "max_chunk_chars",
+    "chunk_overlap_chars",
+    "max_upload_size",
+    # Ollama tier config
+    "ollama_auto_manage",
+    "ollama_model_simple",
+    "ollama_model_medium",
+    "ollama_model_complex",
+    # FOLIO OWL auto-update
+    "folio_auto_update",
+    "folio_update_check_interval_hours",
+    # Translation matching
+    "translation_matching_enabled",
+)
+
 
 @router.get("")
-async def get_settings() -> dict:
+async def get_settings(request: Request) -> Response:
     result = {
-        "llm_provider": settings.llm_provider,
-        "llm_model": settings.llm_model,
-        "openai_api_key_set": bool(settings.openai_api_key),
-        "anthropic_api_key_set": bool(settings.anthropic_api_key),
-        "google_api_key_set": bool(settings.google_api_key),
-        "mistral_api_key_set": bool(settings.mistral_api_key),
-        "cohere_api_key_set": bool(settings.cohere_api_key),
-        "meta_llama_api_key_set": bool(settings.meta_llama_api_key),
-        "groq_api_key_set": bool(settings.groq_api_key),
-        "xai_api_key_set": bool(settings.xai_api_key),
-        "github_models_api_key_set": bool(settings.github_models_api_key),
-        "max_chunk_chars": settings.max_chunk_chars,
-        "chunk_overlap_chars": settings.chunk_overlap_chars,
-        "max_upload_size": settings.max_upload_size,
+        **{k: getattr(settings, k) for k in _STATIC_SETTINGS_FIELDS},
+        **{f"{attr}_set": bool(getattr(settings, attr)) for attr in _API_KEY_ATTRS.values()},
     }
     # Per-task LLM overrides
     task_overrides = {}
@@ -120,17 +146,8 @@ async def get_settings() -> dict:
         if provider or model:
             task_overrides[task] = {"provider": provider, "model": model}
     result["task_llm_overrides"] = task_overrides
-    # Ollama tier config
-    result["ollama_auto_manage"] = settings.ollama_auto_manage
-    result["ollama_model_simple"] = settings.ollama_model_simple
-    result["ollama_model_medium"] = settings.ollama_model_medium
-    result["ollama_model_complex"] = settings.ollama_model_complex
-    # FOLIO OWL auto-update
-    result["folio_auto_update"] = settings.folio_auto_update
-    result["folio_update_check_interval_hours"] = settings.folio_update_check_interval_hours
-    # Translation matching
-    result["translation_matching_enabled"] = settings.translation_matching_enabled
-    return result
+    # The UI polls settings; no-cache makes every poll revalidate the ETag
+    return conditional_json_response(request, orjson.dumps(result), max_age=None)
 
 
 @router.put("")
@@ -140,17 +157,7 @@ async def update_settings(update: SettingsUpdate) -> dict:
     if update.llm_model is not None:
         settings.llm_model = update.llm_model
     # Update any provided API keys
-    for fld in (
-        "openai_api_key",
-        "anthropic_api_key",
-        "google_api_key",
-        "mistral_api_key",
-        "cohere_api_key",
-        "meta_llama_api_key",
-        "groq_api_key",
-        "xai_api_key",
-        "github_models_api_key",
-    ):
+    for fld in _API_KEY_ATTRS.values():
         val = getattr(update, fld, None)
         if val is not None:
             setattr(settings, fld, val)
@@ -182,12 +189,25 @@ async def update_settings(update: SettingsUpdate) -> dict:
             svc = FolioService.get_instance()
             svc._labels_cache = None
             svc._labels_multi_cache = None
+    global _settings_version
+    _settings_version += 1
     return {"status": "ok", "message": "Settings updated"}
 
 
-@router.get("/providers")
-async def list_providers() -> dict:
-    """Return provider metadata: display names, requires_api_key, default models."""
+async def _gather_bounded(func, requests: list) -> list:
+    """Run *func* over *requests* concurrently, at most SETTINGS_BATCH_CONCURRENCY at a time."""
+    semaphore = asyncio.Semaphore(SETTINGS_BATCH_CONCURRENCY)
+
+    async def _one(req):
+        async with semaphore:
+            return await func(req)
+
+    return await asyncio.gather(*(_one(r) for r in requests))
+
+
+@functools.lru_cache(maxsize=4)
+def _build_providers(version: int) -> dict:
+    """Provider metadata for settings *version*; rebuilt only after an update."""
     providers = {}
     for pt in LLMProviderType:
         providers[pt.value] = {
@@ -198,27 +218,29 @@ async def list_providers() -> dict:
                 _get_api_key_for_provider(pt)
             ),
         }
-    return {
-        "providers": providers,
+    return providers
+
+
+@router.get("/providers")
+async def list_providers(request: Request) -> Response:
+    """Return provider metadata: display names, requires_api_key, default models."""
+    body = orjson.dumps({
+        "providers": _build_providers(_settings_version),
         "current": {
             "provider": settings.llm_provider,
             "model": settings.llm_model,
         },
-    }
+    })
+    return conditional_json_response(request, body, max_age=None)
 
 
 @router.get("/known-models")
-async def get_known_models() -> dict:
+async def get_known_models() -> Response:
     """Return static fallback model lists (no API key needed)."""
-    result = {}
-    for pt, models in KNOWN_MODELS.items():
-        result[pt.value] = [m.model_dump() for m in models]
-    return {"models": result}
+    return Response(content=_KNOWN_MODELS_BODY, media_type="application/json")
 
 
-@router.post("/models")
-async def list_models_dynamic(req: ModelListRequest) -> dict:
-    """Dynamically list models from a provider's API."""
+async def _list_models_one(req: ModelListRequest) -> dict:
     api_key = _get_api_key_for_provider(req.provider, req.api_key)
 
     try:
@@ -243,9 +265,19 @@ async def list_models_dynamic(req: ModelListRequest) -> dict:
         }
 
 
-@router.post("/test-connection")
-async def test_connection(req: ConnectionTestRequest) -> ConnectionTestResponse:
-    """Test an LLM provider connection."""
+@router.post("/models")
+async def list_models_dynamic(req: ModelListRequest) -> dict:
+    """Dynamically list models from a provider's API."""
+    return await _list_models_one(req)
+
+
+@router.post("/models/batch")
+async def list_models_batch(body: ModelListBatchRequest) -> dict:
+    """List models from several providers concurrently, in request order."""
+    return {"results": await _gather_bounded(_list_models_one, body.requests)}
+
+
+async def _test_connection_one(req: ConnectionTestRequest) -> ConnectionTestResponse:
     api_key = _get_api_key_for_provider(req.provider, req.api_key)
 
     if REQUIRES_API_KEY.get(req.provider, True) and not api_key:
@@ -274,6 +306,18 @@ async def test_connection(req: ConnectionTestRequest) -> ConnectionTestResponse:
         )
 
 
+@router.post("/test-connection")
+async def test_connection(req: ConnectionTestRequest) -> ConnectionTestResponse:
+    """Test an LLM provider connection."""
+    return await _test_connection_one(req)
+
+
+@router.post("/test-connection/batch")
+async def test_connection_batch(body: ConnectionTestBatchRequest) -> list[ConnectionTestResponse]:
+    """Test several provider connections concurrently, in request order."""
+    return await _gather_bounded(_test_connection_one, body.requests)
+
+
 @router.get("/pricing")
 async def get_pricing() -> dict:
     """Return LLM cost-per-document estimates from LiteLLM pricing DB."""
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+
+import orjson
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel
 
 from app.api.routes.settings import _get_api_key_for_provider
 from app.config import settings
-from app.models.llm_models import LLMProviderType
-from app.services.llm.registry import get_provider
+from app.services.llm.base import LLMProvider
+from app.services.llm.registry import get_shared_provider, resolve_provider_type
 from app.services.testing.synthetic_generator import DOC_TYPES, SyntheticGenerator
 
 router = APIRouter(prefix="/synthetic", tags=["synthetic"])
 
+# Generation is a long LLM call; cap how many run at once and refuse the rest
+_generation_slots = asyncio.Semaphore(settings.max_concurrent_synthetic)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_generator(llm: LLMProvider) -> SyntheticGenerator:
+    """One generator per shared provider instance (i.e. per provider/model/key)."""
+    return SyntheticGenerator(llm)
+
 
 class SyntheticRequest(BaseModel):
     doc_type: str = "Motion to Dismiss"
@@ -26,29 +40,33 @@ async def generate_synthetic(req: SyntheticRequest) -> dict:
         task_model = settings.llm_synthetic_model
 
         if task_provider:
-            provider_name = task_provider.replace("-", "_")
+            provider_name = task_provider
             model = task_model
         else:
-            provider_name = settings.llm_provider.replace("-", "_")
+            provider_name = settings.llm_provider
             model = settings.llm_model
 
-        if provider_name == "lm_studio":
-            provider_name = "lmstudio"
-        provider_type = LLMProviderType(provider_name)
+        provider_type = resolve_provider_type(provider_name)
+        if provider_type is None:
+            raise ValueError(f"Unknown LLM provider: {provider_name}")
         api_key = _get_api_key_for_provider(provider_type)
-        llm = get_provider(
-            provider_type,
-            api_key=api_key,
-            model=model or None,
-        )
+        llm = get_shared_provider(provider_type, model or None, api_key)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"LLM provider unavailable: {e}")
 
-    generator = SyntheticGenerator(llm)
-    text = await generator.generate(req.doc_type, req.length, req.jurisdiction)
+    if _generation_slots.locked():
+        raise HTTPException(status_code=429, detail="Too many concurrent generations. Try again later.")
+    async with _generation_slots:
+        text = await _get_generator(llm).generate(req.doc_type, req.length, req.jurisdiction)
     return {"document": text, "doc_type": req.doc_type, "length": req.length}
 
 
+# DOC_TYPES is static, so the body is serialized once at import.  A fresh
+# Response wraps it per request: middleware (CORS) mutates response headers
+# in place, so a shared Response object would accumulate them.
+_DOC_TYPES_BODY = orjson.dumps({"types": DOC_TYPES})
+
+
 @router.get("/types")
-async def list_doc_types() -> dict:
-    return {"types": DOC_TYPES}
+async def list_doc_types() -> Response:
+    return Response(content=_DOC_TYPES_BODY, media_type="application/json")
@@ -111,8 +111,10 @@ class Settings(BaseSettings):
 
     # Job management
     job_retention_days: int = 30
-    max_concurrent_jobs: int = 10
+    max_concurrent_jobs: int = 10  # pipeline worker count
+    max_queued_jobs: int = 20  # jobs allowed to wait for a free worker
     stale_job_timeout_minutes: int = 30
+    max_concurrent_synthetic: int = 10  # synthetic-document generations in flight
 
     # Rate limiting
     rate_limit_requests: int = 200
@@ -1,5 +1,7 @@
 import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from pathlib import Path
@@ -24,34 +26,40 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def _index_folio_embeddings() -> None:
-    """Pre-compute FOLIO label embeddings at startup (blocks startup until ready)."""
+async def _index_folio_embeddings(ready: asyncio.Event, executor: ThreadPoolExecutor) -> None:
+    """Pre-compute FOLIO label embeddings in the background, then set *ready*.
+
+    The encoding and FAISS build run on *executor*, a pool reserved for this
+    work, so they don't starve the default pool used by request offloads.
+    """
     try:
         from app.services.folio.owl_cache import ensure_owl_fresh
         from app.services.folio.folio_service import FolioService
         from app.services.embedding.service import EmbeddingService, build_embedding_index
 
         # Ensure OWL cache is fresh before FOLIO init reads it
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, ensure_owl_fresh)
+        await asyncio.to_thread(ensure_owl_fresh)
 
         folio_service = FolioService.get_instance()
         embedding_service = EmbeddingService.get_instance()
         # Run the heavy encoding in a thread to avoid blocking the event loop
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, embedding_service.index_folio_labels, folio_service)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, embedding_service.index_folio_labels, folio_service)
         logger.info("FOLIO embedding index ready (%d vectors)", embedding_service.index_size)
         # Also build the FAISS-backed index for semantic search
-        await loop.run_in_executor(None, build_embedding_index, folio_service)
+        await loop.run_in_executor(executor, build_embedding_index, folio_service)
     except Exception:
         logger.warning("Failed to pre-compute FOLIO embeddings — semantic features disabled", exc_info=True)
+    finally:
+        # Set even on failure so waiting requests fall back instead of stalling
+        ready.set()
 
 
 async def _periodic_job_cleanup() -> None:
     """Periodically clean up expired jobs."""
     from app.storage.job_store import JobStore
 
-    store = JobStore()
+    store = JobStore.get_instance()
     while True:
         try:
             deleted = await store.cleanup_expired()
@@ -124,15 +132,32 @@ async def lifespan(app: FastAPI):
     # Startup: detect/start Ollama if configured
     await _manage_ollama()
 
-    # Startup: eager-load FOLIO ontology and embedding index before accepting requests
-    logger.info("Loading FOLIO ontology and building embedding index...")
-    await _index_folio_embeddings()
+    # Startup: load FOLIO ontology and embedding index in the background so the
+    # app serves immediately; routes that need the index wait on this event.
+    logger.info("Loading FOLIO ontology and building embedding index in the background...")
+    embedding_ready = asyncio.Event()
+    app.state.embedding_ready = embedding_ready
+    embed_executor = ThreadPoolExecutor(
+        max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="embed",
+    )
+    app.state.embed_executor = embed_executor
+    index_task = asyncio.create_task(_index_folio_embeddings(embedding_ready, embed_executor))
     cleanup_task = asyncio.create_task(_periodic_job_cleanup())
     owl_update_task = asyncio.create_task(_periodic_owl_update_check())
+    from app.pipeline.job_queue import JobQueue
+    JobQueue.get_instance().start()  # pipeline workers, fed by POST /enrich
+    from app.services.llm.http_client import close_http_client, get_http_client
+    get_http_client()  # pooled connections shared by all LLM providers
     yield
     # Shutdown
+    index_task.cancel()
     cleanup_task.cancel()
     owl_update_task.cancel()
+    from app.storage.job_store import JobStore
+    await JobQueue.get_instance().shutdown()
+    await JobStore.get_instance().flush()  # write any debounced annotation edits
+    await close_http_client()
+    embed_executor.shutdown(wait=False, cancel_futures=True)
     await _stop_ollama()
 
 
@@ -157,15 +182,8 @@ app.add_middleware(
 register_error_handlers(app)
 
 # Routes
-app.include_router(health.router)
-app.include_router(enrich.router)
-app.include_router(export.router)
-app.include_router(synthetic.router)
-app.include_router(concepts.router)
-app.include_router(feedback.router)
-app.include_router(settings.router)
-app.include_router(ollama.router)
-app.include_router(folio_update.router)
+for _routes in (health, enrich, export, synthetic, concepts, feedback, settings, ollama, folio_update):
+    app.include_router(_routes.router)
 
 # Serve frontend
 _frontend_dir = Path(__file__).resolve().parent.parent.parent / "frontend"
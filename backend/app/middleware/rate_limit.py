@@ -1,13 +1,10 @@
 from __future__ import annotations
 
 import time
-from collections import defaultdict
+from collections import Counter, deque
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from starlette.responses import JSONResponse
-
-from app.config import settings
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
 # Only rate-limit expensive mutation endpoints (POST routes that trigger LLM work).
@@ -19,40 +16,82 @@ _RATE_LIMITED_ROUTES: tuple[tuple[str, str], ...] = (
     ("POST", "/ollama/setup"),
 )
 
+_RATE_LIMITED_METHODS = frozenset(m for m, _ in _RATE_LIMITED_ROUTES)
+
+
+class RateLimitMiddleware:
+    """Simple in-memory per-IP rate limiter using a sliding window of 1 s buckets.
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Simple in-memory per-IP rate limiter using sliding window."""
+    Hits are counted into one bucket per second (a timer wheel) plus a running
+    per-IP total.  Whole buckets are dropped once they leave the window, so the
+    cleanup is paid once per second for all clients instead of per IP on every
+    request, and IPs whose count reaches zero are forgotten.
 
-    def __init__(self, app, max_requests: int = 200, window_seconds: int = 60):
-        super().__init__(app)
+    State lives in this process only: with several uvicorn workers each one
+    counts separately, so the effective limit is ``max_requests * workers``.
+    A shared limit needs an external sliding window (e.g. a Redis sorted set
+    trimmed with ZREMRANGEBYSCORE and counted with ZCARD).
+
+    Pure ASGI middleware, so exempt requests are handed straight to the app
+    without the per-request task and stream BaseHTTPMiddleware would add.
+    """
+
+    def __init__(self, app: ASGIApp, max_requests: int = 200, window_seconds: int = 60):
+        self.app = app
+        # Bound once so each request skips the attribute and __call__ lookup
+        self._app_call = app.__call__
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._requests: dict[str, list[float]] = defaultdict(list)
+        self._requests: Counter[str] = Counter()  # hits per IP inside the window
+        self._buckets: deque[tuple[int, Counter[str]]] = deque()  # (second, hits per IP)
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Only rate-limit specific expensive POST endpoints
-        method = request.method
-        path = request.url.path
+        if scope["type"] != "http" or scope["method"] not in _RATE_LIMITED_METHODS:
+            await self._app_call(scope, receive, send)
+            return
+        method = scope["method"]
+        path = scope["path"]
         if not any(
             method == m and path.startswith(p) for m, p in _RATE_LIMITED_ROUTES
         ):
-            return await call_next(request)
+            await self._app_call(scope, receive, send)
+            return
 
-        client_ip = request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
 
-        now = time.time()
-        window_start = now - self.window_seconds
+        # Monotonic so NTP/wall-clock jumps cannot open or close the window
+        now = int(time.monotonic())
 
-        # Clean old entries
-        self._requests[client_ip] = [
-            t for t in self._requests[client_ip] if t > window_start
-        ]
+        # No await from here until the decision is recorded: coroutines only
+        # switch at await points, so the check/record needs no lock.
+        self._expire(now - self.window_seconds)
 
-        if len(self._requests[client_ip]) >= self.max_requests:
-            return JSONResponse(
+        if self._requests[client_ip] >= self.max_requests:
+            response = JSONResponse(
                 status_code=429,
                 content={"detail": "Rate limit exceeded. Try again later."},
             )
+            await response(scope, receive, send)
+            return
+
+        buckets = self._buckets
+        if not buckets or buckets[-1][0] != now:
+            buckets.append((now, Counter()))
+        buckets[-1][1][client_ip] += 1
+        self._requests[client_ip] += 1
+        await self._app_call(scope, receive, send)
 
-        self._requests[client_ip].append(now)
-        return await call_next(request)
+    def _expire(self, cutoff: int) -> None:
+        """Drop buckets at or before *cutoff* and subtract their hits."""
+        buckets = self._buckets
+        totals = self._requests
+        while buckets and buckets[0][0] <= cutoff:
+            _, hits = buckets.popleft()
+            for ip, count in hits.items():
+                remaining = totals[ip] - count
+                if remaining > 0:
+                    totals[ip] = remaining
+                else:
+                    totals.pop(ip, None)
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config import settings
 
@@ -12,20 +11,45 @@ ALLOWED_CONTENT_TYPES = {
     "multipart/form-data",
 }
 
-MAX_BODY_SIZE = 50 * 1024 * 1024  # 50MB default
+# Paths that never carry a request body worth checking
+_EXEMPT_PATHS = frozenset({"/health", "/health/detail", "/docs", "/redoc", "/openapi.json"})
 
+_BODY_METHODS = frozenset({"POST", "PUT"})
 
-class SecurityMiddleware(BaseHTTPMiddleware):
-    """Input validation: content type checks, body size limits."""
 
-    async def dispatch(self, request: Request, call_next):
+class SecurityMiddleware:
+    """Input validation: content type checks, body size limits.
+
+    Pure ASGI middleware: headers are read straight from the scope, so
+    requests that need no check pass through without building a Request.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int | None = None) -> None:
+        self.app = app
+        # Read once: the limit is fixed for the lifetime of the app
+        self._max_body = max_body_size if max_body_size is not None else settings.max_upload_size
+        # Bound once so each request skips the attribute and __call__ lookup
+        self._app_call = app.__call__
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in _BODY_METHODS
+            or scope["path"] in _EXEMPT_PATHS
+        ):
+            await self._app_call(scope, receive, send)
+            return
+
         # Check body size for POST/PUT
-        if request.method in ("POST", "PUT"):
-            content_length = request.headers.get("content-length")
-            if content_length and int(content_length) > MAX_BODY_SIZE:
-                return JSONResponse(
-                    status_code=413,
-                    content={"detail": f"Request body too large. Maximum size: {MAX_BODY_SIZE} bytes."},
-                )
-
-        return await call_next(request)
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self._max_body:
+                    response = JSONResponse(
+                        status_code=413,
+                        content={"detail": f"Request body too large. Maximum size: {self._max_body} bytes."},
+                    )
+                    await response(scope, receive, send)
+                    return
+                break
+
+        await self._app_call(scope, receive, send)
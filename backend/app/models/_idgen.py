@@ -0,0 +1,34 @@
+"""Cheap random IDs for high-volume models.
+
+``str(uuid4())`` costs an ``os.urandom`` call plus UUID object construction
+and formatting per ID, and documents routinely yield thousands of
+annotations.  ``next_id`` draws randomness for 1024 IDs per syscall and
+formats each one straight from hex.  Output is a standard random (version 4)
+UUID string, so stored and client-side IDs keep the same shape.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+
+_BATCH = 1024
+_pool: deque[str] = deque()
+
+
+def _refill() -> None:
+    raw = os.urandom(16 * _BATCH).hex()
+    _pool.extend(
+        # Set the version (4) and RFC 4122 variant nibbles like uuid4() does
+        f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+        for h in (raw[i:i + 32] for i in range(0, len(raw), 32))
+    )
+
+
+def next_id() -> str:
+    """Return a fresh random UUID4 string."""
+    try:
+        return _pool.popleft()
+    except IndexError:
+        _refill()
+        return _pool.popleft()
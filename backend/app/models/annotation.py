@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from uuid import uuid4
+from typing import Literal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, TypeAdapter
+
+from app.models._idgen import next_id
+
+AnnotationState = Literal["preliminary", "confirmed", "rejected"]
+# A concept demoted by promote-backup keeps its place in the list as "backup"
+ConceptState = Literal["preliminary", "confirmed", "rejected", "backup"]
+FeedbackRating = Literal["up", "down", "dismissed"]
+# FolioService label types, plus "unknown" from undecodable pattern ids
+MatchType = Literal["preferred", "alternative", "hidden", "translation", "unknown"]
 
 
 class StageEvent(BaseModel):
@@ -15,9 +25,13 @@ class StageEvent(BaseModel):
     reasoning: str = ""
 
 
+# Dumps a whole lineage list in one pydantic-core call instead of N model_dump()s
+STAGE_EVENT_LIST_ADAPTER: TypeAdapter[list[StageEvent]] = TypeAdapter(list[StageEvent])
+
+
 class FeedbackItem(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid4()))
-    rating: str  # "up" or "down"
+    id: str = Field(default_factory=next_id)
+    rating: FeedbackRating
     stage: str | None = None  # target a specific stage event, or None for whole annotation
     comment: str = ""
     created_at: str = Field(
@@ -25,7 +39,11 @@ class FeedbackItem(BaseModel):
     )
 
 
-class Span(BaseModel):
+# Spans are built in bulk by the matchers from already-typed offsets, so they
+# are plain slotted dataclasses; pydantic still validates them wherever they
+# arrive nested in a model (API bodies, stored jobs).
+@dataclass(slots=True)
+class Span:
     start: int
     end: int
     text: str
@@ -41,8 +59,8 @@ class ConceptMatch(BaseModel):
     branch_color: str | None = None
     confidence: float = 0.0
     source: str = "llm"  # "llm", "entity_ruler", "semantic_ruler", "reconciled"
-    match_type: str | None = None  # "preferred" or "alternative" (from EntityRuler)
-    state: str = "preliminary"  # "preliminary", "confirmed", "rejected", "backup"
+    match_type: MatchType | None = None  # from EntityRuler
+    state: ConceptState = "preliminary"
     hierarchy_path: list[str] | None = None
     iri_hash: str | None = None
     children_count: int | None = None
@@ -59,25 +77,38 @@ class ConceptMatch(BaseModel):
     folio_country: str | None = None
     folio_deprecated: bool | None = None
 
-    @model_validator(mode="before")
-    @classmethod
-    def _migrate_branch(cls, data):
-        if isinstance(data, dict) and "branch" in data and "branches" not in data:
+    @staticmethod
+    def migrate_legacy(data: dict) -> dict:
+        """Rename the pre-multi-branch ``branch`` field to ``branches`` in place.
+
+        Only persisted jobs can carry the old schema, so this runs at the
+        storage read boundary rather than on every construction.
+        """
+        if "branch" in data and "branches" not in data:
             b = data.pop("branch")
             data["branches"] = [b] if b else []
         return data
 
+    @classmethod
+    def model_validate_legacy(cls, data: dict) -> ConceptMatch:
+        return cls.model_validate(cls.migrate_legacy(data))
+
 
 class Annotation(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=next_id)
     span: Span
     concepts: list[ConceptMatch] = Field(default_factory=list)
-    state: str = "preliminary"  # "preliminary", "confirmed", "rejected"
+    state: AnnotationState = "preliminary"
     dismissed_at: str | None = None  # ISO timestamp when user dismissed
     lineage: list[StageEvent] = Field(default_factory=list)
     feedback: list[FeedbackItem] = Field(default_factory=list)
 
 
+# Whole-list validate/dump in one pydantic-core call, like STAGE_EVENT_LIST_ADAPTER
+CONCEPT_MATCH_LIST_ADAPTER: TypeAdapter[list[ConceptMatch]] = TypeAdapter(list[ConceptMatch])
+ANNOTATION_LIST_ADAPTER: TypeAdapter[list[Annotation]] = TypeAdapter(list[Annotation])
+
+
 class IndividualClassLink(BaseModel):
     """Links an Individual to an OWL Class annotation."""
 
@@ -92,7 +123,7 @@ class IndividualClassLink(BaseModel):
 class Individual(BaseModel):
     """An OWL Individual — a named instance of one or more OWL Classes."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=next_id)
     name: str  # Canonical/normalized name
     mention_text: str  # Exact text from document
     individual_type: str = "named_entity"  # "legal_citation" | "named_entity"
@@ -119,7 +150,7 @@ class TripleLink(BaseModel):
 class SPOTriple(BaseModel):
     """A first-class subject-predicate-object triple extracted from text."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=next_id)
     subject: str
     predicate: str
     object: str
@@ -155,7 +186,7 @@ class SentencePOS(BaseModel):
 class PropertyAnnotation(BaseModel):
     """An OWL ObjectProperty match — a verb/relation found in the text."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=next_id)
     property_text: str  # Exact text from document
     folio_iri: str | None = None
     folio_label: str | None = None
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import enum
+from bisect import bisect_right
+from dataclasses import dataclass, field
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class DocumentFormat(str, enum.Enum):
@@ -30,12 +32,14 @@ class TextElement(BaseModel):
     level: int | None = None  # heading level
 
 
-class TextChunk(BaseModel):
+@dataclass(slots=True)
+class TextChunk:
+    """Internal chunk record; a slotted dataclass like ``Span``."""
     text: str
     start_offset: int
     end_offset: int
     chunk_index: int
-    sentences: list[str] = Field(default_factory=list)
+    sentences: list[str] = field(default_factory=list)
 
 
 class CanonicalText(BaseModel):
@@ -43,3 +47,41 @@ class CanonicalText(BaseModel):
     chunks: list[TextChunk] = Field(default_factory=list)
     elements: list[TextElement] = Field(default_factory=list)
     source_format: DocumentFormat = DocumentFormat.PLAIN_TEXT
+
+    # Columnar copies of the chunk offsets (not serialized) for bisect lookups.
+    # Keyed on the identity and length of ``chunks`` like JobResult's indexes.
+    _chunk_starts: list[int] = PrivateAttr(default_factory=list)
+    _chunk_ends: list[int] = PrivateAttr(default_factory=list)
+    _chunks_sorted: bool = PrivateAttr(default=True)
+    _chunk_offsets_key: tuple[int, int] = PrivateAttr(default=(0, -1))
+
+    def _rebuild_chunk_offsets(self) -> None:
+        starts = [c.start_offset for c in self.chunks]
+        ends = [c.end_offset for c in self.chunks]
+        self._chunk_starts = starts
+        self._chunk_ends = ends
+        # Chunkers emit chunks in document order; bisect relies on that
+        self._chunks_sorted = all(
+            starts[i] <= starts[i + 1] and ends[i] <= ends[i + 1] for i in range(len(starts) - 1)
+        )
+        self._chunk_offsets_key = (id(self.chunks), len(self.chunks))
+
+    def chunks_containing(self, start: int, end: int) -> list[int]:
+        """Indices of the chunks that fully contain ``[start, end]``, ascending.
+
+        Overlapping chunks can both contain a span.  O(log n + k) via bisect
+        for chunks in document order; falls back to a linear scan otherwise.
+        """
+        if self._chunk_offsets_key != (id(self.chunks), len(self.chunks)):
+            self._rebuild_chunk_offsets()
+        starts, ends = self._chunk_starts, self._chunk_ends
+        if not self._chunks_sorted:
+            return [i for i in range(len(starts)) if start >= starts[i] and end <= ends[i]]
+        hits = []
+        i = bisect_right(starts, start) - 1
+        # Ends are non-decreasing, so walking left stops at the first chunk ending too early
+        while i >= 0 and ends[i] >= end:
+            hits.append(i)
+            i -= 1
+        hits.reverse()
+        return hits
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pydantic import BaseModel, Field
 
+from app.models.annotation import FeedbackRating
+
 
 class FeedbackEntry(BaseModel):
     """Self-contained feedback record: user opinion + system lineage snapshot.
@@ -13,7 +15,7 @@ class FeedbackEntry(BaseModel):
     id: str
     job_id: str
     annotation_id: str
-    rating: str  # "up" or "down"
+    rating: FeedbackRating
     stage: str | None = None
     comment: str = ""
     # Concept context (self-contained even after job is deleted)
@@ -26,14 +28,33 @@ class FeedbackEntry(BaseModel):
     created_at: str = ""
 
 
+class FeedbackHeader(BaseModel):
+    """Scalar fields of a stored FeedbackEntry.
+
+    Validating a feedback file against this skips the comment and lineage
+    payloads, which the index and insights scans never read.
+    """
+
+    id: str
+    job_id: str
+    annotation_id: str
+    rating: FeedbackRating
+    stage: str | None = None
+    folio_iri: str | None = None
+    folio_label: str | None = None
+    created_at: str = ""
+
+
 class InsightsSummary(BaseModel):
-    """Aggregated feedback insights."""
+    """Aggregated feedback insights (built once per request, never mutated)."""
+
+    model_config = {"frozen": True}
 
     total_feedback: int = 0
     thumbs_up: int = 0
     thumbs_down: int = 0
     total_dismissed: int = 0
-    by_stage: dict[str, dict[str, int]] = {}  # {"entity_ruler": {"up": 5, "down": 2}}
-    most_downvoted_concepts: list[dict] = []
-    most_dismissed_concepts: list[dict] = []
-    recent_feedback: list[FeedbackEntry] = []
+    by_stage: dict[str, dict[str, int]] = Field(default_factory=dict)  # {"entity_ruler": {"up": 5, "down": 2}}
+    most_downvoted_concepts: list[dict] = Field(default_factory=list)
+    most_dismissed_concepts: list[dict] = Field(default_factory=list)
+    recent_feedback: list[FeedbackEntry] = Field(default_factory=list)
@@ -4,12 +4,19 @@ import enum
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from app.models.annotation import Annotation, Individual, PropertyAnnotation, SPOTriple
 from app.models.document import CanonicalText, DocumentInput
 
 
+_UTC = timezone.utc
+
+
+def _now() -> datetime:
+    return datetime.now(_UTC)
+
+
 class JobStatus(str, enum.Enum):
     PENDING = "pending"
     INGESTING = "ingesting"
@@ -34,12 +41,121 @@ class JobResult(BaseModel):
     triples: list[SPOTriple] = Field(default_factory=list)
     metadata: dict = Field(default_factory=dict)
 
+    # Lazily built id → Annotation index (not serialized).  Keyed on the
+    # identity and length of ``annotations`` so reassigning, appending to or
+    # removing from the list triggers a rebuild on the next lookup.
+    _annotation_index: dict[str, Annotation] = PrivateAttr(default_factory=dict)
+    _annotation_index_key: tuple[int, int] = PrivateAttr(default=(0, -1))
+    # Secondary primary-IRI → annotations index, same invalidation scheme.
+    _primary_iri_index: dict[str, list[Annotation]] = PrivateAttr(default_factory=dict)
+    _primary_iri_index_key: tuple[int, int] = PrivateAttr(default=(0, -1))
+
+    def _rebuild_annotation_index(self) -> None:
+        self._annotation_index = {a.id: a for a in self.annotations}
+        self._annotation_index_key = (id(self.annotations), len(self.annotations))
+
+    def get_annotation(self, annotation_id: str) -> Annotation | None:
+        """Return the annotation with *annotation_id*, or None (O(1) amortized)."""
+        if self._annotation_index_key != (id(self.annotations), len(self.annotations)):
+            self._rebuild_annotation_index()
+        ann = self._annotation_index.get(annotation_id)
+        if ann is None or ann.id != annotation_id:
+            # Miss or stale entry (e.g. an element replaced in place): rebuild once
+            self._rebuild_annotation_index()
+            ann = self._annotation_index.get(annotation_id)
+        return ann
+
+    def _rebuild_primary_iri_index(self) -> None:
+        index: dict[str, list[Annotation]] = {}
+        for a in self.annotations:
+            if a.concepts and a.concepts[0].folio_iri is not None:
+                index.setdefault(a.concepts[0].folio_iri, []).append(a)
+        self._primary_iri_index = index
+        self._primary_iri_index_key = (id(self.annotations), len(self.annotations))
+
+    def annotations_by_primary_iri(self, folio_iri: str) -> list[Annotation]:
+        """Return the annotations whose primary concept (``concepts[0]``) is *folio_iri*.
+
+        Callers that change an annotation's primary concept must report it via
+        ``update_primary_iri`` so the index stays current.
+        """
+        if self._primary_iri_index_key != (id(self.annotations), len(self.annotations)):
+            self._rebuild_primary_iri_index()
+        return [
+            a for a in self._primary_iri_index.get(folio_iri, ())
+            if a.concepts and a.concepts[0].folio_iri == folio_iri
+        ]
+
+    def update_primary_iri(self, annotation: Annotation, old_iri: str | None) -> None:
+        """Move *annotation* to its new primary-IRI bucket after a promotion."""
+        if self._primary_iri_index_key != (id(self.annotations), len(self.annotations)):
+            return  # Index is stale anyway and will be rebuilt on next use
+        bucket = self._primary_iri_index.get(old_iri) if old_iri is not None else None
+        if bucket:
+            for i, a in enumerate(bucket):
+                if a is annotation:
+                    del bucket[i]
+                    break
+        new_iri = annotation.concepts[0].folio_iri if annotation.concepts else None
+        if new_iri is not None:
+            self._primary_iri_index.setdefault(new_iri, []).append(annotation)
+
+    def draft(self) -> JobResult:
+        """Shallow copy with its own annotation list, for an editor to change.
+
+        Indexes that are already built are carried over instead of rebuilt.
+        The annotations themselves stay shared, so editors take each one via
+        ``annotation_for_update`` before changing it.
+        """
+        draft = self.model_copy()
+        draft.annotations = list(self.annotations)
+        key = (id(draft.annotations), len(draft.annotations))
+        current = (id(self.annotations), len(self.annotations))
+        if self._annotation_index_key == current:
+            draft._annotation_index = dict(self._annotation_index)
+            draft._annotation_index_key = key
+        else:
+            draft._annotation_index, draft._annotation_index_key = {}, (0, -1)
+        if self._primary_iri_index_key == current:
+            draft._primary_iri_index = {
+                iri: list(bucket) for iri, bucket in self._primary_iri_index.items()
+            }
+            draft._primary_iri_index_key = key
+        else:
+            draft._primary_iri_index, draft._primary_iri_index_key = {}, (0, -1)
+        return draft
+
+    def annotation_for_update(self, annotation_id: str) -> Annotation | None:
+        """Swap in a private deep copy of the annotation and return it.
+
+        On a ``draft`` this is copy-on-write: the original job keeps its
+        annotation untouched until the draft is saved in its place.
+        """
+        ann = self.get_annotation(annotation_id)
+        if ann is None:
+            return None
+        copy = ann.model_copy(deep=True)
+        for i, a in enumerate(self.annotations):
+            if a is ann:
+                self.annotations[i] = copy
+                break
+        self._annotation_index[annotation_id] = copy
+        iri = ann.concepts[0].folio_iri if ann.concepts else None
+        if self._primary_iri_index_key == (id(self.annotations), len(self.annotations)):
+            bucket = self._primary_iri_index.get(iri) if iri is not None else None
+            for i, a in enumerate(bucket or ()):
+                if a is ann:
+                    bucket[i] = copy
+                    break
+        return copy
+
 
 class Job(BaseModel):
     id: UUID = Field(default_factory=uuid4)
     status: JobStatus = JobStatus.PENDING
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_now)
+    # A new job starts with updated_at == created_at (one clock read, not two)
+    updated_at: datetime = Field(default_factory=lambda data: data["created_at"])
     input: DocumentInput | None = None
     result: JobResult = Field(default_factory=JobResult)
     error: str | None = None
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+
+# Upper bound on entries in a batched settings request
+MAX_BATCH_REQUESTS = 32
 
 
 class LLMProviderType(str, Enum):
@@ -34,6 +38,10 @@ class ConnectionTestRequest(BaseModel):
     api_key: str | None = None
 
 
+class ConnectionTestBatchRequest(BaseModel):
+    requests: list[ConnectionTestRequest] = Field(..., max_length=MAX_BATCH_REQUESTS)
+
+
 class ConnectionTestResponse(BaseModel):
     success: bool
     message: str
@@ -44,3 +52,7 @@ class ModelListRequest(BaseModel):
     provider: LLMProviderType
     base_url: str | None = None
     api_key: str | None = None
+
+
+class ModelListBatchRequest(BaseModel):
+    requests: list[ModelListRequest] = Field(..., max_length=MAX_BATCH_REQUESTS)
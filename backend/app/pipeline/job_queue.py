@@ -0,0 +1,104 @@
+"""Bounded worker pool for background pipeline runs."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from app.config import settings
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFull(Exception):
+    """Raised when the queue cannot accept another job."""
+
+
+class JobQueue:
+    """Runs pipeline jobs on a fixed set of worker tasks fed by an asyncio.Queue.
+
+    At most ``max_workers`` pipelines execute at once; up to ``max_queued``
+    further jobs wait their turn, and submissions beyond that are refused.
+    Admission is decided synchronously in ``submit``, so concurrent requests
+    cannot race past the limit.  Workers are started at app startup (or lazily
+    on first submit) and are restarted if the loop changes (e.g. between test
+    clients); the instance holds strong references to them.
+    """
+
+    _instance: JobQueue | None = None
+
+    def __init__(self, max_workers: int | None = None, max_queued: int | None = None) -> None:
+        self.max_workers = max_workers or settings.max_concurrent_jobs
+        self.max_queued = max_queued if max_queued is not None else settings.max_queued_jobs
+        self._queue: asyncio.Queue | None = None
+        self._workers: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._running = 0
+
+    @classmethod
+    def get_instance(cls) -> JobQueue:
+        if cls._instance is None:
+            cls._instance = JobQueue()
+        return cls._instance
+
+    @property
+    def running(self) -> int:
+        """Number of jobs currently executing."""
+        return self._running
+
+    @property
+    def queued(self) -> int:
+        """Number of jobs waiting for a free worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self) -> None:
+        """Spawn the worker tasks on the running loop (idempotent)."""
+        self._ensure_workers()
+
+    def _ensure_workers(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._queue is None:
+            self._queue = asyncio.Queue(maxsize=max(self.max_queued, 1))
+            self._workers = [
+                loop.create_task(self._worker()) for _ in range(self.max_workers)
+            ]
+            self._loop = loop
+            self._running = 0
+        return self._queue
+
+    def submit(self, orchestrator, job: Job) -> None:
+        """Enqueue *job* to be run by *orchestrator*; raises JobQueueFull when saturated."""
+        queue = self._ensure_workers()
+        try:
+            queue.put_nowait((orchestrator, job))
+        except asyncio.QueueFull:
+            raise JobQueueFull(
+                f"Too many concurrent jobs ({self._running} running, "
+                f"{queue.qsize()} queued)"
+            ) from None
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        while True:
+            orchestrator, job = await queue.get()
+            self._running += 1
+            try:
+                await orchestrator.run(job)
+            except Exception:
+                logger.exception("Background pipeline crashed for job %s", job.id)
+            finally:
+                self._running -= 1
+                queue.task_done()
+
+    async def shutdown(self) -> None:
+        """Cancel all workers (queued jobs are dropped)."""
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._loop = None
+        self._running = 0
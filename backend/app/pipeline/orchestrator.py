@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
+from operator import attrgetter
 
+from app.models.annotation import ANNOTATION_LIST_ADAPTER
 from app.models.job import Job, JobStatus
 from app.pipeline.stages.base import PipelineStage
 from app.pipeline.stages.ingestion_stage import IngestionStage
@@ -22,7 +25,9 @@ from app.pipeline.stages.property_stage import EarlyPropertyStage, LLMPropertySt
 from app.pipeline.stages.triple_stage import EarlyTripleStage
 from app.pipeline.stages.document_type_stage import DocumentTypeStage
 from app.pipeline.stages.rerank_stage import ContextualRerankStage
+from app.services.concept.area_of_law_assessor import AreaOfLawAssessor
 from app.services.llm.base import LLMProvider
+from app.services.quality.document_type_checker import DocumentTypeChecker
 from app.storage.job_store import JobStore
 
 logger = logging.getLogger(__name__)
@@ -33,8 +38,13 @@ LLM_TASKS = ("classifier", "extractor", "concept", "branch_judge", "area_of_law"
 # Map task names to TaskLLMs field names (needed when task name is a Python builtin)
 _TASK_FIELD_MAP: dict[str, str] = {"property": "property_llm"}
 
+# Reads (llm_{task}_provider, llm_{task}_model) off the live settings object
+_TASK_SETTING_GETTERS = {
+    task: attrgetter(f"llm_{task}_provider", f"llm_{task}_model") for task in LLM_TASKS
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class TaskLLMs:
     """Resolved LLM providers for each pipeline task.
 
@@ -93,7 +103,7 @@ def _get_embedding_service():
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineConfig:
     """Configuration for the three-phase parallel pipeline."""
     pre_parallel: list[PipelineStage] = field(default_factory=list)
@@ -194,68 +204,79 @@ def build_stages(
     LLM-dependent stages are included only when an LLM provider is available;
     otherwise they are skipped gracefully.
     """
-    embedding_service = _get_embedding_service()
+    return _flatten_config(build_pipeline_config(llm, task_llms=task_llms))
 
-    concept_llm = (task_llms.concept if task_llms else llm) or llm
-    branch_judge_llm = (task_llms.branch_judge if task_llms else llm) or llm
-    classifier_llm = (task_llms.classifier if task_llms else llm) or llm
-    extractor_llm = (task_llms.extractor if task_llms else llm) or llm
-    individual_llm = (task_llms.individual if task_llms else llm) or llm
-    property_llm = (task_llms.property_llm if task_llms else llm) or llm
-    document_type_llm = (task_llms.document_type if task_llms else llm) or llm
 
-    stages: list[PipelineStage] = [
-        IngestionStage(),
-        NormalizationStage(),
-        EntityRulerStage(embedding_service=embedding_service),
+def _flatten_config(config: PipelineConfig) -> list[PipelineStage]:
+    """Sequential order of *config*'s stages, sharing the same stage objects."""
+    parallel = (
+        config.entity_ruler, config.early_individual, config.early_property,
+        config.early_triple, config.document_type, config.llm_concept,
+    )
+    return [
+        *config.pre_parallel,
+        *(stage for stage in parallel if stage is not None),
+        *config.post_parallel,
     ]
 
-    # Early individual extraction (citations + regex/spaCy) — fast, no LLM
-    stages.append(EarlyIndividualStage())
-
-    # Early property extraction (Aho-Corasick) — fast, no LLM
-    stages.append(EarlyPropertyStage())
 
-    # Early triple extraction (dependency parsing) — fast, no LLM
-    stages.append(EarlyTripleStage())
+def _stage_layers(stages: list[PipelineStage]) -> list[list[PipelineStage]]:
+    """Group consecutive stages that may run concurrently.
 
-    # Early document type classification — LLM-based
-    if document_type_llm is not None:
-        stages.append(DocumentTypeStage(document_type_llm))
-
-    if concept_llm is not None:
-        stages.append(LLMConceptStage(concept_llm))
+    A stage joins the current layer only if it is independent of every stage
+    already in it; otherwise it starts a new layer, preserving list order.
+    """
+    layers: list[list[PipelineStage]] = []
+    for stage in stages:
+        if layers and all(s.name in stage.independent_of for s in layers[-1]):
+            layers[-1].append(stage)
+        else:
+            layers.append([stage])
+    return layers
 
-    stages.append(ReconciliationStage(embedding_service=embedding_service))
-    stages.append(ResolutionStage(embedding_service=embedding_service))
 
-    if concept_llm is not None:
-        stages.append(ContextualRerankStage(concept_llm))
+# FOLIO instance and label settings the cached pipelines were built against
+_pipeline_folio: object = None
+_pipeline_translations: bool | None = None
 
-    if branch_judge_llm is not None:
-        stages.append(BranchJudgeStage(branch_judge_llm))
 
-    stages.append(StringMatchStage())
+@functools.lru_cache(maxsize=16)
+def _cached_pipeline(
+    llm: LLMProvider | None,
+    task_llm_key: tuple[LLMProvider | None, ...],
+    embedding_service: object,
+) -> tuple[PipelineConfig, list[PipelineStage]]:
+    config = build_pipeline_config(llm, task_llms=TaskLLMs(*task_llm_key))
+    return config, _flatten_config(config)
 
-    # LLM individual linking (after StringMatch, needs resolved classes)
-    stages.append(LLMIndividualStage(llm=individual_llm))
-
-    # LLM property linking (after LLMIndividual, needs resolved classes)
-    stages.append(LLMPropertyStage(llm=property_llm))
 
-    stages.append(TripleEnrichmentStage())
+def get_pipeline(
+    llm: LLMProvider | None = None,
+    task_llms: TaskLLMs | None = None,
+) -> tuple[PipelineConfig, list[PipelineStage]]:
+    """Return a shared (config, stages) pair for this LLM configuration.
+
+    Stages carry expensive lazily-built state (e.g. the EntityRuler's FOLIO
+    patterns), so jobs with the same providers reuse one set instead of
+    rebuilding it per request.  Providers come from ``get_shared_provider``,
+    so identical settings yield identical keys.  The cache is dropped when the
+    FOLIO ontology is reloaded or translation matching is toggled, so stages
+    never serve stale patterns.
+    """
+    global _pipeline_folio, _pipeline_translations
+    from app.config import settings
+    from app.services.folio.folio_service import FolioService
 
-    # MetadataStage runs absolute last — it uses all pipeline outputs as context
-    if classifier_llm is not None or extractor_llm is not None:
-        stages.append(
-            MetadataStage(
-                classifier_llm or extractor_llm,
-                classifier_llm=classifier_llm,
-                extractor_llm=extractor_llm,
-            )
-        )
+    folio = FolioService.get_instance()._folio
+    translations = settings.translation_matching_enabled
+    if folio is not _pipeline_folio or translations != _pipeline_translations:
+        _cached_pipeline.cache_clear()
+        _pipeline_folio = folio
+        _pipeline_translations = translations
 
-    return stages
+    task_llms = task_llms or TaskLLMs()
+    task_llm_key = tuple(getattr(task_llms, f.name) for f in fields(TaskLLMs))
+    return _cached_pipeline(llm, task_llm_key, _get_embedding_service())
 
 
 def _make_llm(provider_name: str, model: str) -> LLMProvider | None:
@@ -263,17 +284,11 @@ def _make_llm(provider_name: str, model: str) -> LLMProvider | None:
 
     Returns None if the provider is unknown or no API key is available.
     """
-    from app.models.llm_models import LLMProviderType
-    from app.services.llm.registry import REQUIRES_API_KEY, get_provider
+    from app.services.llm.registry import REQUIRES_API_KEY, get_shared_provider, resolve_provider_type
     from app.api.routes.settings import _get_api_key_for_provider
 
-    normalized = provider_name.replace("-", "_")
-    if normalized == "lm_studio":
-        normalized = "lmstudio"
-
-    try:
-        provider_type = LLMProviderType(normalized)
-    except ValueError:
+    provider_type = resolve_provider_type(provider_name)
+    if provider_type is None:
         logger.warning("Unknown LLM provider %s", provider_name)
         return None
 
@@ -283,11 +298,7 @@ def _make_llm(provider_name: str, model: str) -> LLMProvider | None:
         logger.warning("No API key for %s", provider_type.value)
         return None
 
-    return get_provider(
-        provider_type=provider_type,
-        api_key=api_key,
-        model=model or None,
-    )
+    return get_shared_provider(provider_type, model or None, api_key)
 
 
 def _try_get_llm() -> LLMProvider | None:
@@ -318,8 +329,7 @@ def _try_get_task_llm(task: str, fallback: LLMProvider | None) -> LLMProvider |
     """
     from app.config import settings
 
-    task_provider = getattr(settings, f"llm_{task}_provider", "")
-    task_model = getattr(settings, f"llm_{task}_model", "")
+    task_provider, task_model = _TASK_SETTING_GETTERS[task](settings)
 
     # Per-task override takes precedence
     if task_provider:
@@ -365,23 +375,83 @@ class PipelineOrchestrator:
         stages: list[PipelineStage] | None = None,
         llm: LLMProvider | None = None,
         task_llms: TaskLLMs | None = None,
+        config: PipelineConfig | None = None,
     ) -> None:
         self.job_store = job_store
         self._llm = llm
         self._task_llms = task_llms
         self._config: PipelineConfig | None = None
-        if stages is not None:
+        if config is not None:
+            # Prebuilt parallel pipeline (see get_pipeline)
+            self._config = config
+            self.stages = stages or []
+        elif stages is not None:
             # Legacy flat mode: use stages list directly
             self.stages = stages
         else:
-            # New parallel mode: build PipelineConfig
-            self._config = build_pipeline_config(llm, task_llms=task_llms)
-            self.stages = build_stages(llm, task_llms=task_llms)  # kept for backward compat
+            # New parallel mode: shared PipelineConfig for these providers
+            self._config, self.stages = get_pipeline(llm, task_llms)  # stages kept for backward compat
 
     async def run(self, job: Job) -> Job:
-        if self._config is not None:
-            return await self._run_parallel(job)
-        return await self._run_flat(job)
+        # Stages mutate the job in place between phase-boundary saves; pin it
+        # so readers see the live object even if its cache entry expires.
+        self.job_store.pin(job)
+        try:
+            if self._config is not None:
+                return await self._run_parallel(job)
+            return await self._run_flat(job)
+        finally:
+            self.job_store.unpin(job.id)
+
+    async def _post_completion(self, job: Job) -> None:
+        """LLM checks that run once the job is already COMPLETED and visible.
+
+        The area-of-law assessment and the document type cross-check read
+        disjoint inputs, so they run concurrently and share one save.
+        """
+        aol_llm = (self._task_llms.area_of_law if self._task_llms else None) or self._llm
+        dt_llm = (self._task_llms.document_type if self._task_llms else None) or self._llm
+
+        async def assess_area_of_law() -> bool:
+            try:
+                areas = await AreaOfLawAssessor(aol_llm).assess(job)
+            except Exception as e:
+                logger.warning("Area of law assessment failed: %s", e)
+                return False
+            job.result.metadata["areas_of_law"] = areas
+            _log_activity(job, "area_of_law",
+                f"Classified: {', '.join(a['area'] for a in areas)}")
+            return True
+
+        async def check_document_type() -> bool:
+            try:
+                signals = await DocumentTypeChecker(dt_llm).check(job)
+            except Exception as e:
+                logger.warning("Document type quality check failed: %s", e)
+                return False
+            if not signals:
+                return False
+            job.result.metadata["quality_signals"] = signals
+            _log_activity(job, "quality_check",
+                f"Document type cross-check: {len(signals)} signal(s)")
+            return True
+
+        checks = []
+        if aol_llm is not None:
+            checks.append(assess_area_of_law())
+        if dt_llm is not None and job.result.metadata.get("self_identified_type"):
+            checks.append(check_document_type())
+        if any(await asyncio.gather(*checks)):
+            await self.job_store.save(job)
+
+    async def _run_parallel_stage(self, stage: PipelineStage, job: Job) -> None:
+        """Run a stage alongside others; a failure is logged and does not stop its siblings."""
+        logger.info("Running stage %s for job %s (parallel)", stage.name, job.id)
+        try:
+            await stage.execute(job)
+            job.updated_at = datetime.now(timezone.utc)
+        except Exception as e:
+            logger.warning("Stage %s failed for job %s: %s — continuing", stage.name, job.id, e)
 
     async def _run_parallel(self, job: Job) -> Job:
         """Three-phase pipeline: pre-parallel → parallel(EntityRuler ∥ LLM) → post-parallel."""
@@ -401,97 +471,26 @@ class PipelineOrchestrator:
                     )
                     continue
                 job.updated_at = datetime.now(timezone.utc)
-                await self.job_store.save(job)
 
             _log_activity(job, "orchestrator", "Ingestion and normalization complete")
 
-            # Phase 2: Parallel EntityRuler and LLM
+            # Phase 2: Parallel EntityRuler and LLM.  Stages mutate the cached
+            # job in place, so progress readers see it without per-stage
+            # writes; the ENRICHING save doubles as the phase-1 checkpoint.
             job.status = JobStatus.ENRICHING
             job.updated_at = datetime.now(timezone.utc)
             await self.job_store.save(job)
 
             _log_activity(job, "orchestrator", "Running EntityRuler, LLM, early individuals, early properties, early triples, and document type in parallel...")
 
-            async def run_entity_ruler(j: Job) -> None:
-                if config.entity_ruler is None:
-                    return
-                logger.info("Running stage %s for job %s (parallel)", config.entity_ruler.name, j.id)
-                try:
-                    await config.entity_ruler.execute(j)
-                    j.updated_at = datetime.now(timezone.utc)
-                    await self.job_store.save(j)
-                except Exception as e:
-                    logger.warning("Stage %s failed for job %s: %s — continuing",
-                                   config.entity_ruler.name, j.id, e)
-
-            async def run_llm_concept(j: Job) -> None:
-                if config.llm_concept is None:
-                    return
-                logger.info("Running stage %s for job %s (parallel)", config.llm_concept.name, j.id)
-                try:
-                    await config.llm_concept.execute(j)
-                    j.updated_at = datetime.now(timezone.utc)
-                    await self.job_store.save(j)
-                except Exception as e:
-                    logger.warning("Stage %s failed for job %s: %s — continuing",
-                                   config.llm_concept.name, j.id, e)
-
-            async def run_early_individual(j: Job) -> None:
-                if config.early_individual is None:
-                    return
-                logger.info("Running stage %s for job %s (parallel)", config.early_individual.name, j.id)
-                try:
-                    await config.early_individual.execute(j)
-                    j.updated_at = datetime.now(timezone.utc)
-                    await self.job_store.save(j)
-                except Exception as e:
-                    logger.warning("Stage %s failed for job %s: %s — continuing",
-                                   config.early_individual.name, j.id, e)
-
-            async def run_early_property(j: Job) -> None:
-                if config.early_property is None:
-                    return
-                logger.info("Running stage %s for job %s (parallel)", config.early_property.name, j.id)
-                try:
-                    await config.early_property.execute(j)
-                    j.updated_at = datetime.now(timezone.utc)
-                    await self.job_store.save(j)
-                except Exception as e:
-                    logger.warning("Stage %s failed for job %s: %s — continuing",
-                                   config.early_property.name, j.id, e)
-
-            async def run_early_triple(j: Job) -> None:
-                if config.early_triple is None:
-                    return
-                logger.info("Running stage %s for job %s (parallel)", config.early_triple.name, j.id)
-                try:
-                    await config.early_triple.execute(j)
-                    j.updated_at = datetime.now(timezone.utc)
-                    await self.job_store.save(j)
-                except Exception as e:
-                    logger.warning("Stage %s failed for job %s: %s — continuing",
-                                   config.early_triple.name, j.id, e)
-
-            async def run_document_type(j: Job) -> None:
-                if config.document_type is None:
-                    return
-                logger.info("Running stage %s for job %s (parallel)", config.document_type.name, j.id)
-                try:
-                    await config.document_type.execute(j)
-                    j.updated_at = datetime.now(timezone.utc)
-                    await self.job_store.save(j)
-                except Exception as e:
-                    logger.warning("Stage %s failed for job %s: %s — continuing",
-                                   config.document_type.name, j.id, e)
-
-            await asyncio.gather(
-                run_entity_ruler(job),
-                run_llm_concept(job),
-                run_early_individual(job),
-                run_early_property(job),
-                run_early_triple(job),
-                run_document_type(job),
+            parallel = (
+                config.entity_ruler, config.llm_concept, config.early_individual,
+                config.early_property, config.early_triple, config.document_type,
             )
+            async with asyncio.TaskGroup() as tg:
+                for stage in parallel:
+                    if stage is not None:
+                        tg.create_task(self._run_parallel_stage(stage, job))
 
             # Merge LLM preliminary annotations that don't overlap with EntityRuler
             llm_prelim = job.result.metadata.pop("llm_preliminary_annotations", [])
@@ -500,24 +499,32 @@ class PipelineOrchestrator:
                     (a.span.start, a.span.end, a.concepts[0].concept_text.lower())
                     for a in job.result.annotations if a.concepts
                 }
-                from app.models.annotation import Annotation
-                merged = 0
+                new_dicts = []
                 for ann_dict in llm_prelim:
                     span = ann_dict.get("span", {})
                     concepts = ann_dict.get("concepts", [])
                     text_key = concepts[0]["concept_text"].lower() if concepts else ""
                     if (span.get("start"), span.get("end"), text_key) not in existing_spans:
-                        job.result.annotations.append(Annotation(**ann_dict))
-                        merged += 1
+                        new_dicts.append(ann_dict)
+                job.result.annotations.extend(ANNOTATION_LIST_ADAPTER.validate_python(new_dicts))
+                merged = len(new_dicts)
                 if merged:
                     _log_activity(job, "orchestrator", f"Merged {merged} LLM preliminary annotations")
                     job.updated_at = datetime.now(timezone.utc)
-                    await self.job_store.save(job)
 
             _log_activity(job, "orchestrator", "Parallel enrichment complete")
+            # Phase checkpoint: one write for all parallel stages and the merge
+            await self.job_store.save(job)
 
-            # Phase 3: Sequential post-parallel stages
-            for stage in config.post_parallel:
+            # Phase 3: Post-parallel stages, in order except where a stage
+            # declares it can overlap the ones before it
+            for layer in _stage_layers(config.post_parallel):
+                if len(layer) > 1:
+                    async with asyncio.TaskGroup() as tg:
+                        for stage in layer:
+                            tg.create_task(self._run_parallel_stage(stage, job))
+                    continue
+                stage = layer[0]
                 logger.info("Running stage %s for job %s", stage.name, job.id)
                 try:
                     job = await stage.execute(job)
@@ -528,41 +535,13 @@ class PipelineOrchestrator:
                     )
                     continue
                 job.updated_at = datetime.now(timezone.utc)
-                await self.job_store.save(job)
 
             _log_activity(job, "orchestrator", f"Pipeline complete \u2014 {len(job.result.annotations)} annotations, {len(job.result.properties)} properties")
             job.status = JobStatus.COMPLETED
             job.updated_at = datetime.now(timezone.utc)
             await self.job_store.save(job)
 
-            # Post-completion: Area of Law assessment (runs after pipeline results are available)
-            aol_llm = (self._task_llms.area_of_law if self._task_llms else None) or self._llm
-            if aol_llm is not None:
-                try:
-                    from app.services.concept.area_of_law_assessor import AreaOfLawAssessor
-                    assessor = AreaOfLawAssessor(aol_llm)
-                    areas = await assessor.assess(job)
-                    job.result.metadata["areas_of_law"] = areas
-                    _log_activity(job, "area_of_law",
-                        f"Classified: {', '.join(a['area'] for a in areas)}")
-                    await self.job_store.save(job)
-                except Exception as e:
-                    logger.warning("Area of law assessment failed: %s", e)
-
-            # Post-completion: Document type quality cross-check
-            dt_llm = (self._task_llms.document_type if self._task_llms else None) or self._llm
-            if dt_llm is not None and job.result.metadata.get("self_identified_type"):
-                try:
-                    from app.services.quality.document_type_checker import DocumentTypeChecker
-                    checker = DocumentTypeChecker(dt_llm)
-                    signals = await checker.check(job)
-                    if signals:
-                        job.result.metadata["quality_signals"] = signals
-                        _log_activity(job, "quality_check",
-                            f"Document type cross-check: {len(signals)} signal(s)")
-                        await self.job_store.save(job)
-                except Exception as e:
-                    logger.warning("Document type quality check failed: %s", e)
+            await self._post_completion(job)
 
         except Exception as e:
             logger.exception("Pipeline failed for job %s", job.id)
@@ -588,40 +567,12 @@ class PipelineOrchestrator:
                     )
                     continue
                 job.updated_at = datetime.now(timezone.utc)
-                await self.job_store.save(job)
 
             job.status = JobStatus.COMPLETED
             job.updated_at = datetime.now(timezone.utc)
             await self.job_store.save(job)
 
-            # Post-completion: Area of Law assessment (runs after pipeline results are available)
-            aol_llm = (self._task_llms.area_of_law if self._task_llms else None) or self._llm
-            if aol_llm is not None:
-                try:
-                    from app.services.concept.area_of_law_assessor import AreaOfLawAssessor
-                    assessor = AreaOfLawAssessor(aol_llm)
-                    areas = await assessor.assess(job)
-                    job.result.metadata["areas_of_law"] = areas
-                    _log_activity(job, "area_of_law",
-                        f"Classified: {', '.join(a['area'] for a in areas)}")
-                    await self.job_store.save(job)
-                except Exception as e:
-                    logger.warning("Area of law assessment failed: %s", e)
-
-            # Post-completion: Document type quality cross-check
-            dt_llm = (self._task_llms.document_type if self._task_llms else None) or self._llm
-            if dt_llm is not None and job.result.metadata.get("self_identified_type"):
-                try:
-                    from app.services.quality.document_type_checker import DocumentTypeChecker
-                    checker = DocumentTypeChecker(dt_llm)
-                    signals = await checker.check(job)
-                    if signals:
-                        job.result.metadata["quality_signals"] = signals
-                        _log_activity(job, "quality_check",
-                            f"Document type cross-check: {len(signals)} signal(s)")
-                        await self.job_store.save(job)
-                except Exception as e:
-                    logger.warning("Document type quality check failed: %s", e)
+            await self._post_completion(job)
 
         except Exception as e:
             logger.exception("Pipeline failed for job %s", job.id)
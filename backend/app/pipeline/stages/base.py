@@ -8,6 +8,10 @@ from app.models.job import Job
 
 
 class PipelineStage(abc.ABC):
+    # Names of stages listed earlier in the same phase whose output this stage
+    # does not read; the orchestrator may run it concurrently with them.
+    independent_of: frozenset[str] = frozenset()
+
     @property
     @abc.abstractmethod
     def name(self) -> str: ...
@@ -67,6 +67,7 @@ class EntityRulerStage(PipelineStage):
                 self._label_to_concepts[label_key] = entries
         except Exception:
             logger.warning("Failed to load FOLIO patterns into EntityRuler", exc_info=True)
+            return
         self._patterns_loaded = True
 
     @property
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from uuid import uuid4
 
+from app.models._idgen import next_id
 from app.models.job import Job, JobStatus
 from app.pipeline.stages.base import PipelineStage
 from app.services.concept.llm_concept_identifier import LLMConceptIdentifier
@@ -85,7 +85,7 @@ class LLMConceptStage(PipelineStage):
             if concept is None:
                 continue
             annotations.append({
-                "id": str(uuid4()),
+                "id": next_id(),
                 "span": {
                     "start": m.start,
                     "end": m.end,
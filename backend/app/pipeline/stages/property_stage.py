@@ -81,9 +81,12 @@ class EarlyPropertyStage(PipelineStage):
 class LLMPropertyStage(PipelineStage):
     """LLM property extraction + domain/range cross-linking.
 
-    Runs after LLMIndividual when resolved class annotations are available.
+    Runs after StringMatch when resolved class annotations are available.
+    It reads annotations and properties only, so it overlaps LLMIndividual.
     """
 
+    independent_of = frozenset({"llm_individual_linking"})
+
     def __init__(self, llm: LLMProvider | None = None) -> None:
         self.llm = llm
 
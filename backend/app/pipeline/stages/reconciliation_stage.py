@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timezone
 
-from app.models.annotation import ConceptMatch
+from app.models.annotation import CONCEPT_MATCH_LIST_ADAPTER
 from app.models.job import Job, JobStatus
 from app.pipeline.stages.base import PipelineStage, record_lineage
 from app.services.reconciliation.reconciler import Reconciler
@@ -22,15 +22,15 @@ class ReconciliationStage(PipelineStage):
     async def execute(self, job: Job) -> Job:
         # Gather ruler concepts
         ruler_raw = job.result.metadata.get("ruler_concepts", [])
-        ruler_concepts = [ConceptMatch(**c) for c in ruler_raw]
+        ruler_concepts = CONCEPT_MATCH_LIST_ADAPTER.validate_python(ruler_raw)
 
         # Gather LLM concepts (flatten from per-chunk)
         llm_raw = job.result.metadata.get("llm_concepts", {})
-        llm_concepts = [
-            ConceptMatch(**c)
+        llm_concepts = CONCEPT_MATCH_LIST_ADAPTER.validate_python([
+            c
             for chunk_concepts in llm_raw.values()
             for c in chunk_concepts
-        ]
+        ])
 
         # Use embedding triage if embedding service is available
         if self.reconciler._embedding_service is not None:
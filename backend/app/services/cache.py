@@ -30,6 +30,9 @@ class LRUTTLCache:
         if len(self._cache) > self.max_size:
             self._cache.popitem(last=False)
 
+    def delete(self, key: str) -> None:
+        self._cache.pop(key, None)
+
     def clear(self) -> None:
         self._cache.clear()
 
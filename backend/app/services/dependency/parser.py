@@ -14,8 +14,8 @@ Improvements over the original:
 from __future__ import annotations
 
 import logging
-from uuid import uuid4
 
+from app.models._idgen import next_id
 from app.models.annotation import SPOTriple, SentencePOS, Span, StageEvent
 from app.services.nlp.spacy_singleton import get_spacy_nlp
 
@@ -171,7 +171,7 @@ class DependencyParser:
                     for pass_subj in passive_subjects:
                         verb_bonus = 0.10 if verb.pos_ in ("VERB", "AUX") else 0.0
                         results.append(SPOTriple(
-                            id=str(uuid4()),
+                            id=next_id(),
                             subject="[agent]",
                             predicate=predicate_lemma,
                             object=self._subtree_text(pass_subj),
@@ -228,7 +228,7 @@ class DependencyParser:
     ) -> SPOTriple:
         """Create an SPOTriple from tokens."""
         return SPOTriple(
-            id=str(uuid4()),
+            id=next_id(),
             subject=self._subtree_text(subj_token),
             predicate=predicate_override or verb_token.lemma_,
             object=self._subtree_text(obj_token),
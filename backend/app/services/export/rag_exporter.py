@@ -2,10 +2,23 @@ from __future__ import annotations
 
 import json
 
+from app.models.document import CanonicalText
 from app.models.job import Job
 from app.services.export.base import ExporterBase
 
 
+def _bucket_by_chunk(canonical: CanonicalText, items, span_of) -> list[list]:
+    """Group *items* per chunk (in item order) by the chunks containing their span."""
+    buckets: list[list] = [[] for _ in canonical.chunks]
+    for item in items:
+        span = span_of(item)
+        if span is None:
+            continue
+        for i in canonical.chunks_containing(span.start, span.end):
+            buckets[i].append(item)
+    return buckets
+
+
 class RAGExporter(ExporterBase):
     @property
     def format_name(self) -> str:
@@ -19,69 +32,73 @@ class RAGExporter(ExporterBase):
         if job.result.canonical_text is None:
             return json.dumps([])
 
+        canonical = job.result.canonical_text
+        # Assign each entity to its chunks once via bisect instead of rescanning
+        # every list for every chunk
+        annotations_by_chunk = _bucket_by_chunk(canonical, job.result.annotations, lambda a: a.span)
+        individuals_by_chunk = _bucket_by_chunk(canonical, job.result.individuals, lambda i: i.span)
+        properties_by_chunk = _bucket_by_chunk(canonical, job.result.properties, lambda p: p.span)
+        triples_by_chunk = _bucket_by_chunk(canonical, job.result.triples, lambda t: t.subject_span)
+
         chunks = []
-        for chunk in job.result.canonical_text.chunks:
+        for idx, chunk in enumerate(canonical.chunks):
             # Find annotations within this chunk
             chunk_annotations = []
-            for ann in job.result.annotations:
-                if ann.span.start >= chunk.start_offset and ann.span.end <= chunk.end_offset:
-                    chunk_annotations.append({
-                        "span_text": ann.span.text,
-                        "concepts": [
-                            {
-                                "folio_iri": c.folio_iri,
-                                "folio_label": c.folio_label,
-                                "branch": c.branches[0] if c.branches else "",
-                                "branches": c.branches,
-                                "confidence": c.confidence,
-                            }
-                            for c in ann.concepts
-                        ],
-                    })
+            for ann in annotations_by_chunk[idx]:
+                chunk_annotations.append({
+                    "span_text": ann.span.text,
+                    "concepts": [
+                        {
+                            "folio_iri": c.folio_iri,
+                            "folio_label": c.folio_label,
+                            "branch": c.branches[0] if c.branches else "",
+                            "branches": c.branches,
+                            "confidence": c.confidence,
+                        }
+                        for c in ann.concepts
+                    ],
+                })
 
             # Find individuals within this chunk
             chunk_individuals = []
-            for ind in job.result.individuals:
-                if ind.span.start >= chunk.start_offset and ind.span.end <= chunk.end_offset:
-                    chunk_individuals.append({
-                        "name": ind.name,
-                        "mention_text": ind.mention_text,
-                        "individual_type": ind.individual_type,
-                        "class_links": [
-                            {
-                                "folio_label": cl.folio_label,
-                                "folio_iri": cl.folio_iri,
-                            }
-                            for cl in ind.class_links
-                        ],
-                        "confidence": ind.confidence,
-                        "source": ind.source,
-                    })
+            for ind in individuals_by_chunk[idx]:
+                chunk_individuals.append({
+                    "name": ind.name,
+                    "mention_text": ind.mention_text,
+                    "individual_type": ind.individual_type,
+                    "class_links": [
+                        {
+                            "folio_label": cl.folio_label,
+                            "folio_iri": cl.folio_iri,
+                        }
+                        for cl in ind.class_links
+                    ],
+                    "confidence": ind.confidence,
+                    "source": ind.source,
+                })
 
             # Find properties within this chunk
             chunk_properties = []
-            for prop in job.result.properties:
-                if prop.span.start >= chunk.start_offset and prop.span.end <= chunk.end_offset:
-                    chunk_properties.append({
-                        "property_text": prop.property_text,
-                        "folio_iri": prop.folio_iri,
-                        "folio_label": prop.folio_label,
-                        "confidence": prop.confidence,
-                        "source": prop.source,
-                    })
+            for prop in properties_by_chunk[idx]:
+                chunk_properties.append({
+                    "property_text": prop.property_text,
+                    "folio_iri": prop.folio_iri,
+                    "folio_label": prop.folio_label,
+                    "confidence": prop.confidence,
+                    "source": prop.source,
+                })
 
             # Find triples within this chunk (by sentence position)
             chunk_triples = []
-            for t in job.result.triples:
-                if t.subject_span and t.subject_span.start >= chunk.start_offset and t.subject_span.end <= chunk.end_offset:
-                    chunk_triples.append({
-                        "subject": t.subject,
-                        "predicate": t.predicate,
-                        "object": t.object,
-                        "voice": t.voice,
-                        "confidence": t.confidence,
-                        "has_folio_link": bool(t.subject_links or t.object_links or t.predicate_links),
-                    })
+            for t in triples_by_chunk[idx]:
+                chunk_triples.append({
+                    "subject": t.subject,
+                    "predicate": t.predicate,
+                    "object": t.object,
+                    "voice": t.voice,
+                    "confidence": t.confidence,
+                    "has_folio_link": bool(t.subject_links or t.object_links or t.predicate_links),
+                })
 
             chunks.append({
                 "chunk_index": chunk.chunk_index,
@@ -1,13 +1,14 @@
 """Rich concept detail and entity graph building for FOLIO concepts.
 
 Provides lookup_concept_detail() for full concept info (children, siblings,
-translations, hierarchy path, examples) and build_entity_graph() for BFS
-graph exploration.
+translations, hierarchy path, examples), lookup_concept_detail_dict() for a
+memoized serialized form, and build_entity_graph() for BFS graph exploration.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 
 from app.models.graph_models import (
     ConceptDetail,
@@ -16,10 +17,18 @@ from app.models.graph_models import (
     GraphNode,
     HierarchyPathEntry,
 )
+from app.services.cache import LRUTTLCache
 from app.services.folio.branch_config import get_branch_color
 
 logger = logging.getLogger(__name__)
 
+# Serialized ConceptDetail dicts keyed by IRI hash.  Details are immutable for
+# a given FOLIO load, so the cache is reset whenever a different FOLIO
+# instance is passed in (startup load or OWL hot-reload).
+_detail_dump_cache = LRUTTLCache(max_size=4096, ttl_seconds=3600)
+_detail_cache_folio = None
+_detail_cache_lock = threading.Lock()  # lookups may run in worker threads
+
 
 def _extract_iri_hash(iri: str) -> str:
     """Extract the hash portion from a full FOLIO IRI."""
@@ -286,6 +295,30 @@ def lookup_concept_detail(folio, iri_hash: str) -> ConceptDetail | None:
     )
 
 
+def lookup_concept_detail_dict(folio, iri_hash: str) -> dict | None:
+    """Return ``lookup_concept_detail(...).model_dump()``, memoized per FOLIO load.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    global _detail_cache_folio
+    with _detail_cache_lock:
+        if folio is not _detail_cache_folio:
+            _detail_dump_cache.clear()
+            _detail_cache_folio = folio
+        cached = _detail_dump_cache.get(iri_hash)
+    if cached is not None:
+        return cached
+
+    detail = lookup_concept_detail(folio, iri_hash)
+    if detail is None:
+        return None
+    dumped = detail.model_dump()
+    with _detail_cache_lock:
+        if folio is _detail_cache_folio:
+            _detail_dump_cache.set(iri_hash, dumped)
+    return dumped
+
+
 def build_entity_graph(
     folio,
     iri_hash: str,
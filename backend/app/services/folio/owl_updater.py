@@ -110,7 +110,7 @@ class OWLUpdateManager:
 
         # Step 2: Wait for idle pipeline
         from app.storage.job_store import JobStore
-        store = JobStore()
+        store = JobStore.get_instance()
         waited = 0
         while waited < _IDLE_WAIT_TIMEOUT:
             active = await store.count_active()
@@ -5,8 +5,8 @@ from __future__ import annotations
 import asyncio
 import logging
 from functools import partial
-from uuid import uuid4
 
+from app.models._idgen import next_id
 from app.models.annotation import Individual, IndividualClassLink, Span, StageEvent
 
 logger = logging.getLogger(__name__)
@@ -73,7 +73,7 @@ def _extract_with_eyecite(text: str) -> list[Individual]:
             normalized = None
 
         individual = Individual(
-            id=str(uuid4()),
+            id=next_id(),
             name=matched_text.strip(),
             mention_text=matched_text,
             individual_type="legal_citation",
@@ -160,7 +160,7 @@ def _normalize_with_citeurl(text: str, individuals: list[Individual]) -> list[In
             normalized = str(cite) if str(cite) != matched else None
 
             individual = Individual(
-                id=str(uuid4()),
+                id=next_id(),
                 name=matched.strip(),
                 mention_text=matched,
                 individual_type="legal_citation",
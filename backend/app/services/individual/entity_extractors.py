@@ -7,8 +7,8 @@ import logging
 import re
 from abc import ABC, abstractmethod
 from functools import partial
-from uuid import uuid4
 
+from app.models._idgen import next_id
 from app.models.annotation import Individual, IndividualClassLink, Span, StageEvent
 
 logger = logging.getLogger(__name__)
@@ -51,7 +51,7 @@ class EntityExtractor(ABC):
     ) -> Individual:
         conf = confidence or self.confidence
         return Individual(
-            id=str(uuid4()),
+            id=next_id(),
             name=name or matched.strip(),
             mention_text=matched,
             individual_type="named_entity",
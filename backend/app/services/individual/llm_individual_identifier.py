@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from uuid import uuid4
 
+from app.models._idgen import next_id
 from app.models.annotation import (
     Annotation,
     Individual,
@@ -145,7 +145,7 @@ class LLMIndividualIdentifier:
             confidence = max(0.0, min(1.0, item.get("confidence", 0.5)))
 
             individual = Individual(
-                id=str(uuid4()),
+                id=next_id(),
                 name=item.get("name", mention_text.strip()),
                 mention_text=mention_text,
                 individual_type=item.get("individual_type", "named_entity"),
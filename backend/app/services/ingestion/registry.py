@@ -52,8 +52,11 @@ def detect_format(filename: str | None, content: str) -> DocumentFormat:
         if ext in ext_map:
             return ext_map[ext]
 
-    # Heuristic detection for content without filename
-    stripped = content.strip()
+    # Heuristic detection for content without filename.  Only the start is
+    # inspected, so lstrip: it returns ``content`` itself (no multi-MB copy)
+    # unless there is leading whitespace, whereas strip() copies whenever the
+    # document ends in a newline.
+    stripped = content.lstrip()
 
     # Base64-encoded PDF (starts with %PDF -> JVBER in base64)
     if stripped.startswith("JVBER"):
@@ -72,7 +75,7 @@ def detect_format(filename: str | None, content: str) -> DocumentFormat:
         return DocumentFormat.EMAIL
 
     # HTML
-    if stripped.startswith("<!") or stripped.lower().startswith("<html"):
+    if stripped.startswith("<!") or stripped[:5].lower() == "<html":
         return DocumentFormat.HTML
 
     # Markdown
@@ -3,6 +3,8 @@ from __future__ import annotations
 import abc
 from typing import Any
 
+import httpx
+
 from app.models.llm_models import ModelInfo
 
 
@@ -12,10 +14,20 @@ class LLMProvider(abc.ABC):
         api_key: str | None = None,
         base_url: str | None = None,
         model: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         self.api_key = api_key
         self.base_url = base_url
         self.model = model
+        self._http_client = http_client
+
+    def _http(self) -> httpx.AsyncClient:
+        """The injected HTTP client, or the process-wide pooled one."""
+        if self._http_client is not None:
+            return self._http_client
+        from app.services.llm.http_client import get_http_client
+
+        return get_http_client()
 
     @abc.abstractmethod
     async def complete(self, prompt: str, **kwargs: Any) -> str:
@@ -20,8 +20,9 @@ class CohereProvider(LLMProvider):
         api_key: str | None = None,
         base_url: str | None = None,
         model: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
-        super().__init__(api_key=api_key, base_url=base_url, model=model)
+        super().__init__(api_key=api_key, base_url=base_url, model=model, http_client=http_client)
         self._base = (base_url or "https://api.cohere.com/v2").rstrip("/")
 
     def _headers(self) -> dict[str, str]:
@@ -44,10 +45,10 @@ class CohereProvider(LLMProvider):
         }
 
         url = f"{self._base}/chat"
-        async with httpx.AsyncClient(timeout=120) as client:
-            resp = await client.post(url, headers=self._headers(), json=body)
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._http()
+        resp = await client.post(url, headers=self._headers(), json=body, timeout=120)
+        resp.raise_for_status()
+        data = resp.json()
 
         # Cohere v2 chat response
         message = data.get("message", {})
@@ -80,19 +81,19 @@ class CohereProvider(LLMProvider):
             "max_tokens": 1,
         }
         url = f"{self._base}/chat"
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(url, headers=self._headers(), json=body)
-            resp.raise_for_status()
+        client = self._http()
+        resp = await client.post(url, headers=self._headers(), json=body, timeout=30)
+        resp.raise_for_status()
         return True
 
     async def list_models(self) -> list[ModelInfo]:
         try:
             # Cohere v2 models endpoint
             url = f"{self._base}/models"
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.get(url, headers=self._headers())
-                resp.raise_for_status()
-                data = resp.json()
+            client = self._http()
+            resp = await client.get(url, headers=self._headers(), timeout=30)
+            resp.raise_for_status()
+            data = resp.json()
 
             models = []
             for m in data.get("models", []):
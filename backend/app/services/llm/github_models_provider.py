@@ -3,8 +3,6 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import httpx
-
 from app.models.llm_models import ModelInfo
 from app.services.llm.openai_compat import OpenAICompatProvider
 
@@ -18,16 +16,16 @@ class GitHubModelsProvider(OpenAICompatProvider):
 
     async def list_models(self) -> list[ModelInfo]:
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.get(
-                    _GITHUB_CATALOG_URL,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key or ''}",
-                        "Accept": "application/json",
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await self._http().get(
+                _GITHUB_CATALOG_URL,
+                headers={
+                    "Authorization": f"Bearer {self.api_key or ''}",
+                    "Accept": "application/json",
+                },
+                timeout=30,
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             models = []
             items = data if isinstance(data, list) else data.get("models", data.get("value", []))
@@ -20,8 +20,9 @@ class GoogleProvider(LLMProvider):
         api_key: str | None = None,
         base_url: str | None = None,
         model: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
-        super().__init__(api_key=api_key, base_url=base_url, model=model)
+        super().__init__(api_key=api_key, base_url=base_url, model=model, http_client=http_client)
         self._base = (base_url or "https://generativelanguage.googleapis.com/v1beta").rstrip("/")
 
     def _headers(self) -> dict[str, str]:
@@ -61,10 +62,10 @@ class GoogleProvider(LLMProvider):
             }
 
         url = f"{self._base}/models/{model}:generateContent"
-        async with httpx.AsyncClient(timeout=120) as client:
-            resp = await client.post(url, headers=self._headers(), json=body)
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._http()
+        resp = await client.post(url, headers=self._headers(), json=body, timeout=120)
+        resp.raise_for_status()
+        data = resp.json()
 
         candidates = data.get("candidates", [])
         if candidates:
@@ -95,18 +96,18 @@ class GoogleProvider(LLMProvider):
             "contents": [{"role": "user", "parts": [{"text": "Hi"}]}],
             "generationConfig": {"maxOutputTokens": 1},
         }
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(url, headers=self._headers(), json=body)
-            resp.raise_for_status()
+        client = self._http()
+        resp = await client.post(url, headers=self._headers(), json=body, timeout=30)
+        resp.raise_for_status()
         return True
 
     async def list_models(self) -> list[ModelInfo]:
         try:
             url = f"{self._base}/models"
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.get(url, headers=self._headers())
-                resp.raise_for_status()
-                data = resp.json()
+            client = self._http()
+            resp = await client.get(url, headers=self._headers(), timeout=30)
+            resp.raise_for_status()
+            data = resp.json()
 
             models = []
             for m in data.get("models", []):
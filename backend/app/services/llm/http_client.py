@@ -0,0 +1,47 @@
+"""Process-wide httpx client shared by the LLM providers.
+
+Creating an ``httpx.AsyncClient`` per call throws away the connection pool,
+so every provider request paid a fresh TCP + TLS handshake.  Providers now
+borrow this one pooled client instead.  It is bound to the event loop it was
+created on and is rebuilt transparently if the loop changes (e.g. between
+test clients); the app lifespan opens it at startup and closes it on shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+
+import httpx
+
+HTTP_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=64)
+HTTP_TIMEOUT = httpx.Timeout(60.0)
+# The OpenAI/Anthropic SDKs adopt an injected client's timeout, so they are
+# handed their own default (600s, 5s connect) explicitly; long completions
+# from slow local models would otherwise hit HTTP_TIMEOUT.
+SDK_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+# HTTP/2 multiplexing needs the optional ``h2`` package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client for the running event loop, creating it if needed."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT, http2=HTTP2_AVAILABLE)
+        _client_loop = loop
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (called from the app lifespan on shutdown)."""
+    global _client, _client_loop
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client = None
+    _client_loop = None
@@ -4,8 +4,11 @@ import json
 import logging
 from typing import Any
 
+import httpx
+
 from app.models.llm_models import ModelInfo
 from app.services.llm.base import LLMProvider
+from app.services.llm.http_client import SDK_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
@@ -21,18 +24,27 @@ class OpenAICompatProvider(LLMProvider):
         api_key: str | None = None,
         base_url: str | None = None,
         model: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
-        super().__init__(api_key=api_key, base_url=base_url, model=model)
+        super().__init__(api_key=api_key, base_url=base_url, model=model, http_client=http_client)
         self._client = None
+        self._client_http: httpx.AsyncClient | None = None
 
     def _get_client(self):
-        if self._client is None:
+        http = self._http()
+        # Rebuild if the shared HTTP client we were built on was replaced (new event loop)
+        if self._client is None or self._client_http not in (None, http):
             import openai
 
-            kwargs: dict[str, Any] = {"api_key": self.api_key or "no-key"}
+            kwargs: dict[str, Any] = {
+                "api_key": self.api_key or "no-key",
+                "http_client": http,
+                "timeout": SDK_TIMEOUT,
+            }
             if self.base_url:
                 kwargs["base_url"] = self.base_url
             self._client = openai.AsyncOpenAI(**kwargs)
+            self._client_http = http
         return self._client
 
     async def complete(self, prompt: str, **kwargs: Any) -> str:
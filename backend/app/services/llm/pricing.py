@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
 import time
 
 import httpx
@@ -19,22 +21,46 @@ INPUT_TOKENS_PER_NODE = 800
 OUTPUT_TOKENS_PER_NODE = 200
 
 CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # 7 days
+# Each refresh picks a TTL within ±5% so replicas don't all refetch at once
+CACHE_TTL_JITTER = 0.05
 
 _cache: dict[str, float] = {}
 _cache_fetched_at: float = 0.0
+_cache_ttl: float = CACHE_TTL_SECONDS
+
+_refresh_lock: asyncio.Lock | None = None
+_refresh_lock_loop: asyncio.AbstractEventLoop | None = None
 
 
 def _is_cache_valid() -> bool:
-    return bool(_cache) and (time.time() - _cache_fetched_at) < CACHE_TTL_SECONDS
+    return bool(_cache) and (time.time() - _cache_fetched_at) < _cache_ttl
+
+
+def _get_refresh_lock() -> asyncio.Lock:
+    """One lock per event loop, so only one coroutine refetches at a time."""
+    global _refresh_lock, _refresh_lock_loop
+    loop = asyncio.get_running_loop()
+    if _refresh_lock is None or _refresh_lock_loop is not loop:
+        _refresh_lock = asyncio.Lock()
+        _refresh_lock_loop = loop
+    return _refresh_lock
 
 
 async def fetch_pricing() -> tuple[dict[str, float], float]:
     """Return (prices, fetched_at) -- prices maps model_id to cost_per_node."""
-    global _cache, _cache_fetched_at
-
     if _is_cache_valid():
         return _cache, _cache_fetched_at
 
+    async with _get_refresh_lock():
+        # Another coroutine may have refreshed while we waited
+        if _is_cache_valid():
+            return _cache, _cache_fetched_at
+        return await _refresh_pricing()
+
+
+async def _refresh_pricing() -> tuple[dict[str, float], float]:
+    global _cache, _cache_fetched_at, _cache_ttl
+
     try:
         async with httpx.AsyncClient(timeout=15.0) as client:
             resp = await client.get(LITELLM_PRICING_URL)
@@ -69,5 +95,6 @@ async def fetch_pricing() -> tuple[dict[str, float], float]:
 
     _cache = prices
     _cache_fetched_at = time.time()
+    _cache_ttl = CACHE_TTL_SECONDS * random.uniform(1 - CACHE_TTL_JITTER, 1 + CACHE_TTL_JITTER)
     logger.info("Loaded pricing for %d models", len(prices))
     return prices, _cache_fetched_at
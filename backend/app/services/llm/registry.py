@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
+
+import httpx
+
 from app.models.llm_models import LLMProviderType, ModelInfo
 from app.services.llm.base import LLMProvider
 
@@ -67,6 +72,20 @@ REQUIRES_API_KEY: dict[LLMProviderType, bool] = {
     LLMProviderType.llamafile: False,
 }
 
+# Accepted spellings of each provider name ("meta-llama", old "lm_studio", ...)
+PROVIDER_ALIASES: dict[str, LLMProviderType] = {
+    **{p.value: p for p in LLMProviderType},
+    **{p.value.replace("_", "-"): p for p in LLMProviderType},
+    "lm_studio": LLMProviderType.lmstudio,
+    "lm-studio": LLMProviderType.lmstudio,
+}
+
+
+def resolve_provider_type(name: str) -> LLMProviderType | None:
+    """Map a provider name (any accepted spelling) to its enum, or None if unknown."""
+    return PROVIDER_ALIASES.get(name)
+
+
 # Well-known models per provider (shown without API key; refresh fetches live).
 # Ordered: oldest/cheapest → newest/most powerful.
 KNOWN_MODELS: dict[LLMProviderType, list[ModelInfo]] = {
@@ -164,25 +183,23 @@ def get_provider(
     api_key: str | None = None,
     base_url: str | None = None,
     model: str | None = None,
+    http_client: httpx.AsyncClient | None = None,
     **kwargs,
 ) -> LLMProvider:
     """Factory: create an LLM provider instance.
 
     Accepts both LLMProviderType enum and string names for backward compatibility.
+    Providers use the shared pooled HTTP client unless *http_client* is given.
     """
     # Normalize string to enum
     if isinstance(provider_type, str):
-        # Support old names: "lm_studio" → "lmstudio"
-        name = provider_type.replace("-", "_")
-        if name == "lm_studio":
-            name = "lmstudio"
-        try:
-            provider_type = LLMProviderType(name)
-        except ValueError:
+        resolved = resolve_provider_type(provider_type)
+        if resolved is None:
             available = [p.value for p in LLMProviderType]
             raise ValueError(
                 f"Unknown LLM provider: {provider_type}. Available: {available}"
             )
+        provider_type = resolved
 
     # Resolve defaults
     resolved_base_url = base_url or DEFAULT_BASE_URLS.get(provider_type)
@@ -199,6 +216,7 @@ def get_provider(
             api_key=api_key,
             base_url=resolved_base_url,
             model=resolved_model,
+            http_client=http_client,
         )
 
     if provider_type == LLMProviderType.google:
@@ -208,6 +226,7 @@ def get_provider(
             api_key=api_key,
             base_url=resolved_base_url,
             model=resolved_model,
+            http_client=http_client,
         )
 
     if provider_type == LLMProviderType.cohere:
@@ -217,6 +236,7 @@ def get_provider(
             api_key=api_key,
             base_url=resolved_base_url,
             model=resolved_model,
+            http_client=http_client,
         )
 
     if provider_type == LLMProviderType.github_models:
@@ -226,6 +246,7 @@ def get_provider(
             api_key=api_key,
             base_url=resolved_base_url,
             model=resolved_model,
+            http_client=http_client,
         )
 
     if provider_type in _OPENAI_COMPAT_PROVIDERS:
@@ -235,6 +256,30 @@ def get_provider(
             api_key=api_key,
             base_url=resolved_base_url,
             model=resolved_model,
+            http_client=http_client,
         )
 
     raise ValueError(f"No provider implementation for: {provider_type.value}")
+
+
+_SHARED_PROVIDERS_MAX = 64
+# Keyed on a digest of the API key so plaintext keys never sit in the memo
+_shared_providers: OrderedDict[tuple[LLMProviderType, str | None, str | None], LLMProvider] = OrderedDict()
+
+
+def get_shared_provider(
+    provider_type: LLMProviderType, model: str | None, api_key: str | None
+) -> LLMProvider:
+    """Like ``get_provider`` but memoized, so callers with the same
+    configuration share one instance (and its HTTP client)."""
+    key_digest = hashlib.sha256(api_key.encode()).hexdigest() if api_key is not None else None
+    cache_key = (provider_type, model, key_digest)
+    provider = _shared_providers.get(cache_key)
+    if provider is not None:
+        _shared_providers.move_to_end(cache_key)
+        return provider
+    provider = get_provider(provider_type, api_key=api_key, model=model)
+    _shared_providers[cache_key] = provider
+    if len(_shared_providers) > _SHARED_PROVIDERS_MAX:
+        _shared_providers.popitem(last=False)
+    return provider
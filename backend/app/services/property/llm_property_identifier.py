@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from uuid import uuid4
 
+from app.models._idgen import next_id
 from app.models.annotation import (
     Annotation,
     PropertyAnnotation,
@@ -172,7 +172,7 @@ class LLMPropertyIdentifier:
                     inverse_of = info.prop.inverse_of
 
             new_properties.append(PropertyAnnotation(
-                id=str(uuid4()),
+                id=next_id(),
                 property_text=prop_text,
                 folio_iri=folio_iri,
                 folio_label=folio_label or None,
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import logging
-from uuid import uuid4
 
+from app.models._idgen import next_id
 from app.models.annotation import PropertyAnnotation, Span, StageEvent
 from app.services.folio.folio_service import FolioService, PropertyLabelInfo
 from app.services.matching.aho_corasick import AhoCorasickMatcher
@@ -136,7 +136,7 @@ class PropertyMatcher:
                 confidence = min(1.0, confidence + 0.05)
 
             results.append(PropertyAnnotation(
-                id=str(uuid4()),
+                id=next_id(),
                 property_text=text[m.start:m.end],
                 folio_iri=data.get("iri"),
                 folio_label=data.get("label"),
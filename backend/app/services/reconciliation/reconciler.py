@@ -50,9 +50,9 @@ def _build_text_and_key_maps(concepts: list[ConceptMatch]) -> tuple[
     by_key: dict[tuple[str, str], ConceptMatch] = {}
     by_text: dict[str, list[ConceptMatch]] = {}
     for c in concepts:
-        k = (c.concept_text.lower(), c.folio_iri or "")
-        by_key[k] = c
-        by_text.setdefault(c.concept_text.lower(), []).append(c)
+        text = c.concept_text.lower()
+        by_key[(text, c.folio_iri or "")] = c
+        by_text.setdefault(text, []).append(c)
     return by_key, by_text
 
 
@@ -75,7 +75,7 @@ class Reconciler:
         handled_llm_keys: set[tuple[str, str]] = set()
 
         # Pass 1: Exact (text, IRI) matching — both sides have matching IRI
-        all_keys = set(ruler_by_key.keys()) | set(llm_by_key.keys())
+        all_keys = ruler_by_key.keys() | llm_by_key.keys()
         for key in all_keys:
             text, iri = key
             in_ruler = key in ruler_by_key
@@ -170,7 +170,7 @@ class Reconciler:
         conflicts: list[tuple[str, ConceptMatch, ConceptMatch]] = []
 
         # Pass 1: Exact (text, IRI) matching
-        all_keys = set(ruler_by_key.keys()) | set(llm_by_key.keys())
+        all_keys = ruler_by_key.keys() | llm_by_key.keys()
         for key in all_keys:
             text, iri = key
             in_ruler = key in ruler_by_key
@@ -5,6 +5,7 @@ import json
 import logging
 from typing import AsyncGenerator
 
+from app.models.annotation import CONCEPT_MATCH_LIST_ADAPTER
 from app.models.job import Job, JobStatus
 from app.storage.job_store import JobStore
 
@@ -54,7 +55,7 @@ async def job_event_stream(
             ann_data = {
                 "id": ann_id,
                 "span": {"start": ann.span.start, "end": ann.span.end, "text": ann.span.text},
-                "concepts": [c.model_dump() for c in ann.concepts],
+                "concepts": CONCEPT_MATCH_LIST_ADAPTER.dump_python(ann.concepts),
                 "state": ann_state,
             }
 
@@ -2,20 +2,41 @@ from __future__ import annotations
 
 import json
 import logging
+import sys
 import tempfile
 from collections import Counter
 from pathlib import Path
+from typing import AsyncIterator
 
 from app.config import settings
-from app.models.feedback import FeedbackEntry, InsightsSummary
+from app.models.feedback import FeedbackEntry, FeedbackHeader, InsightsSummary
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_entry(text: str) -> FeedbackEntry:
+    """Validate a stored entry, interning its annotation id for index lookups."""
+    entry = FeedbackEntry.model_validate_json(text)
+    entry.annotation_id = sys.intern(entry.annotation_id)
+    return entry
+
+
 class FeedbackStore:
+    _instance: FeedbackStore | None = None
+
     def __init__(self, base_dir: Path | None = None) -> None:
         self.base_dir = base_dir or settings.feedback_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # (job_id, annotation_id) → feedback id, built on first lookup
+        self._by_annotation: dict[tuple[str, str], str] | None = None
+        self._annotation_keys: dict[str, tuple[str, str]] = {}
+
+    @classmethod
+    def get_instance(cls) -> FeedbackStore:
+        """Process-wide store shared by the feedback API and the enrich routes."""
+        if cls._instance is None:
+            cls._instance = FeedbackStore()
+        return cls._instance
 
     def _feedback_path(self, feedback_id: str) -> Path:
         return self.base_dir / f"{feedback_id}.json"
@@ -31,26 +52,52 @@ class FeedbackStore:
         except BaseException:
             Path(tmp_path).unlink(missing_ok=True)
             raise
+        if self._by_annotation is not None:
+            self._index_entry(entry.id, entry.job_id, entry.annotation_id)
+
+    def _index_entry(self, feedback_id: str, job_id: str, annotation_id: str) -> None:
+        key = (job_id, sys.intern(annotation_id))
+        self._by_annotation[key] = feedback_id
+        self._annotation_keys[feedback_id] = key
+
+    def _unindex_entry(self, feedback_id: str) -> None:
+        key = self._annotation_keys.pop(feedback_id, None)
+        if key is not None and self._by_annotation is not None:
+            if self._by_annotation.get(key) == feedback_id:
+                del self._by_annotation[key]
 
     async def load(self, feedback_id: str) -> FeedbackEntry | None:
         path = self._feedback_path(feedback_id)
         if not path.exists():
             return None
-        return FeedbackEntry.model_validate_json(path.read_text())
+        return _parse_entry(path.read_text())
 
     async def list_all(self) -> list[FeedbackEntry]:
-        entries: list[FeedbackEntry] = []
+        return [entry async for entry in self.iter_all()]
+
+    async def iter_all(self) -> AsyncIterator[FeedbackEntry]:
+        """Yield entries one at a time, so callers can stream without holding them all."""
         for path in sorted(self.base_dir.glob("*.json")):
             try:
-                entries.append(FeedbackEntry.model_validate_json(path.read_text()))
+                entry = _parse_entry(path.read_text())
             except Exception:
                 continue
-        return entries
+            yield entry
+
+    async def _iter_headers(self) -> AsyncIterator[FeedbackHeader]:
+        """Like ``iter_all`` but validates only the scalar fields of each file."""
+        for path in sorted(self.base_dir.glob("*.json")):
+            try:
+                header = FeedbackHeader.model_validate_json(path.read_text())
+            except Exception:
+                continue
+            yield header
 
     async def delete(self, feedback_id: str) -> bool:
         path = self._feedback_path(feedback_id)
         if path.exists():
             path.unlink()
+            self._unindex_entry(feedback_id)
             return True
         return False
 
@@ -59,25 +106,33 @@ class FeedbackStore:
         for path in list(self.base_dir.glob("*.json")):
             path.unlink()
             count += 1
+        self._by_annotation = {}
+        self._annotation_keys = {}
         return count
 
     async def find_by_annotation(self, job_id: str, annotation_id: str) -> FeedbackEntry | None:
-        """Find existing feedback for a specific annotation (one per annotation)."""
-        for path in self.base_dir.glob("*.json"):
-            try:
-                entry = FeedbackEntry.model_validate_json(path.read_text())
-                if entry.job_id == job_id and entry.annotation_id == annotation_id:
-                    return entry
-            except Exception:
-                continue
-        return None
+        """Find existing feedback for a specific annotation (one per annotation).
+
+        The first call scans the directory to build a (job, annotation) → id
+        index; later lookups read only the matching file.
+        """
+        if self._by_annotation is None:
+            self._by_annotation = {}
+            async for header in self._iter_headers():
+                self._index_entry(header.id, header.job_id, header.annotation_id)
+        feedback_id = self._by_annotation.get((job_id, annotation_id))
+        if feedback_id is None:
+            return None
+        return await self.load(feedback_id)
 
     async def list_by_job(self, job_id: str) -> list[FeedbackEntry]:
         all_entries = await self.list_all()
         return [e for e in all_entries if e.job_id == job_id]
 
     async def get_insights(self, job_id: str | None = None) -> InsightsSummary:
-        entries = await self.list_by_job(job_id) if job_id else await self.list_all()
+        entries = [
+            h async for h in self._iter_headers() if job_id is None or h.job_id == job_id
+        ]
 
         thumbs_up = sum(1 for e in entries if e.rating == "up")
         thumbs_down = sum(1 for e in entries if e.rating == "down")
@@ -123,8 +178,12 @@ class FeedbackStore:
             for label, count in dismiss_concepts.most_common(10)
         ]
 
-        # Recent feedback (last 20)
-        recent = sorted(entries, key=lambda e: e.created_at, reverse=True)[:20]
+        # Recent feedback (last 20) is the only part that needs full entries
+        recent = []
+        for h in sorted(entries, key=lambda e: e.created_at, reverse=True)[:20]:
+            entry = await self.load(h.id)
+            if entry is not None:
+                recent.append(entry)
 
         return InsightsSummary(
             total_feedback=len(entries),
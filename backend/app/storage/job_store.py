@@ -1,29 +1,135 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import sys
 import tempfile
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from uuid import UUID
 
 from app.config import settings
+from app.models.annotation import ConceptMatch
 from app.models.job import Job, JobStatus
+from app.services.cache import LRUTTLCache
 
 logger = logging.getLogger(__name__)
 
+# Delay before a deferred save is written; further mutations within this
+# window are coalesced into the same write.
+SAVE_DEBOUNCE_SECONDS = 0.1
+
+# Recently used jobs kept in memory (write-through) so repeated reads skip disk
+JOB_CACHE_SIZE = 256
+JOB_CACHE_TTL_SECONDS = 300
+
+
+def _parse_job(text: str) -> Job:
+    """Validate a stored job, migrating concepts saved before ``branches``.
+
+    Only text with a ``"branch"`` key can hold legacy concepts, so anything
+    else takes the fast JSON path.  Otherwise the parsed concept dicts are
+    migrated one by one, since a file may mix old and new concepts.
+    Annotation ids are interned, since the mutation routes look them up in
+    sets and dicts.
+    """
+    if '"branch"' not in text:
+        job = Job.model_validate_json(text)
+    else:
+        data = json.loads(text)
+        for ann in (data.get("result") or {}).get("annotations") or []:
+            for concept in ann.get("concepts") or []:
+                ConceptMatch.migrate_legacy(concept)
+        job = Job.model_validate(data)
+    for ann in job.result.annotations:
+        ann.id = sys.intern(ann.id)
+    return job
+
 
 class JobStore:
+    _instance: JobStore | None = None
+
     def __init__(self, base_dir: Path | None = None) -> None:
         self.base_dir = base_dir or settings.jobs_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # Jobs with a pending deferred save, and the task that will write each
+        self._dirty: dict[UUID, Job] = {}
+        self._flush_tasks: dict[UUID, asyncio.Task] = {}
+        self._cache = LRUTTLCache(max_size=JOB_CACHE_SIZE, ttl_seconds=JOB_CACHE_TTL_SECONDS)
+        # Jobs whose pipeline is running, served regardless of cache expiry
+        self._live: dict[UUID, Job] = {}
+
+    @classmethod
+    def get_instance(cls) -> JobStore:
+        """Process-wide store shared by all routers, so pending writes and
+        in-memory state are never split across instances."""
+        if cls._instance is None:
+            cls._instance = JobStore()
+        return cls._instance
 
     def _job_path(self, job_id: UUID) -> Path:
         return self.base_dir / f"{job_id}.json"
 
     async def save(self, job: Job) -> None:
+        self._dirty.pop(job.id, None)
+        self._cache.set(str(job.id), job)
+        self._write(job)
+
+    def save_deferred(self, job: Job, delay: float = SAVE_DEBOUNCE_SECONDS) -> None:
+        """Schedule a coalesced save of *job*.
+
+        Bursts of mutations to the same job (e.g. rapid UI clicks) result in a
+        single write once *delay* seconds pass without a flush.  Until then
+        ``load`` returns the pending in-memory job, so reads stay consistent.
+        """
+        self._dirty[job.id] = job
+        self._cache.set(str(job.id), job)
+        task = self._flush_tasks.get(job.id)
+        if task is None or task.done():
+            self._flush_tasks[job.id] = asyncio.create_task(
+                self._flush_later(job.id, delay)
+            )
+
+    def pin(self, job: Job) -> None:
+        """Serve *job* from memory until ``unpin``, whatever the cache evicts.
+
+        The orchestrator pins a job for the length of its pipeline, which
+        only writes at phase boundaries, so SSE polls and GETs keep seeing
+        the live object instead of a phase-old copy from disk.
+        """
+        self._live[job.id] = job
+
+    def unpin(self, job_id: UUID) -> None:
+        self._live.pop(job_id, None)
+
+    async def _flush_later(self, job_id: UUID, delay: float) -> None:
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            # Also runs on cancellation (shutdown) so pending writes aren't lost.
+            # Only drop our own entry: a newer save_deferred may have replaced it.
+            if self._flush_tasks.get(job_id) is asyncio.current_task():
+                del self._flush_tasks[job_id]
+            job = self._dirty.pop(job_id, None)
+            if job is not None:
+                try:
+                    self._write(job)
+                except Exception:
+                    logger.warning("Deferred save failed for job %s", job_id, exc_info=True)
+
+    async def flush(self) -> None:
+        """Write all pending deferred saves immediately."""
+        for task in list(self._flush_tasks.values()):
+            task.cancel()
+        for job_id in list(self._dirty):
+            job = self._dirty.pop(job_id)
+            self._write(job)
+
+    def _write(self, job: Job) -> None:
         path = self._job_path(job.id)
-        data = job.model_dump_json(indent=2)
+        # Compact JSON: indentation nearly doubles the bytes of annotation-heavy jobs
+        data = job.model_dump_json()
         # Atomic write: write to temp file then rename
         fd, tmp_path = tempfile.mkstemp(dir=self.base_dir, suffix=".tmp")
         try:
@@ -35,22 +141,64 @@ class JobStore:
             raise
 
     async def load(self, job_id: UUID) -> Job | None:
+        """Return the job, shared with every other reader.
+
+        The returned instance is the cached one, so callers must treat it as
+        read-only; the pipeline owns it while running.  Callers that mutate
+        a job use ``load_for_update`` instead.
+        """
+        pending = self._dirty.get(job_id)
+        if pending is not None:
+            return pending
+        live = self._live.get(job_id)
+        if live is not None:
+            return live
+        cached = self._cache.get(str(job_id))
+        if cached is not None:
+            return cached
         path = self._job_path(job_id)
         if not path.exists():
             return None
-        data = path.read_text()
-        return Job.model_validate_json(data)
+        job = _parse_job(path.read_text())
+        self._cache.set(str(job_id), job)
+        return job
+
+    async def load_for_update(self, job_id: UUID) -> Job | None:
+        """Return a draft of the job for a caller that mutates its annotations.
+
+        The draft shares everything with the cached job except the annotation
+        list and its indexes; callers change annotations only through
+        ``result.annotation_for_update``, which copies just that annotation.
+        Changes become visible to other readers once the draft is passed to
+        ``save`` or ``save_deferred``, so a request that fails halfway leaves
+        the cached job untouched.
+        """
+        job = await self.load(job_id)
+        if job is None:
+            return None
+        draft = job.model_copy()
+        draft.result = job.result.draft()
+        return draft
+
+    async def exists(self, job_id: UUID) -> bool:
+        """Cheap existence probe that never parses the job file."""
+        if job_id in self._dirty or job_id in self._live or self._cache.get(str(job_id)) is not None:
+            return True
+        return self._job_path(job_id).exists()
 
     async def list_jobs(self) -> list[Job]:
         jobs = []
         for path in sorted(self.base_dir.glob("*.json")):
             try:
-                jobs.append(Job.model_validate_json(path.read_text()))
+                jobs.append(_parse_job(path.read_text()))
             except Exception:
                 continue
         return jobs
 
     async def delete(self, job_id: UUID) -> bool:
+        self._dirty.pop(job_id, None)
+        self._live.pop(job_id, None)
+        self._cache.delete(str(job_id))
         path = self._job_path(job_id)
         if path.exists():
             path.unlink()
@@ -80,6 +228,7 @@ class JobStore:
                             timezone.utc
                         ).isoformat()
                         path.write_text(json.dumps(data, indent=2))
+                        self._cache.delete(path.stem)
                         logger.info("Marked stale job %s as failed", path.stem)
                         continue
                 count += 1
@@ -102,6 +251,7 @@ class JobStore:
                     ts = datetime.fromisoformat(updated)
                     if ts < cutoff:
                         path.unlink()
+                        self._cache.delete(path.stem)
                         deleted += 1
             except Exception:
                 continue
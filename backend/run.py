@@ -11,7 +11,28 @@ def open_browser():
     webbrowser.open("http://localhost:8731")
 
 
+def server_backends() -> dict:
+    """Prefer uvloop and httptools when available (not on Windows).
+
+    uvicorn's "auto" choice only finds them if they are importable; importing
+    them here also makes PyInstaller bundle them into the executable.
+    """
+    backends = {}
+    if sys.platform != "win32":
+        try:
+            import uvloop  # noqa: F401
+            backends["loop"] = "uvloop"
+        except ImportError:
+            pass
+    try:
+        import httptools  # noqa: F401
+        backends["http"] = "httptools"
+    except ImportError:
+        pass
+    return backends
+
+
 if __name__ == "__main__":
     threading.Thread(target=open_browser, daemon=True).start()
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8731)
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8731, **server_backends())
@@ -0,0 +1,141 @@
+"""Tests for the JobResult annotation lookup index."""
+
+from app.models.annotation import Annotation, ConceptMatch, Span
+from app.models.job import Job, JobResult
+
+
+def _ann(ann_id: str, iri: str = "http://example.com/a") -> Annotation:
+    return Annotation(
+        id=ann_id,
+        span=Span(start=0, end=3, text="abc"),
+        concepts=[ConceptMatch(concept_text="abc", folio_iri=iri)],
+    )
+
+
+class TestGetAnnotation:
+    def test_finds_by_id(self):
+        result = JobResult(annotations=[_ann("a1"), _ann("a2")])
+        assert result.get_annotation("a2").id == "a2"
+
+    def test_missing_returns_none(self):
+        result = JobResult(annotations=[_ann("a1")])
+        assert result.get_annotation("nope") is None
+
+    def test_sees_appended_annotation(self):
+        result = JobResult(annotations=[_ann("a1")])
+        assert result.get_annotation("a1") is not None
+        result.annotations.append(_ann("a2"))
+        assert result.get_annotation("a2").id == "a2"
+
+    def test_sees_reassigned_list(self):
+        result = JobResult(annotations=[_ann("a1")])
+        assert result.get_annotation("a1") is not None
+        result.annotations = [_ann("b1")]
+        assert result.get_annotation("a1") is None
+        assert result.get_annotation("b1").id == "b1"
+
+    def test_sees_replaced_element(self):
+        result = JobResult(annotations=[_ann("a1")])
+        assert result.get_annotation("a1") is not None
+        result.annotations[0] = _ann("c1")
+        assert result.get_annotation("c1").id == "c1"
+
+    def test_returns_live_object(self):
+        job = Job(result=JobResult(annotations=[_ann("a1")]))
+        job.result.get_annotation("a1").state = "rejected"
+        assert job.result.annotations[0].state == "rejected"
+
+    def test_index_not_serialized(self):
+        result = JobResult(annotations=[_ann("a1")])
+        result.get_annotation("a1")
+        assert "_annotation_index" not in result.model_dump_json()
+
+
+class TestPrimaryIriIndex:
+    def test_groups_by_primary_iri(self):
+        result = JobResult(annotations=[
+            _ann("a1", "http://x/1"), _ann("a2", "http://x/2"), _ann("a3", "http://x/1"),
+        ])
+        assert [a.id for a in result.annotations_by_primary_iri("http://x/1")] == ["a1", "a3"]
+        assert result.annotations_by_primary_iri("http://x/none") == []
+
+    def test_update_primary_iri_moves_bucket(self):
+        ann = _ann("a1", "http://x/1")
+        ann.concepts.append(ConceptMatch(concept_text="abc", folio_iri="http://x/2"))
+        result = JobResult(annotations=[ann])
+        assert result.annotations_by_primary_iri("http://x/1") == [ann]
+
+        ann.concepts[0], ann.concepts[1] = ann.concepts[1], ann.concepts[0]
+        result.update_primary_iri(ann, "http://x/1")
+
+        assert result.annotations_by_primary_iri("http://x/1") == []
+        assert result.annotations_by_primary_iri("http://x/2") == [ann]
+
+    def test_rebuilds_after_append(self):
+        result = JobResult(annotations=[_ann("a1", "http://x/1")])
+        assert len(result.annotations_by_primary_iri("http://x/1")) == 1
+        result.annotations.append(_ann("a2", "http://x/1"))
+        assert len(result.annotations_by_primary_iri("http://x/1")) == 2
+
+
+async def test_loaded_annotation_ids_are_interned(tmp_path):
+    import sys
+
+    from app.storage.job_store import JobStore
+
+    job = Job(result=JobResult(annotations=[_ann("ann-interned-1")]))
+    await JobStore(base_dir=tmp_path).save(job)
+    loaded = await JobStore(base_dir=tmp_path).load(job.id)
+    assert loaded.result.annotations[0].id is sys.intern("-".join(["ann", "interned", "1"]))
+
+
+def test_generated_ids_are_unique_uuid4_strings():
+    from uuid import UUID
+
+    from app.models._idgen import next_id
+
+    ids = {next_id() for _ in range(3000)}  # spans several pool refills
+    assert len(ids) == 3000
+    assert all(UUID(i).version == 4 and str(UUID(i)) == i for i in ids)
+    assert UUID(Annotation(span=Span(start=0, end=1, text="a")).id).version == 4
+
+
+def test_span_is_slotted_and_validated_when_nested():
+    import pytest
+    from pydantic import ValidationError
+
+    span = Span(start=0, end=3, text="abc")
+    assert not hasattr(span, "__dict__")
+    assert Annotation(span=span).span is span
+    with pytest.raises(ValidationError):
+        Annotation.model_validate({"span": {"start": "x", "end": 3, "text": "abc"}})
+
+
+class TestDraft:
+    def test_annotation_for_update_copies_only_that_annotation(self):
+        result = JobResult(annotations=[_ann("a1", "http://x/1"), _ann("a2", "http://x/1")])
+        assert len(result.annotations_by_primary_iri("http://x/1")) == 2
+        draft = result.draft()
+
+        edited = draft.annotation_for_update("a1")
+        edited.state = "rejected"
+
+        assert result.get_annotation("a1").state == "preliminary"
+        assert draft.get_annotation("a1") is edited
+        assert draft.get_annotation("a2") is result.get_annotation("a2")
+        assert edited in draft.annotations_by_primary_iri("http://x/1")
+        assert edited not in result.annotations_by_primary_iri("http://x/1")
+
+    def test_promotion_on_draft_leaves_original_index(self):
+        ann = _ann("a1", "http://x/1")
+        ann.concepts.append(ConceptMatch(concept_text="abc", folio_iri="http://x/2"))
+        result = JobResult(annotations=[ann])
+        result.annotations_by_primary_iri("http://x/1")
+        draft = result.draft()
+
+        edited = draft.annotation_for_update("a1")
+        edited.concepts.reverse()
+        draft.update_primary_iri(edited, "http://x/1")
+
+        assert draft.annotations_by_primary_iri("http://x/2") == [edited]
+        assert result.annotations_by_primary_iri("http://x/1") == [ann]
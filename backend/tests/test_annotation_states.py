@@ -26,3 +26,11 @@ class TestAnnotationStates:
     def test_source_includes_semantic_ruler(self):
         c = ConceptMatch(concept_text="test", source="semantic_ruler")
         assert c.source == "semantic_ruler"
+
+    def test_state_vocabulary_is_closed(self):
+        import pytest
+        from pydantic import ValidationError
+
+        assert ConceptMatch(concept_text="test", state="backup").state == "backup"
+        with pytest.raises(ValidationError):
+            ConceptMatch(concept_text="test", state="maybe")
@@ -0,0 +1,58 @@
+"""Tests for the cached GET /enrich/branches endpoint."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.api.routes.enrich import _branches_payload
+
+_SERVICE_PATH = "app.services.folio.folio_service.FolioService.get_instance"
+
+
+def _mock_service(folio):
+    service = MagicMock()
+    service._get_folio.return_value = folio
+    service.get_all_branches.return_value = [{"name": "Area of Law", "color": "#000", "concept_count": 3}]
+    return service
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    _branches_payload.cache_clear()
+    yield
+    _branches_payload.cache_clear()
+
+
+async def test_branches_computed_once_per_folio(client):
+    service = _mock_service(MagicMock())
+    with patch(_SERVICE_PATH, return_value=service):
+        first = await client.get("/enrich/branches")
+        second = await client.get("/enrich/branches")
+
+    assert first.json() == {"branches": service.get_all_branches.return_value, "total": 1}
+    assert second.content == first.content
+    assert service.get_all_branches.call_count == 1
+    assert "max-age" in first.headers["cache-control"]
+
+
+async def test_branches_recomputed_after_folio_reload(client):
+    service = _mock_service(MagicMock())
+    with patch(_SERVICE_PATH, return_value=service):
+        await client.get("/enrich/branches")
+        service._get_folio.return_value = MagicMock()
+        await client.get("/enrich/branches")
+
+    assert service.get_all_branches.call_count == 2
+
+
+async def test_if_none_match_returns_304(client):
+    with patch(_SERVICE_PATH, return_value=_mock_service(MagicMock())):
+        first = await client.get("/enrich/branches")
+        etag = first.headers["etag"]
+        second = await client.get("/enrich/branches", headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
@@ -98,3 +98,32 @@ async def test_batch_all_unknown(client):
 
     assert resp.status_code == 200
     assert resp.json() == {}
+
+
+@pytest.mark.anyio
+async def test_batch_preserves_request_order(client):
+    """Results come back keyed in request order despite concurrent lookups."""
+    hashes = [f"HASH{i}" for i in range(40)]
+
+    with (
+        patch(_FOLIO_PATH, return_value=MagicMock()),
+        patch(_LOOKUP_PATH, side_effect=lambda folio, h: _make_mock_detail(h, h)),
+    ):
+        resp = await client.post("/concepts/batch", json={"iri_hashes": hashes})
+
+    assert resp.status_code == 200
+    assert list(resp.json()) == hashes
+
+
+@pytest.mark.anyio
+async def test_batch_deduplicates_hashes(client):
+    """Repeated hashes yield a single key in a valid JSON object."""
+    with (
+        patch(_FOLIO_PATH, return_value=MagicMock()),
+        patch(_LOOKUP_PATH, side_effect=lambda folio, h: _make_mock_detail(h, h)),
+    ):
+        resp = await client.post("/concepts/batch", json={"iri_hashes": ["A", "B", "A"]})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    assert list(resp.json()) == ["A", "B"]
@@ -0,0 +1,71 @@
+"""Tests for the response caches on GET /concepts/{iri_hash} and /graph."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+_LOOKUP_PATH = "app.services.folio.concept_detail.lookup_concept_detail"
+_GRAPH_PATH = "app.api.routes.concepts.build_entity_graph"
+_SERVICE_PATH = "app.services.folio.folio_service.FolioService.get_instance"
+
+
+def _make_mock_model(payload: dict):
+    model = MagicMock()
+    model.model_dump.return_value = payload
+    return model
+
+
+def _mock_service(folio):
+    service = MagicMock()
+    service._get_folio.return_value = folio
+    return service
+
+
+async def test_detail_served_from_cache(client):
+    lookup = MagicMock(return_value=_make_mock_model({"iri_hash": "H1", "label": "Tort"}))
+    with (
+        patch(_SERVICE_PATH, return_value=_mock_service(MagicMock())),
+        patch(_LOOKUP_PATH, lookup),
+    ):
+        first = await client.get("/concepts/H1")
+        second = await client.get("/concepts/H1")
+
+    assert first.status_code == 200
+    assert second.json() == first.json()
+    assert lookup.call_count == 1
+
+
+async def test_detail_cache_cleared_on_folio_reload(client):
+    lookup = MagicMock(return_value=_make_mock_model({"iri_hash": "H1", "label": "Tort"}))
+    with patch(_LOOKUP_PATH, lookup):
+        with patch(_SERVICE_PATH, return_value=_mock_service(MagicMock())):
+            await client.get("/concepts/H1")
+        with patch(_SERVICE_PATH, return_value=_mock_service(MagicMock())):
+            await client.get("/concepts/H1")
+
+    assert lookup.call_count == 2
+
+
+async def test_unknown_concept_not_cached(client):
+    lookup = MagicMock(return_value=None)
+    with (
+        patch(_SERVICE_PATH, return_value=_mock_service(MagicMock())),
+        patch(_LOOKUP_PATH, lookup),
+    ):
+        assert (await client.get("/concepts/MISSING")).status_code == 404
+        assert (await client.get("/concepts/MISSING")).status_code == 404
+
+    assert lookup.call_count == 2
+
+
+async def test_graph_cache_keyed_on_params(client):
+    build = MagicMock(return_value=_make_mock_model({"nodes": [], "edges": []}))
+    with (
+        patch(_SERVICE_PATH, return_value=_mock_service(MagicMock())),
+        patch(_GRAPH_PATH, build),
+    ):
+        await client.get("/concepts/H1/graph")
+        await client.get("/concepts/H1/graph")
+        await client.get("/concepts/H1/graph?max_nodes=50")
+
+    assert build.call_count == 2
@@ -9,6 +9,7 @@ from app.services.folio.concept_detail import (
     _get_all_parents,
     build_entity_graph,
     lookup_concept_detail,
+    lookup_concept_detail_dict,
 )
 
 
@@ -153,6 +154,26 @@ class TestLookupConceptDetail:
         assert result.branch_color  # Should have some color
 
 
+class TestLookupConceptDetailDict:
+    def test_matches_model_dump(self, mock_folio):
+        result = lookup_concept_detail_dict(mock_folio, "CHILD1")
+        assert result == lookup_concept_detail(mock_folio, "CHILD1").model_dump()
+
+    def test_returns_none_for_unknown(self, mock_folio):
+        assert lookup_concept_detail_dict(mock_folio, "NONEXISTENT") is None
+
+    def test_memoized_per_folio(self, mock_folio):
+        first = lookup_concept_detail_dict(mock_folio, "CHILD1")
+        assert lookup_concept_detail_dict(mock_folio, "CHILD1") is first
+
+    def test_new_folio_invalidates(self, mock_folio):
+        first = lookup_concept_detail_dict(mock_folio, "CHILD1")
+        reloaded = FakeFOLIO(mock_folio.classes)
+        second = lookup_concept_detail_dict(reloaded, "CHILD1")
+        assert second is not first
+        assert second == first
+
+
 class TestBuildEntityGraph:
     def test_returns_none_for_unknown(self, mock_folio):
         result = build_entity_graph(mock_folio, "NONEXISTENT")
@@ -53,6 +53,22 @@ class TestDismissRestore:
         asyncio.run(enrich_mod._job_store.save(job))
         return job, iri
 
+    def test_stream_annotations_ndjson(self, client, job_with_annotations):
+        import json
+
+        job, _ = job_with_annotations
+        resp = client.get(f"/enrich/{job.id}/annotations")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in resp.text.splitlines()]
+        assert [r["id"] for r in rows] == ["ann-1", "ann-2", "ann-3", "ann-4"]
+        assert rows[3]["concepts"][0]["folio_iri"] == "http://example.com/court"
+
+    def test_stream_annotations_job_not_found(self, client):
+        from uuid import uuid4
+
+        assert client.get(f"/enrich/{uuid4()}/annotations").status_code == 404
+
     def test_reject_annotation(self, client, job_with_annotations):
         job, iri = job_with_annotations
         resp = client.post(f"/enrich/{job.id}/annotations/ann-1/reject")
@@ -317,3 +333,15 @@ class TestExportExcludesDismissed:
         assert resp.status_code == 200
         data = json.loads(resp.content)
         assert len(data["annotations"]) == 2
+
+    def test_export_filter_leaves_stored_job_intact(self, client, job_with_dismissed):
+        import app.api.routes.export as export_mod
+
+        job = job_with_dismissed
+        assert client.get(f"/enrich/{job.id}/export?format=json").status_code == 200
+        stored = asyncio.run(export_mod._job_store.load(job.id))
+        assert len(stored.result.annotations) == 2
+
+    def test_export_unknown_format(self, client, job_with_dismissed):
+        resp = client.get(f"/enrich/{job_with_dismissed.id}/export?format=nope")
+        assert resp.status_code == 400
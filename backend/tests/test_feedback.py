@@ -87,6 +87,29 @@ class TestFeedbackStore:
     def store(self, tmp_path: Path) -> FeedbackStore:
         return FeedbackStore(base_dir=tmp_path / "feedback")
 
+    def test_get_instance_is_shared(self):
+        assert FeedbackStore.get_instance() is FeedbackStore.get_instance()
+
+    @pytest.mark.asyncio
+    async def test_find_by_annotation_tracks_saves_and_deletes(self, store: FeedbackStore):
+        def _entry(fid: str, ann: str) -> FeedbackEntry:
+            return FeedbackEntry(
+                id=fid, job_id="job-1", annotation_id=ann, rating="up",
+                created_at="2025-01-01T00:00:00+00:00",
+            )
+
+        await store.save(_entry("fb-1", "ann-1"))
+        assert (await store.find_by_annotation("job-1", "ann-1")).id == "fb-1"
+        assert await store.find_by_annotation("job-1", "ann-2") is None
+
+        # Index was built above; later saves and deletes must keep it current
+        await store.save(_entry("fb-2", "ann-2"))
+        assert (await store.find_by_annotation("job-1", "ann-2")).id == "fb-2"
+        await store.delete("fb-1")
+        assert await store.find_by_annotation("job-1", "ann-1") is None
+        await store.delete_all()
+        assert await store.find_by_annotation("job-1", "ann-2") is None
+
     @pytest.mark.asyncio
     async def test_save_and_load(self, store: FeedbackStore):
         entry = FeedbackEntry(
@@ -102,6 +125,17 @@ class TestFeedbackStore:
         assert loaded.id == "fb-1"
         assert loaded.rating == "up"
 
+    @pytest.mark.asyncio
+    async def test_loaded_annotation_id_is_interned(self, store: FeedbackStore):
+        import sys
+
+        await store.save(FeedbackEntry(
+            id="fb-1", job_id="job-1", annotation_id="ann-interned-fb", rating="up",
+            created_at="2025-01-01T00:00:00+00:00",
+        ))
+        loaded = await store.load("fb-1")
+        assert loaded.annotation_id is sys.intern("-".join(["ann", "interned", "fb"]))
+
     @pytest.mark.asyncio
     async def test_load_nonexistent(self, store: FeedbackStore):
         loaded = await store.load("nonexistent")
@@ -225,6 +259,18 @@ class TestFeedbackStore:
         assert insights.thumbs_up == 1
         assert insights.thumbs_down == 0
 
+    @pytest.mark.asyncio
+    async def test_insights_recent_feedback_are_full_entries(self, store: FeedbackStore):
+        await store.save(FeedbackEntry(
+            id="fb-1", job_id="job-1", annotation_id="ann-1", rating="down",
+            comment="wrong branch", lineage=[{"stage": "entity_ruler", "action": "created"}],
+            created_at="2025-01-01T00:00:00+00:00",
+        ))
+
+        insights = await store.get_insights()
+        assert insights.recent_feedback[0].comment == "wrong branch"
+        assert insights.recent_feedback[0].lineage == [{"stage": "entity_ruler", "action": "created"}]
+
 
 class TestFeedbackAPI:
     @pytest.fixture
@@ -298,6 +344,14 @@ class TestFeedbackAPI:
         })
         assert resp.status_code == 422
 
+    def test_submit_feedback_malformed_job_id(self, client):
+        resp = client.post("/feedback", json={
+            "job_id": "not-a-uuid",
+            "annotation_id": "ann-123",
+            "rating": "up",
+        })
+        assert resp.status_code == 422
+
     def test_submit_feedback_job_not_found(self, client):
         resp = client.post("/feedback", json={
             "job_id": str(uuid4()),
@@ -401,6 +455,29 @@ class TestFeedbackAPI:
         assert "rating" in lines[0]
         assert "lineage" in lines[0]
 
+    def test_export_unknown_format_rejected(self, client):
+        assert client.get("/feedback/export?format=xml").status_code == 422
+
+    def test_export_csv_spans_batches(self, client, monkeypatch):
+        import asyncio
+        import csv
+        import io
+
+        import app.api.routes.feedback as fb_mod
+
+        monkeypatch.setattr(fb_mod, "CSV_EXPORT_BATCH_SIZE", 2)
+        for i in range(5):
+            asyncio.run(fb_mod._feedback_store.save(FeedbackEntry(
+                id=f"fb-{i}", job_id="job-1", annotation_id=f"ann-{i}", rating="up",
+                comment="has, comma", lineage=[{"stage": "s"}],
+                created_at="2025-01-01T00:00:00+00:00",
+            )))
+        resp = client.get("/feedback/export?format=csv")
+        rows = list(csv.reader(io.StringIO(resp.text)))
+        assert rows[0][0] == "id"
+        assert [r[0] for r in rows[1:]] == [f"fb-{i}" for i in range(5)]
+        assert rows[1][5] == "has, comma"
+
     def test_delete_single_feedback(self, client, job_with_annotation):
         job = job_with_annotation
         resp = client.post("/feedback", json={
@@ -0,0 +1,101 @@
+"""Tests for the /health endpoints."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+
+async def test_health_detail_reports_all_subsystems(client):
+    resp = await client.get("/health/detail")
+    assert resp.status_code == 200
+    assert set(resp.json()) == {"backend", "folio_ontology", "embedding", "llm", "spacy"}
+
+
+async def test_health_detail_runs_checks_concurrently(client):
+    # Each check waits until all three have started; sequential execution would time out
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _check() -> dict:
+        barrier.wait()
+        return {"status": "ready"}
+
+    with (
+        patch("app.api.routes.health._check_folio", _check),
+        patch("app.api.routes.health._check_embedding", _check),
+        patch("app.api.routes.health._check_spacy", _check),
+    ):
+        resp = await client.get("/health/detail")
+
+    data = resp.json()
+    assert data["folio_ontology"] == data["embedding"] == data["spacy"] == {"status": "ready"}
+
+
+def test_check_llm_uses_provider_key():
+    from app.api.routes.health import _check_llm
+
+    with (
+        patch("app.api.routes.health.settings.llm_provider", "groq"),
+        patch("app.api.routes.health.settings.groq_api_key", ""),
+    ):
+        assert _check_llm()["status"] == "no_api_key"
+    with (
+        patch("app.api.routes.health.settings.llm_provider", "groq"),
+        patch("app.api.routes.health.settings.groq_api_key", "k"),
+    ):
+        assert _check_llm()["status"] == "configured"
+    with patch("app.api.routes.health.settings.llm_provider", "lmstudio"):
+        assert _check_llm()["status"] == "configured"
+
+
+async def test_health_etag_returns_304(client):
+    first = await client.get("/health")
+    assert first.json() == {"status": "ok", "embedding_ready": True}
+    second = await client.get("/health", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 304
+
+
+def test_check_folio_result_is_briefly_cached():
+    from app.api.routes import health
+
+    health._folio_status_cache.clear()
+    with patch.object(health, "_check_folio_uncached", return_value={"status": "ready"}) as check:
+        assert health._check_folio() == {"status": "ready"}
+        assert health._check_folio() == {"status": "ready"}
+    assert check.call_count == 1
+    health._folio_status_cache.clear()
+
+
+def test_check_folio_is_safe_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from app.api.routes import health
+
+    health._folio_status_cache.clear()
+    # Zero TTL: every read races an expiry, as overlapping /health/detail calls do
+    with (
+        patch.object(health._folio_status_cache, "ttl_seconds", 0),
+        patch.object(health, "_check_folio_uncached", return_value={"status": "ready"}),
+        ThreadPoolExecutor(max_workers=8) as pool,
+    ):
+        results = list(pool.map(lambda _: health._check_folio(), range(2000)))
+    assert all(r == {"status": "ready"} for r in results)
+    health._folio_status_cache.clear()
+
+
+async def test_health_reports_embedding_readiness(client):
+    import asyncio
+
+    from app.main import app
+
+    event = asyncio.Event()
+    app.state.embedding_ready = event
+    try:
+        pending = await client.get("/health")
+        event.set()
+        ready = await client.get("/health", headers={"If-None-Match": pending.headers["etag"]})
+    finally:
+        del app.state.embedding_ready
+    assert pending.json()["embedding_ready"] is False
+    assert ready.status_code == 200
+    assert ready.json()["embedding_ready"] is True
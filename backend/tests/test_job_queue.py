@@ -0,0 +1,82 @@
+"""Tests for the bounded background job queue."""
+
+import asyncio
+
+import pytest
+
+from app.models.document import DocumentInput
+from app.models.job import Job
+from app.pipeline.job_queue import JobQueue, JobQueueFull
+
+
+class _GatedOrchestrator:
+    def __init__(self) -> None:
+        self.gate = asyncio.Event()
+        self.started: list[str] = []
+        self.peak = 0
+        self._active = 0
+
+    async def run(self, job: Job) -> None:
+        self.started.append(str(job.id))
+        self._active += 1
+        self.peak = max(self.peak, self._active)
+        try:
+            await self.gate.wait()
+        finally:
+            self._active -= 1
+
+
+def _job() -> Job:
+    return Job(input=DocumentInput(content="text"))
+
+
+async def test_limits_concurrent_runs():
+    queue = JobQueue(max_workers=2, max_queued=5)
+    orch = _GatedOrchestrator()
+    for _ in range(5):
+        queue.submit(orch, _job())
+    await asyncio.sleep(0.01)
+    assert queue.running == 2
+    assert queue.queued == 3
+
+    orch.gate.set()
+    await queue._queue.join()
+    assert orch.peak == 2
+    assert len(orch.started) == 5
+    await queue.shutdown()
+
+
+async def test_rejects_when_saturated():
+    queue = JobQueue(max_workers=1, max_queued=1)
+    orch = _GatedOrchestrator()
+    queue.submit(orch, _job())
+    await asyncio.sleep(0.01)
+    queue.submit(orch, _job())
+    with pytest.raises(JobQueueFull):
+        queue.submit(orch, _job())
+    await queue.shutdown()
+
+
+async def test_worker_survives_crash():
+    class _Boom:
+        async def run(self, job: Job) -> None:
+            raise RuntimeError("boom")
+
+    queue = JobQueue(max_workers=1, max_queued=2)
+    orch = _GatedOrchestrator()
+    orch.gate.set()
+    queue.submit(_Boom(), _job())
+    queue.submit(orch, _job())
+    await queue._queue.join()
+    assert len(orch.started) == 1
+    await queue.shutdown()
+
+
+async def test_start_spawns_workers_once():
+    queue = JobQueue(max_workers=3, max_queued=1)
+    queue.start()
+    workers = list(queue._workers)
+    queue.start()
+    assert len(workers) == 3
+    assert queue._workers == workers
+    await queue.shutdown()
@@ -12,6 +12,11 @@ from app.storage.job_store import JobStore
 
 
 class TestJobRetention:
+    def test_new_job_timestamps_match(self):
+        job = Job()
+        assert job.created_at == job.updated_at
+        assert job.created_at.tzinfo is not None
+
     @pytest.mark.asyncio
     async def test_cleanup_expired_removes_old_jobs(self, tmp_path: Path):
         store = JobStore(base_dir=tmp_path / "jobs")
@@ -102,3 +107,54 @@ class TestConcurrencyLimits:
         reloaded = await store.load(stale.id)
         assert reloaded.status == JobStatus.FAILED
         assert reloaded.error == "Job timed out (stale)"
+
+
+class TestLegacyJobFiles:
+    @pytest.mark.asyncio
+    async def test_single_branch_concepts_migrated_on_load(self, tmp_path: Path):
+        from app.models.annotation import Annotation, ConceptMatch, Span
+        from app.models.job import JobResult
+
+        store = JobStore(base_dir=tmp_path / "jobs")
+        job = Job(result=JobResult(annotations=[Annotation(
+            span=Span(start=0, end=4, text="tort"),
+            concepts=[ConceptMatch(concept_text="tort", branches=["Area of Law"])],
+        )]))
+        data = json.loads(job.model_dump_json())
+        concept = data["result"]["annotations"][0]["concepts"][0]
+        concept["branch"] = concept.pop("branches")[0]
+        (tmp_path / "jobs" / f"{job.id}.json").write_text(json.dumps(data))
+
+        loaded = await store.load(job.id)
+        assert loaded.result.annotations[0].concepts[0].branches == ["Area of Law"]
+
+    @pytest.mark.asyncio
+    async def test_legacy_concepts_migrated_when_file_mentions_branches(self, tmp_path: Path):
+        from app.models.annotation import Annotation, ConceptMatch, Span
+        from app.models.job import JobResult
+
+        store = JobStore(base_dir=tmp_path / "jobs")
+        job = Job(result=JobResult(annotations=[
+            Annotation(
+                span=Span(start=0, end=4, text="tort"),
+                concepts=[ConceptMatch(concept_text="tort", branches=["Area of Law"])],
+            ),
+            Annotation(
+                span=Span(start=5, end=13, text="branches"),
+                concepts=[ConceptMatch(concept_text="branches", branches=["Event"])],
+            ),
+        ]))
+        data = json.loads(job.model_dump_json())
+        concept = data["result"]["annotations"][0]["concepts"][0]
+        concept["branch"] = concept.pop("branches")[0]
+        (tmp_path / "jobs" / f"{job.id}.json").write_text(json.dumps(data))
+
+        loaded = await store.load(job.id)
+        assert loaded.result.annotations[0].concepts[0].branches == ["Area of Law"]
+        assert loaded.result.annotations[1].concepts[0].branches == ["Event"]
+
+    def test_model_validate_legacy(self):
+        from app.models.annotation import ConceptMatch
+
+        assert ConceptMatch.model_validate_legacy({"concept_text": "x", "branch": ""}).branches == []
+        assert ConceptMatch.model_validate_legacy({"concept_text": "x", "branch": "Event"}).branches == ["Event"]
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from app.models.llm_models import ModelInfo
+from app.models.llm_models import LLMProviderType, ModelInfo
 from app.services.llm.base import LLMProvider
 from app.services.llm.registry import get_provider
 
@@ -91,3 +91,35 @@ class TestLLMRegistry:
     def test_backward_compat_lm_studio(self):
         provider = get_provider("lm_studio")
         assert provider is not None
+
+
+class TestRequestLLMCache:
+    def test_same_config_reuses_provider(self):
+        from app.api.routes.enrich import EnrichRequest, _get_llm_for_request
+
+        req = EnrichRequest(content="x", llm_provider="openai", llm_model="gpt-4o", api_key="k1")
+        first = _get_llm_for_request(req)
+        assert first is not None
+        assert _get_llm_for_request(req) is first
+
+    def test_different_key_builds_new_provider(self):
+        from app.api.routes.enrich import EnrichRequest, _get_llm_for_request
+
+        a = _get_llm_for_request(EnrichRequest(content="x", llm_provider="openai", api_key="k1"))
+        b = _get_llm_for_request(EnrichRequest(content="x", llm_provider="openai", api_key="k2"))
+        assert a is not b
+        assert b.api_key == "k2"
+
+    def test_provider_name_aliases(self):
+        from app.services.llm.registry import resolve_provider_type
+
+        assert resolve_provider_type("lm-studio") is LLMProviderType.lmstudio
+        assert resolve_provider_type("lm_studio") is LLMProviderType.lmstudio
+        assert resolve_provider_type("meta-llama") is LLMProviderType.meta_llama
+        assert resolve_provider_type("github_models") is LLMProviderType.github_models
+        assert resolve_provider_type("not-a-provider") is None
+
+    def test_unknown_provider_skips_llm(self):
+        from app.api.routes.enrich import EnrichRequest, _get_llm_for_request
+
+        assert _get_llm_for_request(EnrichRequest(content="x", llm_provider="nope")) is None
@@ -15,6 +15,7 @@ from app.services.llm.registry import (
     PROVIDER_DISPLAY_NAMES,
     REQUIRES_API_KEY,
     get_provider,
+    get_shared_provider,
 )
 from app.services.llm.url_validator import validate_base_url
 
@@ -124,6 +125,14 @@ class TestGetProvider:
         p = get_provider("openai", api_key="k", model="gpt-4")
         assert p.model == "gpt-4"
 
+    def test_shared_provider_reused_and_key_not_retained(self):
+        from app.services.llm import registry
+
+        p = get_shared_provider(LLMProviderType.openai, "gpt-4", "sk-secret-key")
+        assert get_shared_provider(LLMProviderType.openai, "gpt-4", "sk-secret-key") is p
+        assert get_shared_provider(LLMProviderType.openai, "gpt-4", "sk-other-key") is not p
+        assert all("sk-secret-key" not in key for key in registry._shared_providers)
+
 
 # ── SSRF validator tests ────────────────────────────────────────
 
@@ -267,8 +276,6 @@ class TestGoogleProvider:
     async def test_list_models_with_mock(self):
         from app.services.llm.google_provider import GoogleProvider
 
-        provider = GoogleProvider(api_key="test")
-
         mock_data = {
             "models": [
                 {
@@ -285,21 +292,18 @@ class TestGoogleProvider:
             ]
         }
 
-        with patch("app.services.llm.google_provider.httpx.AsyncClient") as mock_cls:
-            mock_client = AsyncMock()
-            mock_resp = MagicMock()
-            mock_resp.json.return_value = mock_data
-            mock_resp.raise_for_status = MagicMock()
-            mock_client.get = AsyncMock(return_value=mock_resp)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_cls.return_value = mock_client
+        mock_client = AsyncMock()
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = mock_data
+        mock_resp.raise_for_status = MagicMock()
+        mock_client.get = AsyncMock(return_value=mock_resp)
+        provider = GoogleProvider(api_key="test", http_client=mock_client)
 
-            models = await provider.list_models()
-            # Should only include generateContent models
-            assert len(models) == 1
-            assert models[0].id == "gemini-2.0-flash"
-            assert models[0].context_window == 1048576
+        models = await provider.list_models()
+        # Should only include generateContent models
+        assert len(models) == 1
+        assert models[0].id == "gemini-2.0-flash"
+        assert models[0].context_window == 1048576
 
 
 # ── CohereProvider tests ────────────────────────────────────────
@@ -309,8 +313,6 @@ class TestCohereProvider:
     async def test_list_models_with_mock(self):
         from app.services.llm.cohere_provider import CohereProvider
 
-        provider = CohereProvider(api_key="test")
-
         mock_data = {
             "models": [
                 {"name": "command-r-plus", "context_length": 128000},
@@ -318,17 +320,61 @@ class TestCohereProvider:
             ]
         }
 
-        with patch("app.services.llm.cohere_provider.httpx.AsyncClient") as mock_cls:
-            mock_client = AsyncMock()
-            mock_resp = MagicMock()
-            mock_resp.json.return_value = mock_data
-            mock_resp.raise_for_status = MagicMock()
-            mock_client.get = AsyncMock(return_value=mock_resp)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_cls.return_value = mock_client
-
-            models = await provider.list_models()
-            assert len(models) == 2
-            assert models[0].id == "command-r"
-            assert models[1].id == "command-r-plus"
+        mock_client = AsyncMock()
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = mock_data
+        mock_resp.raise_for_status = MagicMock()
+        mock_client.get = AsyncMock(return_value=mock_resp)
+        provider = CohereProvider(api_key="test", http_client=mock_client)
+
+        models = await provider.list_models()
+        assert len(models) == 2
+        assert models[0].id == "command-r"
+        assert models[1].id == "command-r-plus"
+
+
+# ── Shared HTTP client ──────────────────────────────────────────
+
+class TestSharedHttpClient:
+    @pytest.mark.asyncio
+    async def test_providers_share_pooled_client(self):
+        from app.services.llm.http_client import close_http_client, get_http_client
+        from app.services.llm.registry import get_provider
+
+        try:
+            google = get_provider("google", api_key="k")
+            cohere = get_provider("cohere", api_key="k")
+            assert google._http() is cohere._http() is get_http_client()
+        finally:
+            await close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_recreated(self):
+        from app.services.llm.http_client import close_http_client, get_http_client
+
+        first = get_http_client()
+        await close_http_client()
+        assert first.is_closed
+        second = get_http_client()
+        assert second is not first
+        await close_http_client()
+
+    def test_injected_client_wins(self):
+        from app.services.llm.registry import get_provider
+
+        client = MagicMock()
+        assert get_provider("google", api_key="k", http_client=client)._http() is client
+
+    @pytest.mark.parametrize("provider,module,cls", [
+        ("openai", "openai", "AsyncOpenAI"),
+        ("anthropic", "anthropic", "AsyncAnthropic"),
+    ])
+    def test_sdks_keep_their_long_timeout(self, provider, module, cls):
+        from app.services.llm.http_client import SDK_TIMEOUT
+        from app.services.llm.registry import get_provider
+
+        sdk = MagicMock()
+        with patch.dict("sys.modules", {module: sdk}):
+            get_provider(provider, api_key="k", http_client=MagicMock())._get_client()
+        assert getattr(sdk, cls).call_args.kwargs["timeout"] is SDK_TIMEOUT
+        assert SDK_TIMEOUT.read == 600.0
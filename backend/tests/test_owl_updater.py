@@ -96,7 +96,7 @@ class TestApply:
         mock_emb_svc.index_folio_labels = MagicMock()
 
         with patch("app.services.folio.owl_cache.ensure_owl_fresh"), \
-             patch("app.storage.job_store.JobStore", return_value=mock_store), \
+             patch("app.storage.job_store.JobStore.get_instance", return_value=mock_store), \
              patch("app.services.folio.folio_service.FolioService.get_instance", return_value=mock_folio_svc), \
              patch("app.services.embedding.service.EmbeddingService.get_instance", return_value=mock_emb_svc), \
              patch("app.services.embedding.service.build_embedding_index"), \
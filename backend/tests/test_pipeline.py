@@ -89,6 +89,107 @@ class TestJobStore:
         assert await store.delete(job.id)
         assert await store.load(job.id) is None
 
+    @pytest.mark.asyncio
+    async def test_save_deferred_coalesces_writes(self, tmp_path: Path):
+        import asyncio
+
+        store = JobStore(base_dir=tmp_path / "jobs")
+        job = Job(input=DocumentInput(content="test"))
+        store.save_deferred(job, delay=0.01)
+        job.error = "second edit"
+        store.save_deferred(job, delay=0.01)
+
+        # Pending job is visible to readers before it hits disk
+        assert not store._job_path(job.id).exists()
+        assert await store.load(job.id) is job
+
+        await asyncio.sleep(0.05)
+        assert store._job_path(job.id).exists()
+        fresh = JobStore(base_dir=tmp_path / "jobs")
+        assert (await fresh.load(job.id)).error == "second edit"
+
+    def test_get_instance_is_shared(self):
+        assert JobStore.get_instance() is JobStore.get_instance()
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_pending(self, tmp_path: Path):
+        store = JobStore(base_dir=tmp_path / "jobs")
+        job = Job(input=DocumentInput(content="test"))
+        store.save_deferred(job, delay=60)
+        await store.flush()
+        assert store._job_path(job.id).exists()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_task_keeps_newer_entry(self, tmp_path: Path):
+        import asyncio
+
+        store = JobStore(base_dir=tmp_path / "jobs")
+        job = Job(input=DocumentInput(content="test"))
+        store.save_deferred(job, delay=60)
+        old = store._flush_tasks[job.id]
+        await asyncio.sleep(0)  # let the old task start sleeping
+        newer = asyncio.create_task(asyncio.sleep(60))
+        store._flush_tasks[job.id] = newer
+        old.cancel()
+        await asyncio.gather(old, return_exceptions=True)
+        try:
+            assert store._flush_tasks[job.id] is newer
+        finally:
+            newer.cancel()
+
+    @pytest.mark.asyncio
+    async def test_load_served_from_memory_after_save(self, tmp_path: Path):
+        store = JobStore(base_dir=tmp_path / "jobs")
+        job = Job(input=DocumentInput(content="test"))
+        await store.save(job)
+        # Write-through: the file exists, but reads don't need it
+        store._job_path(job.id).unlink()
+        assert await store.load(job.id) is job
+
+    @pytest.mark.asyncio
+    async def test_exists(self, tmp_path: Path):
+        from uuid import uuid4
+
+        store = JobStore(base_dir=tmp_path / "jobs")
+        job = Job(input=DocumentInput(content="test"))
+        assert not await store.exists(job.id)
+        store.save_deferred(job, delay=60)
+        assert await store.exists(job.id)
+        await store.flush()
+        assert await JobStore(base_dir=tmp_path / "jobs").exists(job.id)
+        assert not await store.exists(uuid4())
+
+    @pytest.mark.asyncio
+    async def test_load_caches_disk_read(self, tmp_path: Path):
+        await JobStore(base_dir=tmp_path / "jobs").save(Job(input=DocumentInput(content="x")))
+        store = JobStore(base_dir=tmp_path / "jobs")
+        job_id = (await store.list_jobs())[0].id
+        first = await store.load(job_id)
+        assert await store.load(job_id) is first
+
+    @pytest.mark.asyncio
+    async def test_load_for_update_isolates_cached_job(self, tmp_path: Path):
+        from app.models.annotation import Annotation, Span
+
+        store = JobStore(base_dir=tmp_path / "jobs")
+        job = Job(input=DocumentInput(content="test"))
+        job.result.annotations.append(Annotation(span=Span(start=0, end=4, text="test")))
+        await store.save(job)
+
+        ann_id = job.result.annotations[0].id
+        job.result.get_annotation(ann_id)  # build the index
+        draft = await store.load_for_update(job.id)
+        assert draft is not job
+        # Built indexes carry over to the draft instead of being rebuilt
+        assert draft.result._annotation_index_key == (id(draft.result.annotations), 1)
+        draft.result.annotation_for_update(ann_id).state = "rejected"
+        assert draft.result.get_annotation(ann_id).state == "rejected"
+        # An abandoned edit never reaches other readers
+        assert (await store.load(job.id)).result.get_annotation(ann_id).state == "preliminary"
+
+        store.save_deferred(draft)
+        assert (await store.load(job.id)).result.annotations[0].state == "rejected"
+
 
 @pytest.mark.slow
 @pytest.mark.integration
@@ -97,7 +198,7 @@ class TestAPIEndpoints:
     async def test_health(self, client):
         resp = await client.get("/health")
         assert resp.status_code == 200
-        assert resp.json() == {"status": "ok"}
+        assert resp.json() == {"status": "ok", "embedding_ready": True}
 
     @pytest.mark.asyncio
     async def test_create_enrichment(self, client):
@@ -26,6 +26,7 @@ class TestPricing:
         """Reset cache before each test."""
         pricing._cache = {}
         pricing._cache_fetched_at = 0.0
+        pricing._cache_ttl = pricing.CACHE_TTL_SECONDS
 
     @pytest.mark.asyncio
     async def test_fetch_pricing_parses_response(self):
@@ -111,3 +112,29 @@ class TestPricing:
             prices, _ = await pricing.fetch_pricing()
 
         assert "stale-model" in prices  # Returns stale cache on failure
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_fetch(self):
+        import asyncio
+
+        mock_data = {
+            "m": {"input_cost_per_token": 0.001, "output_cost_per_token": 0.002},
+        }
+        with patch("app.services.llm.pricing.httpx.AsyncClient") as mock_cls:
+            mock_cls.return_value = _make_mock_client(mock_data)
+            results = await asyncio.gather(*(pricing.fetch_pricing() for _ in range(5)))
+
+        assert mock_cls.call_count == 1
+        assert all("m" in prices for prices, _ in results)
+
+    @pytest.mark.asyncio
+    async def test_ttl_is_jittered(self):
+        mock_data = {
+            "m": {"input_cost_per_token": 0.001, "output_cost_per_token": 0.002},
+        }
+        with patch("app.services.llm.pricing.httpx.AsyncClient") as mock_cls:
+            mock_cls.return_value = _make_mock_client(mock_data)
+            await pricing.fetch_pricing()
+
+        spread = pricing.CACHE_TTL_SECONDS * pricing.CACHE_TTL_JITTER
+        assert abs(pricing._cache_ttl - pricing.CACHE_TTL_SECONDS) <= spread
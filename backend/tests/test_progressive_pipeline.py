@@ -145,6 +145,64 @@ class TestEntityRulerAnnotations:
         assert "breach of contract" in texts
         assert "contract" in texts
 
+    @pytest.mark.asyncio
+    async def test_hidden_label_match_type(self):
+        """Alternative-label entries with label_type='hidden' should be accepted."""
+        from app.services.folio.folio_service import FOLIOConcept, LabelInfo
+
+        mock_ruler = MagicMock()
+        mock_ruler.find_matches.return_value = [
+            EntityRulerMatch(
+                text="breach",
+                start_char=4,
+                end_char=10,
+                label="FOLIO_CONCEPT",
+                entity_id="https://lmss.sali.org/R1234",
+                match_type="hidden",
+            ),
+        ]
+
+        stage = EntityRulerStage(ruler=mock_ruler)
+        stage._patterns_loaded = True
+        concept = FOLIOConcept(
+            iri="https://lmss.sali.org/R1234", preferred_label="Breach of Contract",
+            alternative_labels=[], definition="", branch="Area of Law", parent_iris=[],
+        )
+        stage._label_to_concepts = {
+            "breach": [LabelInfo(concept=concept, label_type="hidden", matched_label="Breach")],
+        }
+
+        job = Job()
+        job.result.canonical_text = _make_canonical("The breach was clear.")
+
+        result = await stage.execute(job)
+
+        assert len(result.result.annotations) == 1
+        assert result.result.annotations[0].concepts[0].match_type == "hidden"
+        assert result.result.metadata["ruler_concepts"][0]["match_type"] == "hidden"
+
+    def test_failed_pattern_load_is_retried(self):
+        """A failed FOLIO load should not mark patterns as loaded."""
+        mock_ruler = MagicMock()
+        stage = EntityRulerStage(ruler=mock_ruler)
+
+        with patch(
+            "app.pipeline.stages.entity_ruler_stage.FolioService.get_instance",
+            side_effect=RuntimeError("FOLIO not ready"),
+        ):
+            stage._ensure_patterns_loaded()
+        assert stage._patterns_loaded is False
+
+        svc = MagicMock()
+        svc.get_all_labels.return_value = {}
+        svc.get_all_labels_multi.return_value = {}
+        with patch(
+            "app.pipeline.stages.entity_ruler_stage.FolioService.get_instance",
+            return_value=svc,
+        ):
+            stage._ensure_patterns_loaded()
+        assert stage._patterns_loaded is True
+
 
 # ── ReconciliationStage updates annotation states ─────────────────
 
@@ -403,6 +461,107 @@ class TestParallelOrchestrator:
         assert JobStatus.ENRICHING in statuses_seen
 
 
+class TestPhaseCheckpoints:
+    @pytest.mark.asyncio
+    async def test_parallel_stages_share_one_checkpoint_write(self, tmp_path: Path):
+        from app.pipeline.orchestrator import PipelineConfig
+
+        class MarkStage(PipelineStage):
+            def __init__(self, key: str) -> None:
+                self.key = key
+
+            @property
+            def name(self) -> str:
+                return self.key
+
+            async def execute(self, job: Job) -> Job:
+                job.result.metadata[self.key] = True
+                return job
+
+        store = JobStore(base_dir=tmp_path / "jobs")
+        writes = []
+        original_write = store._write
+        store._write = lambda job: (writes.append(job.status), original_write(job))
+
+        config = PipelineConfig(
+            pre_parallel=[MarkStage("pre")],
+            entity_ruler=MarkStage("ruler"), llm_concept=MarkStage("llm"),
+            early_individual=MarkStage("ind"), early_property=MarkStage("prop"),
+            post_parallel=[MarkStage("post1"), MarkStage("post2")],
+        )
+        job = Job()
+        await PipelineOrchestrator(store, config=config).run(job)
+        await asyncio.sleep(0.2)  # any stray deferred save would land here
+
+        # One write per phase boundary (ENRICHING, phase-2 checkpoint,
+        # COMPLETED) — none per stage
+        assert writes == [JobStatus.ENRICHING, JobStatus.ENRICHING, JobStatus.COMPLETED]
+        loaded = JobStore(base_dir=tmp_path / "jobs")
+        stored = await loaded.load(job.id)
+        keys = ("pre", "ruler", "llm", "ind", "prop", "post1", "post2")
+        assert all(stored.result.metadata[k] for k in keys)
+
+
+    @pytest.mark.asyncio
+    async def test_readers_see_live_job_after_cache_expiry(self, tmp_path: Path):
+        from app.pipeline.orchestrator import PipelineConfig
+
+        store = JobStore(base_dir=tmp_path / "jobs")
+        seen = []
+
+        class ProbeStage(PipelineStage):
+            @property
+            def name(self) -> str:
+                return "probe"
+
+            async def execute(self, job: Job) -> Job:
+                job.result.metadata["probe"] = True
+                store._cache.clear()  # as if the TTL lapsed mid-phase
+                seen.append(await store.load(job.id))
+                return job
+
+        job = Job()
+        await PipelineOrchestrator(store, config=PipelineConfig(post_parallel=[ProbeStage()])).run(job)
+
+        assert seen == [job] and seen[0] is job
+        assert store._live == {}
+
+    @pytest.mark.asyncio
+    async def test_post_completion_checks_overlap_and_save_once(self, tmp_path: Path):
+        from app.pipeline.orchestrator import PipelineConfig
+
+        started = []
+        release = asyncio.Event()
+
+        async def fake_assess(job):
+            started.append("aol")
+            await release.wait()
+            return [{"area": "Torts"}]
+
+        async def fake_check(job):
+            started.append("dtc")
+            if len(started) == 2:
+                release.set()
+            return [{"signal": "mismatch"}]
+
+        store = JobStore(base_dir=tmp_path / "jobs")
+        job = Job()
+        job.result.metadata["self_identified_type"] = "Motion"
+        orchestrator = PipelineOrchestrator(store, llm=MagicMock(), config=PipelineConfig())
+        store.save = AsyncMock()
+        with (
+            patch("app.pipeline.orchestrator.AreaOfLawAssessor") as aol,
+            patch("app.pipeline.orchestrator.DocumentTypeChecker") as dtc,
+        ):
+            aol.return_value.assess = fake_assess
+            dtc.return_value.check = fake_check
+            await asyncio.wait_for(orchestrator._post_completion(job), timeout=2.0)
+
+        assert job.result.metadata["areas_of_law"] == [{"area": "Torts"}]
+        assert job.result.metadata["quality_signals"] == [{"signal": "mismatch"}]
+        store.save.assert_awaited_once()
+
+
 # ── PipelineConfig ────────────────────────────────────────────────
 
 
@@ -422,3 +581,22 @@ class TestPipelineConfig:
         stage_names = [s.name for s in config.post_parallel]
         assert "branch_judge" in stage_names
         assert "metadata" in stage_names
+
+    def test_shared_pipeline_stages_are_the_config_stages(self):
+        from app.pipeline.orchestrator import get_pipeline
+
+        config, stages = get_pipeline(MagicMock())
+        assert stages[:3] == [*config.pre_parallel, config.entity_ruler]
+        assert config.llm_concept in stages
+        assert stages[-len(config.post_parallel):] == config.post_parallel
+        assert len({id(s) for s in stages}) == len(stages)
+
+    def test_llm_individual_and_property_share_a_layer(self):
+        from app.pipeline.orchestrator import _stage_layers
+
+        config = build_pipeline_config(llm=MagicMock())
+        layers = [[s.name for s in layer] for layer in _stage_layers(config.post_parallel)]
+        assert ["llm_individual_linking", "llm_property_linking"] in layers
+        # Every other post-parallel stage still runs on its own, in order
+        assert [n for layer in layers for n in layer] == [s.name for s in config.post_parallel]
+        assert sum(len(layer) > 1 for layer in layers) == 1
@@ -70,3 +70,91 @@ class TestErrorHandling:
         assert resp.status_code == 404
         data = resp.json()
         assert "detail" in data
+
+
+class TestRateLimitMiddleware:
+    @staticmethod
+    def _client(max_requests: int, window_seconds: int = 60):
+        import httpx
+        from starlette.applications import Starlette
+        from starlette.responses import PlainTextResponse
+        from starlette.routing import Route
+
+        from app.middleware.rate_limit import RateLimitMiddleware
+
+        async def ok(request):
+            return PlainTextResponse("ok")
+
+        inner = Starlette(routes=[Route("/enrich", ok, methods=["GET", "POST"])])
+        limiter = RateLimitMiddleware(inner, max_requests=max_requests, window_seconds=window_seconds)
+        transport = httpx.ASGITransport(app=limiter)
+        return limiter, httpx.AsyncClient(transport=transport, base_url="http://test")
+
+    async def test_limits_after_max_requests(self):
+        _, client = self._client(max_requests=2)
+        async with client:
+            codes = [(await client.post("/enrich")).status_code for _ in range(3)]
+            assert (await client.get("/enrich")).status_code == 200
+        assert codes == [200, 200, 429]
+
+    async def test_expired_buckets_are_dropped(self):
+        limiter, client = self._client(max_requests=1, window_seconds=0)
+        async with client:
+            codes = [(await client.post("/enrich")).status_code for _ in range(3)]
+        assert codes == [200, 200, 200]
+        assert len(limiter._buckets) <= 1
+
+    async def test_idle_clients_are_forgotten(self):
+        from collections import Counter
+
+        limiter, client = self._client(max_requests=5, window_seconds=0)
+        limiter._buckets.append((0, Counter({"10.0.0.1": 2})))
+        limiter._requests["10.0.0.1"] = 2
+        async with client:
+            await client.post("/enrich")
+        assert "10.0.0.1" not in limiter._requests
+
+    async def test_hits_share_one_bucket_per_second(self):
+        limiter, client = self._client(max_requests=10)
+        async with client:
+            for _ in range(3):
+                await client.post("/enrich")
+        assert sum(sum(hits.values()) for _, hits in limiter._buckets) == 3
+        assert len(limiter._buckets) <= 2
+
+
+class TestSecurityMiddlewareUnit:
+    @staticmethod
+    def _client(max_body_size: int | None = None):
+        import httpx
+        from starlette.applications import Starlette
+        from starlette.responses import PlainTextResponse
+        from starlette.routing import Route
+
+        from app.middleware.security import SecurityMiddleware
+
+        async def ok(request):
+            return PlainTextResponse("ok")
+
+        inner = Starlette(routes=[Route("/enrich", ok, methods=["GET", "POST"])])
+        transport = httpx.ASGITransport(app=SecurityMiddleware(inner, max_body_size=max_body_size))
+        return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+    async def test_oversized_body_rejected(self):
+        from app.config import settings
+
+        async with self._client() as client:
+            resp = await client.post(
+                "/enrich", content=b"x", headers={"content-length": str(settings.max_upload_size + 1)},
+            )
+        assert resp.status_code == 413
+
+    async def test_limit_follows_configured_size(self):
+        async with self._client(max_body_size=4) as client:
+            assert (await client.post("/enrich", content=b"1234")).status_code == 200
+            assert (await client.post("/enrich", content=b"12345")).status_code == 413
+
+    async def test_small_body_and_get_pass(self):
+        async with self._client() as client:
+            assert (await client.post("/enrich", content=b"hello")).status_code == 200
+            assert (await client.get("/enrich")).status_code == 200
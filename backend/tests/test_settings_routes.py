@@ -0,0 +1,93 @@
+"""Tests for the /settings endpoints."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+async def test_test_connection_batch_keeps_order(client):
+    provider = MagicMock(model="m1", test_connection=AsyncMock())
+    with (
+        patch("app.api.routes.settings.settings.groq_api_key", ""),
+        patch("app.api.routes.settings.get_provider", return_value=provider),
+    ):
+        resp = await client.post("/settings/test-connection/batch", json={"requests": [
+            {"provider": "ollama"},
+            {"provider": "groq"},
+        ]})
+    assert resp.status_code == 200
+    results = resp.json()
+    assert [r["success"] for r in results] == [True, False]
+    assert results[0]["model"] == "m1"
+
+
+async def test_models_batch_falls_back_per_provider(client):
+    provider = MagicMock(list_models=AsyncMock(return_value=[]))
+    with patch("app.api.routes.settings.get_provider", side_effect=[provider, RuntimeError("down")]):
+        resp = await client.post("/settings/models/batch", json={"requests": [
+            {"provider": "ollama"}, {"provider": "openai"},
+        ]})
+    assert resp.status_code == 200
+    assert [r["source"] for r in resp.json()["results"]] == ["dynamic", "fallback"]
+
+
+async def test_settings_reports_every_api_key_flag(client):
+    from app.api.routes.settings import _API_KEY_ATTRS
+
+    with patch("app.api.routes.settings.settings.groq_api_key", "k"):
+        data = (await client.get("/settings")).json()
+    assert {f"{attr}_set" for attr in _API_KEY_ATTRS.values()} <= data.keys()
+    assert data["groq_api_key_set"] is True
+    assert "translation_matching_enabled" in data
+
+
+async def test_providers_cached_until_settings_update(client):
+    with patch("app.api.routes.settings.settings.groq_api_key", ""):
+        first = (await client.get("/settings/providers")).json()
+        assert first["providers"]["groq"]["api_key_set"] is False
+
+        resp = await client.put("/settings", json={"groq_api_key": "k"})
+        assert resp.status_code == 200
+        after = (await client.get("/settings/providers")).json()
+    assert after["providers"]["groq"]["api_key_set"] is True
+
+
+async def test_known_models_matches_registry(client):
+    from app.services.llm.registry import KNOWN_MODELS
+
+    data = (await client.get("/settings/known-models")).json()
+    assert data["models"] == {
+        pt.value: [m.model_dump() for m in models] for pt, models in KNOWN_MODELS.items()
+    }
+
+
+def test_api_key_resolution_order():
+    from app.api.routes.settings import _get_api_key_for_provider
+    from app.models.llm_models import LLMProviderType
+
+    with patch("app.api.routes.settings.settings.groq_api_key", "stored"):
+        assert _get_api_key_for_provider(LLMProviderType.groq) == "stored"
+        assert _get_api_key_for_provider(LLMProviderType.groq, "explicit") == "explicit"
+    with patch("app.api.routes.settings.settings.groq_api_key", ""):
+        assert _get_api_key_for_provider(LLMProviderType.groq) is None
+    assert _get_api_key_for_provider(LLMProviderType.ollama) is None
+
+
+async def test_settings_etag_changes_with_settings(client):
+    first = await client.get("/settings")
+    assert first.headers["cache-control"] == "private, no-cache"
+    etag = first.headers["etag"]
+    assert (await client.get("/settings", headers={"If-None-Match": etag})).status_code == 304
+
+    with patch("app.api.routes.settings.settings.llm_model", "some-other-model"):
+        changed = await client.get("/settings", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+async def test_providers_etag_returns_304(client):
+    first = await client.get("/settings/providers")
+    assert "providers" in first.json()
+    assert first.headers["cache-control"] == "private, no-cache"
+    second = await client.get("/settings/providers", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 304
@@ -0,0 +1,40 @@
+"""Tests for app startup: background embedding indexing and readiness."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+
+async def test_startup_indexing_runs_on_dedicated_executor():
+    from app.main import _index_folio_embeddings
+
+    threads = []
+    service = type("Svc", (), {
+        "index_folio_labels": lambda self, folio: threads.append(threading.current_thread().name),
+        "index_size": 0,
+    })()
+    ready = asyncio.Event()
+    with (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="embed-test") as executor,
+        patch("app.services.folio.owl_cache.ensure_owl_fresh"),
+        patch("app.services.folio.folio_service.FolioService.get_instance"),
+        patch("app.services.embedding.service.EmbeddingService.get_instance", return_value=service),
+        patch("app.services.embedding.service.build_embedding_index", side_effect=RuntimeError("no faiss")),
+    ):
+        await _index_folio_embeddings(ready, executor)
+    assert threads and threads[0].startswith("embed-test")
+    assert ready.is_set()
+
+
+async def test_wait_for_embeddings_times_out():
+    from types import SimpleNamespace
+
+    from app.api.readiness import wait_for_embeddings
+
+    app = SimpleNamespace(state=SimpleNamespace(embedding_ready=asyncio.Event()))
+    assert await wait_for_embeddings(app, timeout=0.01) is False
+    app.state.embedding_ready.set()
+    assert await wait_for_embeddings(app) is True
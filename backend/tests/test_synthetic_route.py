@@ -0,0 +1,57 @@
+"""Tests for POST /synthetic concurrency limiting and generator reuse."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+async def test_generation_refused_when_slots_exhausted(client):
+    with (
+        patch("app.api.routes.synthetic.get_shared_provider", return_value=MagicMock()),
+        patch("app.api.routes.synthetic._generation_slots", asyncio.Semaphore(0)),
+    ):
+        resp = await client.post("/synthetic", json={})
+    assert resp.status_code == 429
+
+
+async def test_generation_runs_when_slot_free(client):
+    with (
+        patch("app.api.routes.synthetic.get_shared_provider", return_value=MagicMock()),
+        patch("app.api.routes.synthetic._generation_slots", asyncio.Semaphore(1)),
+        patch(
+            "app.api.routes.synthetic.SyntheticGenerator.generate",
+            AsyncMock(return_value="generated text"),
+        ),
+    ):
+        resp = await client.post("/synthetic", json={})
+    assert resp.status_code == 200
+    assert resp.json()["document"] == "generated text"
+
+
+async def test_generator_reused_for_same_provider(client):
+    from app.api.routes import synthetic
+
+    synthetic._get_generator.cache_clear()
+    llm = MagicMock()
+    with (
+        patch("app.api.routes.synthetic.get_shared_provider", return_value=llm),
+        patch("app.api.routes.synthetic.SyntheticGenerator") as generator_cls,
+    ):
+        generator_cls.return_value.generate = AsyncMock(return_value="text")
+        await client.post("/synthetic", json={})
+        await client.post("/synthetic", json={})
+    generator_cls.assert_called_once_with(llm)
+    synthetic._get_generator.cache_clear()
+
+
+async def test_doc_types_served_from_prebuilt_body(client):
+    from app.api.routes import synthetic
+    from app.api.routes.health import _HEALTH_BODIES
+    from app.api.routes.settings import _KNOWN_MODELS_BODY
+
+    resp = await client.get("/synthetic/types")
+    assert resp.json() == {"types": synthetic.DOC_TYPES}
+    # Shared bodies must stay immutable
+    for body in (synthetic._DOC_TYPES_BODY, _KNOWN_MODELS_BODY, *_HEALTH_BODIES.values()):
+        assert type(body) is bytes
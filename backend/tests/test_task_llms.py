@@ -170,6 +170,39 @@ class TestBuildWithTaskLLMs:
         assert concept_stage.identifier.llm is global_llm
 
 
+class TestGetPipeline:
+    def test_same_llms_reuse_stages(self):
+        from app.pipeline.orchestrator import TaskLLMs, get_pipeline
+
+        llm = FakeLLM("global")
+        first = get_pipeline(llm, TaskLLMs(concept=llm))
+        second = get_pipeline(llm, TaskLLMs(concept=llm))
+        assert second is first
+
+        other = get_pipeline(FakeLLM("other"), TaskLLMs())
+        assert other is not first
+
+    def test_folio_reload_rebuilds(self):
+        from app.pipeline.orchestrator import get_pipeline
+        from app.services.folio.folio_service import FolioService
+
+        llm = FakeLLM("global")
+        svc = FolioService.get_instance()
+        first = get_pipeline(llm)
+        with patch.object(svc, "_folio", object()):
+            assert get_pipeline(llm) is not first
+
+    def test_translation_toggle_rebuilds(self):
+        from app.config import settings
+        from app.pipeline.orchestrator import get_pipeline
+
+        llm = FakeLLM("global")
+        first = get_pipeline(llm)
+        toggled = not settings.translation_matching_enabled
+        with patch.object(settings, "translation_matching_enabled", toggled):
+            assert get_pipeline(llm) is not first
+
+
 # ---------------------------------------------------------------------------
 # MetadataStage with separate LLMs
 # ---------------------------------------------------------------------------
@@ -63,3 +63,29 @@ class TestCanonicalTextElements:
         ct = CanonicalText(full_text="Heading\nBody", elements=elems)
         assert len(ct.elements) == 1
         assert ct.elements[0].element_type == "heading"
+
+
+class TestChunksContaining:
+    @staticmethod
+    def _canonical(*bounds):
+        return CanonicalText(full_text="", chunks=[
+            TextChunk(text="", start_offset=s, end_offset=e, chunk_index=i)
+            for i, (s, e) in enumerate(bounds)
+        ])
+
+    def test_overlapping_chunks(self):
+        canonical = self._canonical((0, 100), (80, 180), (160, 260))
+        assert canonical.chunks_containing(10, 20) == [0]
+        assert canonical.chunks_containing(85, 95) == [0, 1]
+        assert canonical.chunks_containing(95, 120) == [1]
+        assert canonical.chunks_containing(250, 300) == []
+
+    def test_rebuilds_after_append(self):
+        canonical = self._canonical((0, 100))
+        assert canonical.chunks_containing(150, 160) == []
+        canonical.chunks.append(TextChunk(text="", start_offset=100, end_offset=200, chunk_index=1))
+        assert canonical.chunks_containing(150, 160) == [1]
+
+    def test_unsorted_chunks_fall_back_to_scan(self):
+        canonical = self._canonical((100, 200), (0, 100))
+        assert canonical.chunks_containing(10, 20) == [1]